@@ -33,3 +33,9 @@ class HypothesisTestScreen(MDScreen):
 class DataViewScreen(MDScreen):
     """Screen for viewing and managing imported data"""
     pass
+
+
+# Diagnostics Screen
+class DiagnosticsScreen(MDScreen):
+    """Screen for timing breakdowns of handlers and engine calls"""
+    pass
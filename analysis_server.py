@@ -0,0 +1,262 @@
+"""
+Analysis Server
+Local HTTP/JSON service exposing the statistics engine: datasets are uploaded
+once, referenced by ID and analyzed in a bounded pool of worker processes
+"""
+
+import argparse
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from analyze import ANALYSES, run_analysis, to_builtin
+from result_cache import ResultCache, fingerprint
+from utils import read_data_file
+
+
+ANALYSIS_OPTIONS = ('columns', 'x', 'y', 'popmean', 'outlier_method')
+
+# Datasets each worker process keeps loaded between requests
+WORKER_DATASETS = 4
+
+_worker_datasets: 'OrderedDict[str, pd.DataFrame]' = OrderedDict()
+
+
+class UnknownDataset(KeyError):
+    """Raised for a dataset ID that was never uploaded or has been removed"""
+
+
+class ServiceBusy(Exception):
+    """Raised when the worker pool already has the maximum number of pending requests"""
+
+
+def _load_in_worker(store_dir: str, dataset_id: str) -> pd.DataFrame:
+    if dataset_id in _worker_datasets:
+        _worker_datasets.move_to_end(dataset_id)
+        return _worker_datasets[dataset_id]
+
+    df = pd.read_pickle(os.path.join(store_dir, f"{dataset_id}.pkl"))
+    _worker_datasets[dataset_id] = df
+    if len(_worker_datasets) > WORKER_DATASETS:
+        _worker_datasets.popitem(last=False)
+    return df
+
+
+def _analyze_in_worker(store_dir: str, dataset_id: str, analysis: str, options: Dict[str, any]) -> Dict[str, any]:
+    return to_builtin(run_analysis(_load_in_worker(store_dir, dataset_id), analysis, **options))
+
+
+class AnalysisService:
+    """
+    Dataset store, worker pool and response cache behind the HTTP handler.
+    Dataset IDs are content fingerprints, so uploading the same data twice gives the same ID.
+    """
+
+    def __init__(self, store_dir: Optional[str] = None, workers: Optional[int] = None,
+                 max_pending: int = 32, cache_bytes: int = 64 * 1024 * 1024, data_dir: Optional[str] = None):
+        # Only files under data_dir can be uploaded by path; None disables path uploads
+        self.data_dir = os.path.realpath(data_dir) if data_dir else None
+        self._owns_store = store_dir is None
+        self.store_dir = store_dir or tempfile.mkdtemp(prefix='analysis-datasets-')
+        os.makedirs(self.store_dir, exist_ok=True)
+        self.datasets: Dict[str, Dict[str, any]] = {}
+        self.cache = ResultCache(max_bytes=cache_bytes)
+        self._pool = ProcessPoolExecutor(max_workers=workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+
+    def add_dataset(self, df: pd.DataFrame) -> Dict[str, any]:
+        """Store a dataset for the workers and return its description"""
+        if df.empty:
+            raise ValueError("Dataset is empty.")
+        dataset_id = fingerprint(df)
+        with self._lock:
+            if dataset_id not in self.datasets:
+                df.to_pickle(os.path.join(self.store_dir, f"{dataset_id}.pkl"))
+                self.datasets[dataset_id] = {'id': dataset_id, 'rows': len(df),
+                                             'columns': [str(col) for col in df.columns]}
+            return self.datasets[dataset_id]
+
+    def get_dataset(self, dataset_id: str) -> Dict[str, any]:
+        with self._lock:
+            if dataset_id not in self.datasets:
+                raise UnknownDataset(dataset_id)
+            return self.datasets[dataset_id]
+
+    def remove_dataset(self, dataset_id: str) -> None:
+        with self._lock:
+            if self.datasets.pop(dataset_id, None) is None:
+                raise UnknownDataset(dataset_id)
+            os.remove(os.path.join(self.store_dir, f"{dataset_id}.pkl"))
+
+    def analyze(self, dataset_id: str, analysis: str, options: Dict[str, any]) -> Dict[str, any]:
+        """Run an analysis in the pool, or answer from the cache when it ran before"""
+        self.get_dataset(dataset_id)
+        if analysis not in ANALYSES:
+            raise ValueError(f"Unsupported analysis: {analysis}")
+        unknown = sorted(set(options) - set(ANALYSIS_OPTIONS))
+        if unknown:
+            raise ValueError(f"Unknown option(s): {', '.join(unknown)}")
+        columns = options.get('columns')
+        if isinstance(columns, str):
+            options = dict(options, columns=[columns])
+        elif columns is not None and not (isinstance(columns, list) and all(isinstance(c, str) for c in columns)):
+            raise ValueError("'columns' must be a column name or a list of column names.")
+
+        key = fingerprint(dataset_id, analysis, json.dumps(options, sort_keys=True))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        if not self._slots.acquire(blocking=False):
+            raise ServiceBusy("Too many pending requests, try again later.")
+        try:
+            result = self._pool.submit(_analyze_in_worker, self.store_dir, dataset_id, analysis, options).result()
+        finally:
+            self._slots.release()
+        self.cache.put(key, result)
+        return result
+
+    def close(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+        if self._owns_store:
+            shutil.rmtree(self.store_dir, ignore_errors=True)
+
+
+def _read_upload(body: bytes, content_type: str, data_dir: Optional[str] = None) -> pd.DataFrame:
+    """
+    Build a DataFrame from an upload: CSV text, or JSON with either
+    {"columns": {"name": [values], ...}} or {"path": "file under data_dir"}
+    """
+    if content_type.startswith('text/csv'):
+        return pd.read_csv(io.StringIO(body.decode('utf-8')))
+
+    payload = json.loads(body or b'{}')
+    if 'columns' in payload:
+        return pd.DataFrame(payload['columns'])
+    if 'path' in payload:
+        if data_dir is None:
+            raise ValueError("Uploads by path are disabled; start the server with --data-dir.")
+        path = os.path.realpath(os.path.join(data_dir, str(payload['path'])))
+        if os.path.commonpath([path, data_dir]) != data_dir:
+            raise ValueError("Path is outside the server's data directory.")
+        return read_data_file(path)
+    raise ValueError("Upload CSV text, or JSON with 'columns' or 'path'.")
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+      POST   /datasets            upload a dataset, returns its id
+      GET    /datasets            list datasets
+      GET    /datasets/<id>       describe a dataset
+      DELETE /datasets/<id>       remove a dataset
+      POST   /analyses            {"dataset": id, "analysis": name, ...options}
+    """
+
+    service: AnalysisService = None
+
+    def _send(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def _handle(self, route) -> None:
+        try:
+            status, payload = route()
+        except UnknownDataset as e:
+            status, payload = 404, {'error': f"Unknown dataset: {e.args[0]}"}
+        except ServiceBusy as e:
+            status, payload = 503, {'error': str(e)}
+        except (ValueError, TypeError) as e:
+            status, payload = 400, {'error': str(e)}
+        except Exception as e:
+            status, payload = 500, {'error': str(e)}
+        self._send(status, payload)
+
+    def _parts(self) -> List[str]:
+        return [part for part in self.path.split('?')[0].split('/') if part]
+
+    def do_GET(self):
+        parts = self._parts()
+        if parts == ['datasets']:
+            self._handle(lambda: (200, list(self.service.datasets.values())))
+        elif len(parts) == 2 and parts[0] == 'datasets':
+            self._handle(lambda: (200, self.service.get_dataset(parts[1])))
+        else:
+            self._send(404, {'error': "Not found"})
+
+    def do_POST(self):
+        parts = self._parts()
+        if parts == ['datasets']:
+            self._handle(lambda: (201, self.service.add_dataset(
+                _read_upload(self._body(), self.headers.get('Content-Type', ''), self.service.data_dir))))
+        elif parts == ['analyses']:
+            def run():
+                request = json.loads(self._body() or b'{}')
+                dataset_id = request.pop('dataset', None)
+                analysis = request.pop('analysis', None)
+                if not dataset_id or not analysis:
+                    raise ValueError("'dataset' and 'analysis' are required.")
+                return 200, self.service.analyze(dataset_id, analysis, request)
+            self._handle(run)
+        else:
+            self._send(404, {'error': "Not found"})
+
+    def do_DELETE(self):
+        parts = self._parts()
+        if len(parts) == 2 and parts[0] == 'datasets':
+            def remove():
+                self.service.remove_dataset(parts[1])
+                return 200, {'deleted': parts[1]}
+            self._handle(remove)
+        else:
+            self._send(404, {'error': "Not found"})
+
+
+def make_server(service: AnalysisService, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+    """HTTP server bound to the service; port 0 picks a free port"""
+    handler = type('BoundAnalysisRequestHandler', (AnalysisRequestHandler,), {'service': service})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve statistics engine analyses over local HTTP/JSON")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--max-pending', type=int, default=32, help="Requests queued before answering 503")
+    parser.add_argument('--store', help="Directory for uploaded datasets (default: temporary)")
+    parser.add_argument('--data-dir', help="Directory whose files can be uploaded by path (default: none)")
+    args = parser.parse_args(argv)
+
+    service = AnalysisService(args.store, args.workers, args.max_pending, data_dir=args.data_dir)
+    server = make_server(service, args.host, args.port)
+    print(f"Serving analyses on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
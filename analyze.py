@@ -0,0 +1,181 @@
+"""
+Command-Line Analysis
+Runs statistics engine analyses on data files without the GUI
+and writes the results as JSON or CSV
+"""
+
+import argparse
+import csv
+import json
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from statistics_engine import (
+    DescriptiveStats, CorrelationAnalysis, RegressionAnalysis, HypothesisTesting, OutlierDetection
+)
+from utils import read_data_file, get_numeric_columns
+
+
+ANALYSES = ('describe', 'correlation', 'regression', 'ttest', 'ttest2', 'outliers')
+OUTLIER_METHODS = ('iqr', 'zscore')
+OUTPUT_FORMATS = ('json', 'csv')
+CSV_FIELDS = ('file', 'analysis', 'subject', 'statistic', 'value')
+
+
+def to_builtin(value):
+    """Convert numpy and pandas values to JSON-safe Python values (NaN becomes None)"""
+    if isinstance(value, dict):
+        return {str(k): to_builtin(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_builtin(v) for v in value]
+    if isinstance(value, pd.DataFrame):
+        return {str(col): to_builtin(value[col].to_dict()) for col in value.columns}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _column(df: pd.DataFrame, name: Optional[str], option: str) -> np.ndarray:
+    if not name:
+        raise ValueError(f"{option} is required for this analysis.")
+    if name not in df.columns:
+        raise ValueError(f"Column '{name}' not found.")
+    return df[name].dropna().to_numpy(dtype=float)
+
+
+def run_analysis(df: pd.DataFrame, analysis: str, columns: Optional[List[str]] = None,
+                 x: Optional[str] = None, y: Optional[str] = None, popmean: float = 0.0,
+                 outlier_method: str = 'iqr') -> Dict[str, any]:
+    """
+    Run one named analysis on a DataFrame.
+    describe, correlation and outliers use the given columns (default: all numeric columns);
+    regression and ttest2 use the x and y columns, ttest the first column.
+    """
+    columns = columns or get_numeric_columns(df)
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Column(s) not found: {', '.join(missing)}")
+
+    if analysis == 'describe':
+        return {col: DescriptiveStats.calculate_all(df[col].dropna().to_numpy(dtype=float)) for col in columns}
+    elif analysis == 'correlation':
+        if len(columns) < 2:
+            raise ValueError("Correlation needs at least 2 numeric columns.")
+        return CorrelationAnalysis.correlation_matrix(df[columns])
+    elif analysis == 'regression':
+        for name, option in ((x, '--x'), (y, '--y')):
+            _column(df, name, option)
+        pair = df[[x, y]].dropna()
+        return RegressionAnalysis.linear_regression(pair[x].to_numpy(dtype=float), pair[y].to_numpy(dtype=float),
+                                                    full_output=False)
+    elif analysis == 'ttest':
+        return HypothesisTesting.one_sample_ttest(_column(df, columns[0], '--columns'), popmean)
+    elif analysis == 'ttest2':
+        return HypothesisTesting.two_sample_ttest(_column(df, x, '--x'), _column(df, y, '--y'))
+    elif analysis == 'outliers':
+        if outlier_method not in OUTLIER_METHODS:
+            raise ValueError(f"Invalid outlier method: {outlier_method}")
+        detect = OutlierDetection.iqr_method if outlier_method == 'iqr' else OutlierDetection.z_score_method
+        return {col: detect(df[col].dropna().to_numpy(dtype=float)) for col in columns}
+    raise ValueError(f"Unsupported analysis: {analysis}")
+
+
+def analyze_file(file_path: str, analyses: List[str], **options) -> Dict[str, any]:
+    """Load a file once and run each analysis on it; failures are reported per analysis"""
+    try:
+        df = read_data_file(file_path)
+    except Exception as e:
+        return {analysis: {'error': str(e)} for analysis in analyses}
+
+    results = {}
+    for analysis in analyses:
+        try:
+            results[analysis] = to_builtin(run_analysis(df, analysis, **options))
+        except Exception as e:
+            results[analysis] = {'error': str(e)}
+    return results
+
+
+def analyze_files(file_paths: List[str], analyses: List[str], workers: Optional[int] = None,
+                  **options) -> Dict[str, Dict[str, any]]:
+    """
+    Analyze many files, one per worker process, keeping the input order.
+    Results are keyed by path, so a path given more than once is analyzed once.
+    """
+    file_paths = list(dict.fromkeys(file_paths))
+    if len(file_paths) == 1 or workers == 1:
+        return {path: analyze_file(path, analyses, **options) for path in file_paths}
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(analyze_file, path, analyses, **options) for path in file_paths]
+        return {path: future.result() for path, future in zip(file_paths, futures)}
+
+
+def to_rows(results: Dict[str, Dict[str, any]]) -> List[Dict[str, any]]:
+    """
+    Flatten results into (file, analysis, subject, statistic, value) rows.
+    subject is the column (describe, outliers), the row of the matrix (correlation) or empty.
+    """
+    rows = []
+    for file_path, analyses in results.items():
+        for analysis, result in analyses.items():
+            nested = analysis in ('describe', 'correlation', 'outliers') and 'error' not in result
+            for subject, values in (result.items() if nested else [('', result)]):
+                for statistic, value in values.items():
+                    rows.append({'file': file_path, 'analysis': analysis, 'subject': subject,
+                                 'statistic': statistic, 'value': value})
+    return rows
+
+
+def write_results(results: Dict[str, Dict[str, any]], output_format: str, stream) -> None:
+    if output_format == 'json':
+        json.dump(results, stream, indent=2)
+        stream.write("\n")
+    else:
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(to_rows(results))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run statistical analyses on data files without the GUI")
+    parser.add_argument('files', nargs='+', help="CSV or Excel files")
+    parser.add_argument('--analysis', nargs='+', default=['describe'], choices=ANALYSES, dest='analyses')
+    parser.add_argument('--columns', nargs='+', help="Columns for describe, correlation and ttest "
+                                                     "(default: all numeric columns)")
+    parser.add_argument('--x', help="X column for regression, first sample for ttest2")
+    parser.add_argument('--y', help="Y column for regression, second sample for ttest2")
+    parser.add_argument('--popmean', type=float, default=0.0, help="Population mean for ttest (default: 0)")
+    parser.add_argument('--outlier-method', default='iqr', choices=OUTLIER_METHODS)
+    parser.add_argument('--format', default='json', choices=OUTPUT_FORMATS, dest='output_format')
+    parser.add_argument('--out', help="Output file (default: standard output)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    repeated = sorted({path for path in args.files if args.files.count(path) > 1})
+    if repeated:
+        print(f"Skipping repeated file(s): {', '.join(repeated)}", file=sys.stderr)
+
+    results = analyze_files(args.files, args.analyses, args.workers, columns=args.columns,
+                            x=args.x, y=args.y, popmean=args.popmean,
+                            outlier_method=args.outlier_method)
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8', newline='') as f:
+            write_results(results, args.output_format, f)
+    else:
+        write_results(results, args.output_format, sys.stdout)
+
+    failed = any('error' in result for analyses in results.values() for result in analyses.values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
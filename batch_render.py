@@ -0,0 +1,227 @@
+"""
+Batch Chart Rendering
+Renders charts for a dataset to PNG/SVG/PDF files without the GUI,
+using the Agg backend in a pool of worker processes
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import pandas as pd
+
+import charts
+from downsampling import downsample
+from statistics_engine import (
+    CorrelationAnalysis, RegressionAnalysis, KernelDensity,
+    HistogramEngine, BoxPlotSummary, QQPlot
+)
+from utils import read_data_file, get_numeric_columns
+
+
+FORMATS = ('png', 'svg', 'pdf')
+SINGLE_COLUMN_CHARTS = ('histogram', 'boxplot', 'violin', 'qqplot')
+XY_CHARTS = ('scatter', 'line', 'bar')
+
+# Dataset loaded once per worker process by _init_worker
+_worker_data: Optional[pd.DataFrame] = None
+
+
+def all_chart_specs(df: pd.DataFrame, formats: List[str] = ('png',)) -> List[Dict[str, str]]:
+    """Every single-column chart for every numeric column, plus the correlation heatmap"""
+    specs = []
+    numeric_cols = get_numeric_columns(df)
+    for fmt in formats:
+        for col in numeric_cols:
+            for chart in SINGLE_COLUMN_CHARTS:
+                specs.append({'chart': chart, 'column': col, 'format': fmt})
+        if len(numeric_cols) >= 2:
+            specs.append({'chart': 'heatmap', 'format': fmt})
+    return specs
+
+
+NAME_KEYS = ('chart', 'column', 'x', 'y', 'format')
+
+
+def spec_filename(spec: Dict[str, str]) -> str:
+    """
+    Output file name derived from the chart type and the columns it uses.
+    Specs with further options (bins, density, dist, cluster, title, ...)
+    get a short hash of those options, so every distinct spec has its own file.
+    """
+    parts = [spec['chart']] + [str(spec[key]) for key in ('column', 'x', 'y') if spec.get(key)]
+    options = {key: value for key, value in spec.items() if key not in NAME_KEYS}
+    if options:
+        parts.append(hashlib.blake2b(json.dumps(options, sort_keys=True, default=str).encode('utf-8'),
+                                     digest_size=4).hexdigest())
+    stem = re.sub(r'[^A-Za-z0-9_.-]+', '_', '_'.join(parts))
+    return f"{stem}.{spec.get('format', 'png')}"
+
+
+def _spec_key(spec: Dict[str, str]) -> str:
+    return json.dumps(spec, sort_keys=True, default=str)
+
+
+def expand_specs(specs: List[Dict[str, str]], formats: List[str] = ('png',)) -> List[Dict[str, str]]:
+    """Render specs without a format once per requested format, dropping repeated specs"""
+    expanded, seen = [], set()
+    for spec in specs:
+        for fmt in ([spec['format']] if spec.get('format') else formats):
+            spec_fmt = dict(spec, format=fmt)
+            key = _spec_key(spec_fmt)
+            if key not in seen:
+                seen.add(key)
+                expanded.append(spec_fmt)
+    return expanded
+
+
+def output_names(specs: List[Dict[str, str]]) -> List[str]:
+    """
+    File name for each spec, unique within the batch. When two distinct specs
+    map to the same name (e.g. columns 'a b' and 'a_b'), the later one gets a
+    short hash of the whole spec so it does not overwrite the earlier file.
+    """
+    names, used = [], set()
+    for spec in specs:
+        name = spec_filename(spec)
+        if name in used:
+            stem, ext = os.path.splitext(name)
+            name = f"{stem}_{hashlib.blake2b(_spec_key(spec).encode('utf-8'), digest_size=4).hexdigest()}{ext}"
+        used.add(name)
+        names.append(name)
+    return names
+
+
+def _column(df: pd.DataFrame, name: str):
+    if name not in df.columns:
+        raise ValueError(f"Column '{name}' not found.")
+    return df[name].dropna().to_numpy()
+
+
+def draw_spec(ax, df: pd.DataFrame, spec: Dict[str, str], width_px: int) -> None:
+    """Draw one chart spec onto an Axes"""
+    chart = spec['chart']
+    title = spec.get('title')
+
+    if chart in SINGLE_COLUMN_CHARTS:
+        data = _column(df, spec['column'])
+        title = title or f"{chart.title()}: {spec['column']}"
+        if chart == 'histogram':
+            hist = HistogramEngine.compute(data, spec.get('bins', 'auto'))
+            charts.draw_histogram(ax, hist, KernelDensity.estimate(data) if spec.get('density') else None,
+                                  title=title)
+        elif chart == 'boxplot':
+            charts.draw_boxplot(ax, [BoxPlotSummary.summarize(data, label=spec['column'])], title=title)
+        elif chart == 'violin':
+            charts.draw_violin(ax, [data], [KernelDensity.estimate(data, grid_size=256)], [spec['column']],
+                               title=title)
+        else:
+            charts.draw_qqplot(ax, QQPlot.compute(data, spec.get('dist', 'norm')))
+
+    elif chart in XY_CHARTS:
+        pair = df[[spec['x'], spec['y']]].dropna()
+        x, y = pair[spec['x']].to_numpy(), pair[spec['y']].to_numpy()
+        if chart == 'scatter':
+            regression = RegressionAnalysis.linear_regression(x, y, full_output=False)
+            charts.draw_scatter(ax, x, y, regression=regression, title=title or "Scatter Plot")
+        elif chart == 'line':
+            x_plot, y_plot = downsample(x, y, width_px)
+            charts.draw_line_points(ax, x_plot, y_plot, markers=len(x_plot) == len(x))
+        else:
+            charts.draw_bar(ax, [str(v) for v in x], y, title=title or "Bar Graph",
+                            xlabel=spec['x'], ylabel=spec['y'])
+
+    elif chart == 'heatmap':
+        corr_matrix = CorrelationAnalysis.correlation_matrix(df[get_numeric_columns(df)])
+        if spec.get('cluster'):
+            order = CorrelationAnalysis.cluster_order(corr_matrix)
+            corr_matrix = corr_matrix.iloc[order, order]
+        charts.draw_heatmap(ax, corr_matrix)
+
+    else:
+        raise ValueError(f"Unsupported chart type: {chart}")
+
+
+def render_spec(df: pd.DataFrame, spec: Dict[str, str], out_dir: str,
+                size_px: tuple = (800, 600), dpi: int = 100, filename: Optional[str] = None) -> str:
+    """Render a chart spec to a file (spec_filename unless given) and return its path"""
+    fmt = spec.get('format', 'png')
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+    figure = Figure(figsize=(size_px[0] / dpi, size_px[1] / dpi), dpi=dpi)
+    FigureCanvasAgg(figure)
+    draw_spec(figure.add_subplot(), df, spec, size_px[0])
+
+    path = os.path.join(out_dir, filename or spec_filename(spec))
+    figure.savefig(path, format=fmt)
+    return path
+
+
+def _init_worker(file_path: str) -> None:
+    global _worker_data
+    _worker_data = read_data_file(file_path)
+
+
+def _render_in_worker(spec: Dict[str, str], out_dir: str, filename: str) -> str:
+    return render_spec(_worker_data, spec, out_dir, filename=filename)
+
+
+def render_batch(file_path: str, out_dir: str, specs: Optional[List[Dict[str, str]]] = None,
+                 formats: List[str] = ('png',), workers: Optional[int] = None) -> Dict[str, List]:
+    """
+    Render many charts for one dataset across a process pool.
+    With no specs, all charts for all numeric columns are rendered;
+    given specs without a format are rendered in each of formats.
+    Returns the written paths and any (spec, error) failures.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if specs is None:
+        specs = all_chart_specs(read_data_file(file_path), formats)
+    specs = expand_specs(specs, formats)
+
+    written, failed = [], []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(file_path,)) as pool:
+        futures = {pool.submit(_render_in_worker, spec, out_dir, name): spec
+                   for spec, name in zip(specs, output_names(specs))}
+        for future in as_completed(futures):
+            try:
+                written.append(future.result())
+            except Exception as e:
+                failed.append((futures[future], str(e)))
+    return {'written': sorted(written), 'failed': failed}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Render charts for a dataset without the GUI")
+    parser.add_argument('file', help="CSV or Excel file")
+    parser.add_argument('--out', default='charts', help="Output directory (default: charts)")
+    parser.add_argument('--specs', help="JSON file with a list of chart specs (default: all charts)")
+    parser.add_argument('--format', nargs='+', default=['png'], choices=FORMATS, dest='formats')
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    specs = None
+    if args.specs:
+        with open(args.specs, encoding='utf-8') as f:
+            specs = json.load(f)
+
+    result = render_batch(args.file, args.out, specs, args.formats, args.workers)
+    for path in result['written']:
+        print(path)
+    for spec, error in result['failed']:
+        print(f"FAILED {spec}: {error}")
+    return 1 if result['failed'] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
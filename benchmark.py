@@ -0,0 +1,326 @@
+"""
+Benchmark Suite
+Times the public functions of statistics_engine and utils over input sizes
+from 10^3 to 10^8, records wall time and peak memory to a JSON history
+and flags regressions against a stored baseline
+"""
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+import statistics_engine
+import utils
+from statistics_engine import (
+    DescriptiveStats, CorrelationAnalysis, RegressionAnalysis, HypothesisTesting,
+    ProbabilityDistributions, OutlierDetection, KernelDensity, HistogramEngine,
+    QuantileSketch, BoxPlotSummary, QQPlot, exact_quantiles
+)
+
+
+SIZES = tuple(10 ** k for k in range(3, 9))
+DEFAULT_MAX_SIZE = 10 ** 6
+HISTORY_FILE = 'benchmark_history.json'
+BASELINE_FILE = 'benchmark_baseline.json'
+
+# Slowdowns smaller than this many seconds are treated as noise
+MIN_REGRESSION_SECONDS = 0.005
+
+# Columns in the DataFrames used by the frame-level cases
+FRAME_COLUMNS = 8
+
+# Directory for generated input files; set only while run_benchmarks runs and removed afterwards
+_scratch_dir: Optional[str] = None
+
+
+def _sample(n: int, rng) -> np.ndarray:
+    return rng.normal(50, 10, n)
+
+
+def _frame(n: int, rng, missing: float = 0.0) -> pd.DataFrame:
+    df = pd.DataFrame(rng.normal(size=(n, FRAME_COLUMNS)), columns=[f"c{i}" for i in range(FRAME_COLUMNS)])
+    if missing:
+        df = df.mask(rng.random(df.shape) < missing)
+    return df
+
+
+def _text(values: np.ndarray) -> str:
+    return ','.join(np.char.mod('%.4f', values))
+
+
+def _csv_file(n: int, rng) -> str:
+    path = os.path.join(_scratch_dir, f"frame_{n}.csv")
+    if not os.path.exists(path):
+        _frame(n, rng).to_csv(path, index=False)
+    return path
+
+
+def _excel_file(n: int, rng) -> str:
+    path = os.path.join(_scratch_dir, f"frame_{n}.xlsx")
+    if not os.path.exists(path):
+        _frame(n, rng).to_excel(path, index=False)
+    return path
+
+
+def _grouped(n: int, rng) -> tuple:
+    edges = np.linspace(0, 100, n + 1)
+    return list(zip(edges[:-1], edges[1:])), rng.integers(1, 50, n).tolist()
+
+
+def _categories(n: int, rng) -> pd.DataFrame:
+    return pd.DataFrame({'category': rng.integers(0, 1000, n).astype(str), 'value': rng.random(n)})
+
+
+# (name, largest size worth running, function, make_args(n, rng) -> positional arguments)
+CASES = [
+    # Parsing and loading
+    ('utils.parse_numeric_data', 10 ** 7, utils.parse_numeric_data, lambda n, rng: (_text(_sample(n, rng)),)),
+    ('utils.validate_numeric_input', 10 ** 7, utils.validate_numeric_input,
+     lambda n, rng: (_text(_sample(n, rng)),)),
+    ('utils.parse_grouped_data', 10 ** 6, utils.parse_grouped_data,
+     lambda n, rng: (', '.join(f"{lo:g}-{hi:g}:{f}" for (lo, hi), f in zip(*_grouped(n, rng))),)),
+    ('utils.read_csv_data', 10 ** 6, utils.read_csv_data, lambda n, rng: (_csv_file(n, rng),)),
+    ('utils.read_data_file', 10 ** 7, utils.read_data_file, lambda n, rng: (_csv_file(n, rng),)),
+    ('utils.read_excel_data', 10 ** 4, utils.read_excel_data, lambda n, rng: (_excel_file(n, rng),)),
+    ('utils.export_to_csv', 10 ** 6, utils.export_to_csv,
+     lambda n, rng: (_frame(n, rng), os.path.join(_scratch_dir, 'export.csv'))),
+
+    # Frame utilities
+    ('utils.preview_data', 10 ** 7, utils.preview_data, lambda n, rng: (_frame(n, rng),)),
+    ('utils.get_numeric_columns', 10 ** 7, utils.get_numeric_columns, lambda n, rng: (_frame(n, rng),)),
+    ('utils.detect_missing_values', 10 ** 7, utils.detect_missing_values,
+     lambda n, rng: (_frame(n, rng, missing=0.05),)),
+    ('utils.handle_missing_values', 10 ** 7, utils.handle_missing_values,
+     lambda n, rng: (_frame(n, rng, missing=0.05), 'mean')),
+    ('utils.aggregate_by_category', 10 ** 7, utils.aggregate_by_category,
+     lambda n, rng: (_categories(n, rng), 'category', 'value', 'sum')),
+    ('utils.normalize_data', 10 ** 7, utils.normalize_data, lambda n, rng: (_sample(n, rng),)),
+    ('utils.standardize_data', 10 ** 7, utils.standardize_data, lambda n, rng: (_sample(n, rng),)),
+
+    # Descriptive statistics
+    ('DescriptiveStats.calculate_all', 10 ** 8, DescriptiveStats.calculate_all, lambda n, rng: (_sample(n, rng),)),
+    ('DescriptiveStats.format_results', 10 ** 3, DescriptiveStats.format_results,
+     lambda n, rng: (DescriptiveStats.calculate_all(_sample(n, rng)),)),
+
+    # Correlation and regression
+    ('CorrelationAnalysis.pearson', 10 ** 8, CorrelationAnalysis.pearson,
+     lambda n, rng: (_sample(n, rng), _sample(n, rng))),
+    ('CorrelationAnalysis.spearman', 10 ** 7, CorrelationAnalysis.spearman,
+     lambda n, rng: (_sample(n, rng), _sample(n, rng))),
+    ('CorrelationAnalysis.correlation_matrix', 10 ** 7, CorrelationAnalysis.correlation_matrix,
+     lambda n, rng: (_frame(n, rng),)),
+    # n is the number of variables here
+    ('CorrelationAnalysis.cluster_order', 10 ** 3, CorrelationAnalysis.cluster_order,
+     lambda n, rng: (pd.DataFrame(rng.normal(size=(50, n))).corr(),)),
+    ('RegressionAnalysis.linear_regression', 10 ** 8, RegressionAnalysis.linear_regression,
+     lambda n, rng: (_sample(n, rng), _sample(n, rng), False)),
+
+    # Hypothesis tests
+    ('HypothesisTesting.one_sample_ttest', 10 ** 8, HypothesisTesting.one_sample_ttest,
+     lambda n, rng: (_sample(n, rng), 50)),
+    ('HypothesisTesting.two_sample_ttest', 10 ** 8, HypothesisTesting.two_sample_ttest,
+     lambda n, rng: (_sample(n, rng), _sample(n, rng))),
+    ('HypothesisTesting.paired_ttest', 10 ** 8, HypothesisTesting.paired_ttest,
+     lambda n, rng: (_sample(n, rng), _sample(n, rng))),
+    ('HypothesisTesting.chi_square_test', 10 ** 7, HypothesisTesting.chi_square_test,
+     lambda n, rng: (rng.integers(50, 150, n),)),
+    ('HypothesisTesting.anova', 10 ** 8, HypothesisTesting.anova,
+     lambda n, rng: tuple(np.array_split(_sample(n, rng), 3))),
+
+    # Distributions
+    ('ProbabilityDistributions.normal_pdf', 10 ** 8, ProbabilityDistributions.normal_pdf,
+     lambda n, rng: (rng.normal(size=n),)),
+    ('ProbabilityDistributions.normal_cdf', 10 ** 8, ProbabilityDistributions.normal_cdf,
+     lambda n, rng: (rng.normal(size=n),)),
+    ('ProbabilityDistributions.binomial_pmf', 10 ** 7, ProbabilityDistributions.binomial_pmf,
+     lambda n, rng: (rng.integers(0, 100, n), 100, 0.3)),
+    ('ProbabilityDistributions.poisson_pmf', 10 ** 7, ProbabilityDistributions.poisson_pmf,
+     lambda n, rng: (rng.integers(0, 20, n), 4.0)),
+    ('ProbabilityDistributions.generate_normal_sample', 10 ** 7, ProbabilityDistributions.generate_normal_sample,
+     lambda n, rng: (n,)),
+
+    # Outliers
+    ('OutlierDetection.iqr_method', 10 ** 8, OutlierDetection.iqr_method, lambda n, rng: (_sample(n, rng),)),
+    ('OutlierDetection.z_score_method', 10 ** 8, OutlierDetection.z_score_method, lambda n, rng: (_sample(n, rng),)),
+
+    # Distribution shape and quantiles
+    ('KernelDensity.bandwidth', 10 ** 8, KernelDensity.bandwidth, lambda n, rng: (_sample(n, rng),)),
+    ('KernelDensity.linear_binning', 10 ** 8, KernelDensity.linear_binning,
+     lambda n, rng: (_sample(n, rng), 0.0, 100.0, 512)),
+    ('KernelDensity.estimate', 10 ** 8, KernelDensity.estimate, lambda n, rng: (_sample(n, rng),)),
+    ('HistogramEngine.bin_count', 10 ** 8, HistogramEngine.bin_count, lambda n, rng: (_sample(n, rng),)),
+    ('HistogramEngine.compute', 10 ** 8, HistogramEngine.compute, lambda n, rng: (_sample(n, rng),)),
+    ('HistogramEngine.from_grouped', 10 ** 6, HistogramEngine.from_grouped, _grouped),
+    ('HistogramEngine.grouped_statistics', 10 ** 6, HistogramEngine.grouped_statistics,
+     lambda n, rng: (HistogramEngine.from_grouped(*_grouped(n, rng)),)),
+    ('exact_quantiles', 10 ** 8, exact_quantiles, lambda n, rng: (_sample(n, rng), [0.25, 0.5, 0.75])),
+    ('QuantileSketch.update', 10 ** 8, lambda data: QuantileSketch().update(data).quantiles([0.25, 0.5, 0.75]),
+     lambda n, rng: (_sample(n, rng),)),
+    ('QuantileSketch.merge', 10 ** 8,
+     lambda left, right: QuantileSketch().merge(left).merge(right).quantiles([0.25, 0.5, 0.75]),
+     lambda n, rng: (QuantileSketch(seed=1).update(_sample(n // 2, rng)),
+                     QuantileSketch(seed=2).update(_sample(n - n // 2, rng)))),
+    ('BoxPlotSummary.summarize', 10 ** 8, BoxPlotSummary.summarize, lambda n, rng: (_sample(n, rng),)),
+    ('QQPlot.order_statistic_medians', 10 ** 8, QQPlot.order_statistic_medians, lambda n, rng: (n,)),
+    ('QQPlot.probability_levels', 10 ** 8, QQPlot.probability_levels, lambda n, rng: (n,)),
+    ('QQPlot.compute', 10 ** 8, QQPlot.compute, lambda n, rng: (_sample(n, rng),)),
+]
+
+
+def uncovered_functions() -> List[str]:
+    """Public functions of statistics_engine and utils that no benchmark case times"""
+    covered = {case[0] for case in CASES}
+    public = []
+    for name, obj in inspect.getmembers(utils, inspect.isfunction):
+        if not name.startswith('_') and obj.__module__ == 'utils':
+            public.append(f"utils.{name}")
+    for name, obj in inspect.getmembers(statistics_engine):
+        if name.startswith('_') or getattr(obj, '__module__', None) != 'statistics_engine':
+            continue
+        if inspect.isclass(obj):
+            public.extend(f"{name}.{attr}" for attr, member in vars(obj).items()
+                          if isinstance(member, staticmethod) and not attr.startswith('_'))
+        elif inspect.isfunction(obj):
+            public.append(name)
+    # Instance methods are timed through the case that uses them
+    covered |= {'QuantileSketch.quantiles', 'QuantileSketch.quantile'}
+    return sorted(set(public) - covered)
+
+
+def measure(func: Callable, repeat: int) -> Dict[str, float]:
+    """Best wall time over repeat runs, then one traced run for peak memory"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'seconds': best, 'peak_bytes': peak}
+
+
+def run_benchmarks(sizes: List[int] = SIZES, max_size: int = DEFAULT_MAX_SIZE, only: Optional[str] = None,
+                   repeat: int = 3, seed: int = 0, log: Callable[[str], None] = print) -> Dict[str, Dict[str, float]]:
+    """
+    Run every case at every size up to min(max_size, the case's own limit).
+    Results are keyed 'case@size'; cases that fail (e.g. a missing optional
+    dependency) are reported and skipped.
+    """
+    global _scratch_dir
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='benchmark-') as scratch_dir:
+        _scratch_dir = scratch_dir
+        try:
+            for name, case_limit, func, make_args in CASES:
+                if only and only not in name:
+                    continue
+                for n in sizes:
+                    if n > min(max_size, case_limit):
+                        continue
+                    key = f"{name}@{n}"
+                    try:
+                        args = make_args(n, np.random.default_rng(seed))
+                        results[key] = measure(lambda: func(*args), repeat if n <= 10 ** 6 else 1)
+                    except (ImportError, MemoryError) as e:
+                        log(f"{key:<55} skipped: {e}")
+                        continue
+                    log(f"{key:<55}{results[key]['seconds'] * 1000:>12.2f} ms"
+                        f"{results[key]['peak_bytes'] / 2 ** 20:>12.1f} MiB")
+        finally:
+            _scratch_dir = None
+    return results
+
+
+def find_regressions(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                     tolerance: float = 0.25) -> List[str]:
+    """Describe every result slower or hungrier than its baseline by more than tolerance"""
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+        before = baseline[key]
+        if (result['seconds'] > before['seconds'] * (1 + tolerance)
+                and result['seconds'] - before['seconds'] > MIN_REGRESSION_SECONDS):
+            regressions.append(f"{key}: {before['seconds'] * 1000:.2f} ms -> {result['seconds'] * 1000:.2f} ms")
+        if result['peak_bytes'] > before['peak_bytes'] * (1 + tolerance) and result['peak_bytes'] > 2 ** 20:
+            regressions.append(f"{key}: peak {before['peak_bytes'] / 2 ** 20:.1f} MiB -> "
+                               f"{result['peak_bytes'] / 2 ** 20:.1f} MiB")
+    return regressions
+
+
+def _load_json(path: str, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _save_json(path: str, value) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(value, f, indent=2)
+
+
+def append_history(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    history = _load_json(path, [])
+    history.append({
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'machine': platform.platform(),
+        'results': results,
+    })
+    _save_json(path, history)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark statistics_engine and utils")
+    parser.add_argument('--sizes', nargs='+', type=lambda s: int(float(s)), default=list(SIZES),
+                        help="Input sizes (default: 1e3 to 1e8)")
+    parser.add_argument('--max-size', type=lambda s: int(float(s)), default=DEFAULT_MAX_SIZE,
+                        help="Skip sizes above this (default: 1e6; use 1e8 for the full run)")
+    parser.add_argument('--only', help="Only cases whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per case up to 1e6 (default: 3)")
+    parser.add_argument('--history', default=HISTORY_FILE)
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed slowdown (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    missing = uncovered_functions()
+    if missing:
+        print(f"Not benchmarked: {', '.join(missing)}")
+
+    results = run_benchmarks(args.sizes, args.max_size, args.only, args.repeat)
+    append_history(args.history, results)
+
+    if args.save_baseline:
+        baseline = _load_json(args.baseline, {})
+        baseline.update(results)
+        _save_json(args.baseline, baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, _load_json(args.baseline, {}), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,195 @@
+"""
+Chart Drawing Module
+Draws each chart type onto a matplotlib Axes, independent of the UI
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import seaborn as sns
+from matplotlib.colors import LogNorm
+
+from downsampling import density_grid
+
+
+# Scatter plots with more points than this switch to a density image
+SCATTER_DENSITY_THRESHOLD = 100_000
+
+# Heatmap cells narrower than this many pixels are not annotated
+HEATMAP_MIN_CELL_PX = 28
+HEATMAP_MAX_TICKS = 40
+HEATMAP_TILE_SIZE = 50
+
+sns.set_style("whitegrid")
+
+
+def finish(ax, title: str, xlabel: Optional[str] = None, ylabel: Optional[str] = None,
+           grid_axis: Optional[str] = 'both') -> None:
+    """Apply the common title, labels and grid styling"""
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    if xlabel is not None:
+        ax.set_xlabel(xlabel)
+    if ylabel is not None:
+        ax.set_ylabel(ylabel)
+    if grid_axis:
+        ax.grid(True, axis=grid_axis, alpha=0.3)
+    ax.figure.tight_layout()
+
+
+def draw_bar(ax, x: List[str], y: List[float], title: str = "Bar Graph",
+             xlabel: str = "X Axis", ylabel: str = "Y Axis") -> None:
+    ax.bar(x, y, color='#3F51B5', edgecolor='black', alpha=0.7)
+    finish(ax, title, xlabel, ylabel, grid_axis='y')
+
+
+def draw_pie(ax, values: List[float], labels: List[str], title: str = "Pie Chart") -> None:
+    ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90,
+           colors=sns.color_palette("Set2"))
+    ax.axis('equal')
+    finish(ax, title, grid_axis=None)
+
+
+def draw_histogram(ax, hist: Dict[str, any], kde: Optional[Dict[str, any]] = None,
+                   title: str = "Histogram") -> None:
+    """Draw precomputed histogram counts, optionally with a KDE scaled to frequency"""
+    ax.stairs(hist['counts'], hist['edges'], fill=True, color='#FF9800', alpha=0.7)
+    ax.stairs(hist['counts'], hist['edges'], color='black')
+
+    if kde is not None:
+        bin_width = hist['edges'][1] - hist['edges'][0]
+        ax.plot(kde['grid'], kde['density'] * hist['total'] * bin_width,
+                color='#3F51B5', linewidth=2, label='Density (KDE)')
+        ax.legend()
+    finish(ax, title, "Value", "Frequency", grid_axis='y')
+
+
+def draw_line_equation(ax, m: float, c: float) -> None:
+    x = np.linspace(-10, 10, 100)
+    ax.plot(x, m * x + c, label=f"y = {m}x + {c}", color="#3F51B5", linewidth=2)
+    ax.legend()
+    finish(ax, f"Line: y = {m}x + {c}", "X Axis", "Y Axis")
+
+
+def draw_line_points(ax, x: List[float], y: List[float], markers: bool = True) -> None:
+    ax.plot(x, y, marker='o' if markers else None, linestyle='-', color='#9C27B0', linewidth=2)
+    finish(ax, "Line Chart", "X Axis", "Y Axis")
+
+
+def draw_boxplot(ax, summaries: List[Dict[str, any]], title: str = "Box Plot") -> None:
+    """Draw box plots from precomputed summaries (see BoxPlotSummary.summarize)"""
+    ax.bxp(summaries, vert=True, patch_artist=True,
+           boxprops=dict(facecolor='#4CAF50', alpha=0.7),
+           medianprops=dict(color='red', linewidth=2))
+
+    shown = sum(len(s['fliers']) for s in summaries)
+    total = sum(s.get('n_fliers', len(s['fliers'])) for s in summaries)
+    if shown < total:
+        ax.text(0.99, 0.01, f"showing {shown} of {total} outliers", transform=ax.transAxes,
+                ha='right', va='bottom', fontsize=8, color='gray')
+    finish(ax, title, ylabel="Value", grid_axis='y')
+
+
+def draw_scatter(ax, x: List[float], y: List[float], regression: Optional[Dict[str, any]] = None,
+                 title: str = "Scatter Plot", data_label: Optional[str] = None,
+                 line_label: Optional[str] = None, density: Optional[bool] = None,
+                 grid_shape: Tuple[int, int] = (200, 150)) -> None:
+    """
+    Scatter plot with optional regression line.
+    With density=None, samples above SCATTER_DENSITY_THRESHOLD points are drawn
+    as a 2-D count image instead of individual markers.
+    """
+    if density is None:
+        density = len(x) > SCATTER_DENSITY_THRESHOLD
+
+    if density:
+        counts, extent = density_grid(x, y, grid_shape)
+        image = ax.imshow(np.ma.masked_equal(counts, 0), origin='lower', extent=extent,
+                          aspect='auto', cmap='viridis', norm=LogNorm(), interpolation='nearest')
+        ax.figure.colorbar(image, ax=ax, label='Points per cell')
+    else:
+        ax.scatter(x, y, alpha=0.6, s=100, color='#2196F3', edgecolors='black', label=data_label)
+
+    if regression is not None:
+        # Two endpoints describe the line; no per-point predictions are needed
+        x_line = np.array([np.min(x), np.max(x)])
+        ax.plot(x_line, regression['slope'] * x_line + regression['intercept'], color='red', linewidth=2,
+                label=line_label or f"{regression['equation']} (R²={regression['r_squared']:.3f})")
+        ax.legend()
+    finish(ax, title, "X", "Y")
+
+
+def heatmap_tiles(n: int, tile_size: int = HEATMAP_TILE_SIZE) -> List[Tuple[int, int, int, int]]:
+    """Split an n x n matrix into (row_start, row_end, col_start, col_end) tiles"""
+    starts = range(0, n, tile_size)
+    return [(r, min(r + tile_size, n), c, min(c + tile_size, n)) for r in starts for c in starts]
+
+
+def draw_heatmap(ax, corr_matrix, title: str = "Correlation Heatmap", annotate: Optional[bool] = None,
+                 tile: Optional[Tuple[int, int, int, int]] = None) -> None:
+    """
+    Draw a correlation matrix as a single image.
+    Cells are annotated only when they are at least HEATMAP_MIN_CELL_PX wide on screen
+    (or when annotate=True); tile restricts the view to a block of the matrix.
+    """
+    if tile is not None:
+        r0, r1, c0, c1 = tile
+        corr_matrix = corr_matrix.iloc[r0:r1, c0:c1]
+        title = f"{title} (rows {r0 + 1}-{r1}, columns {c0 + 1}-{c1})"
+
+    values = np.asarray(corr_matrix, dtype=float)
+    n_rows, n_cols = values.shape
+    image = ax.imshow(values, cmap='coolwarm', vmin=-1, vmax=1, interpolation='nearest', aspect='equal')
+    ax.figure.colorbar(image, ax=ax, shrink=0.8)
+    ax.grid(False)
+
+    # Label every column when they fit, otherwise every k-th one
+    for axis_ticks, labels, count in ((ax.set_xticks, corr_matrix.columns, n_cols),
+                                      (ax.set_yticks, corr_matrix.index, n_rows)):
+        step = max(1, int(np.ceil(count / HEATMAP_MAX_TICKS)))
+        positions = np.arange(0, count, step)
+        axis_ticks(positions, [str(labels[i]) for i in positions])
+    ax.tick_params(axis='x', labelrotation=90)
+
+    ax.figure.tight_layout()
+    if annotate is None:
+        bbox = ax.get_window_extent()
+        annotate = min(bbox.width / n_cols, bbox.height / n_rows) >= HEATMAP_MIN_CELL_PX
+
+    if annotate:
+        fontsize = 8 if max(n_rows, n_cols) > 10 else 10
+        for (i, j), value in np.ndenumerate(values):
+            if np.isfinite(value):
+                ax.text(j, i, f"{value:.2f}", ha='center', va='center', fontsize=fontsize,
+                        color='white' if abs(value) > 0.6 else 'black')
+
+    ax.set_title(title, fontsize=14, fontweight='bold')
+
+
+def draw_qqplot(ax, qq: Dict[str, any]) -> None:
+    """Draw precomputed Q-Q points (see QQPlot.compute) with their reference line"""
+    ax.plot(qq['theoretical'], qq['sample'], 'o', color='#2196F3', markersize=4 if len(qq['sample']) > 200 else 6)
+
+    ends = np.array([qq['theoretical'][0], qq['theoretical'][-1]])
+    ax.plot(ends, qq['slope'] * ends + qq['intercept'], color='red', linewidth=2,
+            label=f"Reference line (R²={qq['r_squared']:.4f})")
+    ax.legend(loc='upper left')
+
+    title = "Q-Q Plot (Normality Test)" if qq['dist'] == 'norm' else f"Q-Q Plot ({qq['dist']})"
+    finish(ax, title, "Theoretical quantiles", "Ordered Values")
+
+
+def draw_violin(ax, groups: List[List[float]], kdes: List[Dict[str, any]], labels: List[str],
+                title: str = "Violin Plot") -> None:
+    """Draw one violin per group from its precomputed KDE"""
+    for position, (group, kde) in enumerate(zip(groups, kdes), start=1):
+        half_width = 0.4 * kde['density'] / kde['density'].max()
+        ax.fill_betweenx(kde['grid'], position - half_width, position + half_width,
+                         color='#4CAF50', alpha=0.7, edgecolor='black')
+
+        q1, median, q3 = np.percentile(group, [25, 50, 75])
+        ax.vlines(position, q1, q3, color='black', linewidth=4)
+        ax.scatter([position], [median], color='white', edgecolors='black', zorder=3)
+
+    ax.set_xticks(range(1, len(groups) + 1))
+    ax.set_xticklabels(labels[:len(groups)])
+    finish(ax, title, ylabel="Value", grid_axis='y')
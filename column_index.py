@@ -0,0 +1,70 @@
+"""
+Column Index Module
+Searchable index of a dataset's column names and kinds,
+built once per loaded dataset
+"""
+
+from typing import List, Optional
+
+import pandas as pd
+
+
+KINDS = ('numeric', 'categorical', 'datetime', 'boolean')
+
+
+def column_kind(dtype) -> str:
+    """Classify a column dtype as numeric, boolean, datetime or categorical (anything else)"""
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'boolean'
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'numeric'
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return 'datetime'
+    return 'categorical'
+
+
+class ColumnIndex:
+    """
+    Column names with their kinds, searchable by prefix or substring.
+    Searches that extend the previous query only scan the previous matches,
+    so typing one character at a time stays fast on very wide datasets.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns = list(df.columns)
+        self.names = [str(col) for col in self.columns]
+        self.kinds = [column_kind(dtype) for dtype in df.dtypes]
+        self._folded = [name.casefold() for name in self.names]
+        self._last_query = None
+        self._last_kind = None
+        self._last_matches: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def search(self, query: str = '', kind: Optional[str] = None) -> list:
+        """
+        Case-insensitive search of column names, optionally limited to one kind.
+        Prefix matches come first, then other substring matches, each in column order.
+        Returns the original column labels.
+        """
+        if kind is not None and kind not in KINDS:
+            raise ValueError(f"Invalid column kind: {kind}")
+
+        query = query.strip().casefold()
+        if (self._last_query is not None and kind == self._last_kind
+                and query.startswith(self._last_query)):
+            candidates = self._last_matches
+        elif kind is None:
+            candidates = range(len(self.names))
+        else:
+            candidates = [i for i, k in enumerate(self.kinds) if k == kind]
+
+        matches = [i for i in candidates if query in self._folded[i]]
+        self._last_query, self._last_kind, self._last_matches = query, kind, matches
+
+        prefix = [i for i in matches if self._folded[i].startswith(query)]
+        if len(prefix) < len(matches):
+            prefix_set = set(prefix)
+            matches = prefix + [i for i in matches if i not in prefix_set]
+        return [self.columns[i] for i in matches]
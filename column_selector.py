@@ -0,0 +1,81 @@
+"""
+Column Selector Module
+Searchable column picker on a RecycleView, so only the visible rows have widgets
+"""
+
+from kivy.lang import Builder
+from kivy.properties import BooleanProperty, ObjectProperty, StringProperty
+from kivymd.uix.boxlayout import MDBoxLayout
+
+
+Builder.load_string('''
+<ColumnSelector>:
+    orientation: "vertical"
+    spacing: dp(8)
+    size_hint_y: None
+    height: dp(440)
+
+    MDTextField:
+        id: search
+        hint_text: "Search columns"
+        mode: "rectangle"
+        on_text: root.update_results()
+
+    MDBoxLayout:
+        orientation: "horizontal"
+        spacing: dp(10)
+        size_hint_y: None
+        height: dp(40)
+
+        MDCheckbox:
+            active: root.kind_only
+            size_hint_x: None
+            width: dp(40)
+            on_active: root.kind_only = self.active
+
+        MDLabel:
+            text: root.kind.capitalize() + " columns only"
+
+        MDLabel:
+            text: root.status
+            halign: "right"
+            theme_text_color: "Secondary"
+
+    RecycleView:
+        id: results
+        viewclass: "OneLineListItem"
+
+        RecycleBoxLayout:
+            orientation: "vertical"
+            default_size: None, dp(48)
+            default_size_hint: 1, None
+            size_hint_y: None
+            height: self.minimum_height
+''')
+
+
+class ColumnSelector(MDBoxLayout):
+    """
+    Lists the columns of a ColumnIndex that match the search text.
+    select_callback(column) is called with the chosen column label.
+    While kind_only is set, only columns of the given kind are listed.
+    """
+
+    index = ObjectProperty(None)
+    select_callback = ObjectProperty(None)
+    kind = StringProperty("numeric")
+    kind_only = BooleanProperty(True)
+    status = StringProperty("")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bind(kind=lambda *args: self.update_results(), kind_only=lambda *args: self.update_results())
+        self.update_results()
+
+    def update_results(self):
+        if self.index is None:
+            return
+        columns = self.index.search(self.ids.search.text, self.kind if self.kind_only else None)
+        self.ids.results.data = [{"text": str(col), "on_release": lambda col=col: self.select_callback(col)}
+                                 for col in columns]
+        self.status = f"{len(columns)} of {len(self.index)} columns"
@@ -2,14 +2,6 @@
 Helper functions for populating UI fields from loaded data
 """
 
-def get_column_items(app):
-    """Get list of column names from loaded data for dropdown menu"""
-    if app.loaded_data is None:
-        return []
-    return [{"text": col, "viewclass": "OneLineListItem", 
-             "on_release": lambda x=col: None} for col in app.loaded_data.columns]
-
-
 def populate_field_from_column(app, field_id, column_name):
     """Populate a text field with data from a specific column"""
     if app.loaded_data is None:
@@ -0,0 +1,124 @@
+"""
+Downsampling Module
+Level-of-detail reduction for line charts with many points
+"""
+
+from typing import List, Tuple, Union
+
+import numpy as np
+
+
+ArrayLike = Union[np.ndarray, List[float]]
+
+
+def lttb(x: ArrayLike, y: ArrayLike, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Keeps the first and last points and, from each bucket, the point forming
+    the largest triangle with the previously kept point and the next bucket's mean.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = x.size
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    every = (n - 2) / (n_out - 2)
+    edges = (np.arange(n_out - 1) * every).astype(np.int64) + 1
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < edges.size else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return x[selected], y[selected]
+
+
+def minmax_decimate(x: ArrayLike, y: ArrayLike, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-pixel min/max decimation.
+    Splits the series into n_buckets runs of consecutive points and keeps each
+    run's minimum and maximum in their original order, so every spike survives.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = x.size
+    if n_buckets < 1 or 2 * n_buckets >= n:
+        return x, y
+
+    size = int(np.ceil(n / n_buckets))
+    full = (n // size) * size
+    blocks = y[:full].reshape(-1, size)
+    offsets = np.arange(0, full, size)
+    lows = offsets + np.argmin(blocks, axis=1)
+    highs = offsets + np.argmax(blocks, axis=1)
+
+    keep = [lows, highs, [0, n - 1]]
+    if full < n:
+        tail = y[full:]
+        keep.append([full + int(np.argmin(tail)), full + int(np.argmax(tail))])
+
+    selected = np.unique(np.concatenate(keep))
+    return x[selected], y[selected]
+
+
+def downsample(x: ArrayLike, y: ArrayLike, width_px: int, method: str = 'lttb',
+               points_per_pixel: int = 2) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to roughly points_per_pixel vertices per horizontal pixel of the view.
+    Series that already fit are returned unchanged.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.size != y.size:
+        raise ValueError("X and Y points must have same length")
+
+    target = max(int(width_px) * points_per_pixel, 3)
+    if x.size <= target:
+        return x, y
+
+    if method == 'lttb':
+        return lttb(x, y, target)
+    elif method == 'minmax':
+        return minmax_decimate(x, y, target // 2)
+    raise ValueError(f"Invalid downsampling method: {method}")
+
+
+def density_grid(x: ArrayLike, y: ArrayLike, bins: Tuple[int, int]) -> Tuple[np.ndarray, Tuple[float, float, float, float]]:
+    """
+    Aggregate points into a 2-D count grid with equal-width cells.
+    Returns counts shaped (ny, nx) ready for imshow, and the (xmin, xmax, ymin, ymax) extent.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if x.size == 0:
+        raise ValueError("No finite points to aggregate")
+
+    nx, ny = int(bins[0]), int(bins[1])
+    xmin, xmax = float(x.min()), float(x.max())
+    ymin, ymax = float(y.min()), float(y.max())
+    if xmax == xmin:
+        xmin, xmax = xmin - 0.5, xmax + 0.5
+    if ymax == ymin:
+        ymin, ymax = ymin - 0.5, ymax + 0.5
+
+    ix = ((x - xmin) * (nx / (xmax - xmin))).astype(np.int64)
+    iy = ((y - ymin) * (ny / (ymax - ymin))).astype(np.int64)
+    np.clip(ix, 0, nx - 1, out=ix)
+    np.clip(iy, 0, ny - 1, out=iy)
+
+    counts = np.bincount(iy * nx + ix, minlength=nx * ny).reshape(ny, nx)
+    return counts, (xmin, xmax, ymin, ymax)
@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+from statistics_engine import HistogramEngine
 
 def get_grouped_data():
     print("Enter the grouped data (class intervals and frequencies):")
@@ -31,20 +32,19 @@ def get_grouped_data():
     return intervals, frequencies
 
 def plot_histogram(intervals, frequencies):
-    # Prepare bins and weights for matplotlib
-    bins = [interval[0] for interval in intervals] + [intervals[-1][1]]
-    plt.hist(
-        bins[:-1],
-        bins=bins,
-        weights=frequencies,
-        edgecolor='black'
-    )
+    # Bin once with the histogram engine and draw the counts as a single step artist
+    hist = HistogramEngine.from_grouped(intervals, frequencies)
+    plt.stairs(hist['counts'], hist['edges'], fill=True, edgecolor='black')
     # Add labels and title
     plt.xlabel("Class Intervals")
     plt.ylabel("Frequency")
     plt.title("Histogram for Grouped Data")
     plt.show()
 
+    grouped_stats = HistogramEngine.grouped_statistics(hist)
+    print(f"Mean: {grouped_stats['mean']:.4f}, Median: {grouped_stats['median']:.4f}, "
+          f"Mode: {grouped_stats['mode']:.4f}")
+
 # Main program
 if __name__ == "__main__":
     intervals, frequencies = get_grouped_data()
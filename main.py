@@ -1,43 +1,87 @@
-from kivy.lang import Builder
-from kivy.core.window import Window
-from kivymd.app import MDApp
-from kivymd.uix.button import MDRaisedButton, MDFlatButton, MDIconButton
-from kivymd.uix.dialog import MDDialog
-from kivymd.uix.screen import MDScreen
-from kivymd.uix.screenmanager import MDScreenManager
-from kivymd.uix.boxlayout import MDBoxLayout
-from kivymd.uix.datatables import MDDataTable
-from kivymd.uix.menu import MDDropdownMenu
-from kivymd.uix.list import OneLineListItem
-from kivy.metrics import dp
-import matplotlib.pyplot as plt
-import seaborn as sns
-import numpy as np
-import pandas as pd
-from statistics_engine import (
-    DescriptiveStats, CorrelationAnalysis, RegressionAnalysis,
-    HypothesisTesting, ProbabilityDistributions, OutlierDetection
-)
-from utils import (
-    parse_numeric_data, read_data_file, preview_data,
-    get_numeric_columns, detect_missing_values, handle_missing_values,
-    normalize_data, standardize_data, export_to_csv
-)
-from analysis_screens import (
-    DescriptiveStatsScreen, CorrelationScreen, RegressionScreen,
-    HypothesisTestScreen, DataViewScreen
-)
-from visualization_screens import (
-    BoxPlotScreen, ScatterPlotScreen, HeatmapScreen,
-    QQPlotScreen, ViolinPlotScreen
-)
+import os
+import threading
+from startup_profile import profiler, LazyModule, warm_up
+from task_executor import TaskExecutor
+import tracing
+from tracing import traced
+
+with profiler.phase("import kivy"):
+    from kivy.clock import Clock
+    from kivy.factory import Factory
+    from kivy.lang import Builder
+    from kivy.logger import Logger
+    from kivy.core.window import Window
+    from kivy.metrics import dp
+
+with profiler.phase("import kivymd"):
+    from kivymd.app import MDApp
+    from kivymd.uix.screen import MDScreen
+    from kivymd.uix.boxlayout import MDBoxLayout
+
+with profiler.phase("import app screens"):
+    from plot_widget import PlotWidget
+    from analysis_screens import (
+        DescriptiveStatsScreen, CorrelationScreen, RegressionScreen,
+        HypothesisTestScreen, DataViewScreen, DiagnosticsScreen
+    )
+    from visualization_screens import (
+        BoxPlotScreen, ScatterPlotScreen, HeatmapScreen,
+        QQPlotScreen, ViolinPlotScreen
+    )
+
+# Scientific modules (numpy, pandas, scipy, matplotlib, seaborn) load on first use,
+# or earlier from the background warm-up started once the window is up
+engine = LazyModule('statistics_engine')
+utils = LazyModule('utils')
+charts = LazyModule('charts')
+downsampling = LazyModule('downsampling')
+result_cache = LazyModule('result_cache')
+missing_values = LazyModule('missing_values')
+memory_budget = LazyModule('memory_budget')
+column_index = LazyModule('column_index')
+workspace = LazyModule('workspace')
+row_filter = LazyModule('row_filter')
+
+WARM_UP_MODULES = ('numpy', 'pandas', 'scipy.stats', 'statistics_engine', 'utils',
+                   'result_cache', 'missing_values', 'memory_budget', 'downsampling', 'matplotlib.figure', 'charts')
 
 
 Window.size = (900, 700)
 
-# Set matplotlib and seaborn style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (8, 6)
+# Memoization of statistics engine calls (set RESULT_CACHE_DIR to persist across sessions)
+RESULT_CACHE_BYTES = 64 * 1024 * 1024
+RESULT_CACHE_DIR = None
+
+# Rendered chart images, keyed by chart type, data fingerprint and styling
+RENDER_CACHE_BYTES = 128 * 1024 * 1024
+RENDER_CACHE_DIR = None
+
+# Build the remaining screens one by one in idle time after startup
+PREBUILD_SCREENS = False
+
+# Threads running the analysis handlers (None lets the pool pick from the CPU count)
+ANALYSIS_WORKERS = None
+# Screens running several independent analyses give each its own task key; others use the screen name
+SCREEN_TASKS = {"hypothesis": ("hypothesis.one_sample", "hypothesis.two_sample")}
+_engine_cache_lock = threading.Lock()
+
+# Column pickers that fill label fields rather than numeric data start with all columns listed
+LABEL_FIELDS = {("bar", "x_values"), ("pie", "pie_labels")}
+
+# Fields that take a column name rather than the column's values, with the kind of column they list
+COLUMN_NAME_FIELDS = {
+    ("bar", "category_column"): "categorical", ("bar", "value_column"): "numeric",
+    ("pie", "category_column"): "categorical", ("pie", "value_column"): "numeric",
+}
+
+# Largest estimated working set of one engine call; calls over it warn or switch to
+# a sketch/streaming mode (None disables the check)
+MEMORY_BUDGET_BYTES = None
+
+# Loaded datasets kept in memory; least recently used ones beyond this are spilled
+# to WORKSPACE_SPILL_DIR (a temporary directory when None) and reloaded on use
+WORKSPACE_MEMORY_BYTES = 1024 * 1024 * 1024
+WORKSPACE_SPILL_DIR = None
 
 KV = '''
 <DrawerClickableItem@OneLineIconListItem>:
@@ -45,6 +89,32 @@ KV = '''
     text_color: app.theme_cls.text_color
     icon_color: app.theme_cls.primary_color
 
+<TaskStatus@MDBoxLayout>:
+    task_name: ""
+    busy: False
+    progress: 0
+    message: ""
+    orientation: "horizontal"
+    spacing: dp(10)
+    size_hint_y: None
+    height: dp(40) if self.busy else 0
+    opacity: 1 if self.busy else 0
+    disabled: not self.busy
+
+    MDProgressBar:
+        value: root.progress
+        size_hint_x: 0.5
+        pos_hint: {"center_y": 0.5}
+
+    MDLabel:
+        text: root.message
+        size_hint_x: 0.3
+
+    MDFlatButton:
+        text: "Cancel"
+        size_hint_x: 0.2
+        on_release: app.cancel_task(root.task_name)
+
 <ContentNavigationDrawer>:
     MDBoxLayout:
         orientation: "vertical"
@@ -79,7 +149,7 @@ KV = '''
                     icon: "home"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "main"
+                        app.show_screen("main")
                 
                 OneLineListItem:
                     text: "DATA MANAGEMENT"
@@ -93,7 +163,7 @@ KV = '''
                     icon: "table"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "dataview"
+                        app.show_screen("dataview")
 
                 OneLineListItem:
                     text: "BASIC CHARTS"
@@ -107,28 +177,28 @@ KV = '''
                     icon: "chart-bar"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "bar"
+                        app.show_screen("bar")
 
                 DrawerClickableItem:
                     text: "Pie Chart"
                     icon: "chart-pie"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "pie"
+                        app.show_screen("pie")
 
                 DrawerClickableItem:
                     text: "Histogram"
                     icon: "chart-histogram"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "histogram"
+                        app.show_screen("histogram")
 
                 DrawerClickableItem:
                     text: "Line Chart"
                     icon: "chart-line"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "line"
+                        app.show_screen("line")
 
                 OneLineListItem:
                     text: "ADVANCED VISUALIZATIONS"
@@ -142,28 +212,35 @@ KV = '''
                     icon: "box"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "boxplot"
+                        app.show_screen("boxplot")
 
                 DrawerClickableItem:
                     text: "Scatter Plot"
                     icon: "chart-scatter-plot"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "scatter"
+                        app.show_screen("scatter")
 
                 DrawerClickableItem:
                     text: "Heatmap"
                     icon: "grid"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "heatmap"
+                        app.show_screen("heatmap")
 
                 DrawerClickableItem:
                     text: "Q-Q Plot"
                     icon: "chart-bell-curve"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "qqplot"
+                        app.show_screen("qqplot")
+
+                DrawerClickableItem:
+                    text: "Violin Plot"
+                    icon: "violin"
+                    on_press:
+                        root.nav_drawer.set_state("close")
+                        app.show_screen("violin")
 
                 OneLineListItem:
                     text: "STATISTICAL ANALYSIS"
@@ -177,47 +254,48 @@ KV = '''
                     icon: "calculator"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "descriptive"
+                        app.show_screen("descriptive")
 
                 DrawerClickableItem:
                     text: "Correlation Analysis"
                     icon: "chart-scatter-plot-hexbin"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "correlation"
+                        app.show_screen("correlation")
 
                 DrawerClickableItem:
                     text: "Regression Analysis"
                     icon: "chart-line-variant"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "regression"
+                        app.show_screen("regression")
 
                 DrawerClickableItem:
                     text: "Hypothesis Testing"
                     icon: "test-tube"
                     on_press:
                         root.nav_drawer.set_state("close")
-                        root.screen_manager.current = "hypothesis"
+                        app.show_screen("hypothesis")
+
+                OneLineListItem:
+                    text: "TOOLS"
+                    divider: None
+                    _no_ripple_effect: True
+                    theme_text_color: "Secondary"
+                    font_style: "Caption"
+
+                DrawerClickableItem:
+                    text: "Diagnostics"
+                    icon: "timer-outline"
+                    on_press:
+                        root.nav_drawer.set_state("close")
+                        app.show_screen("diagnostics")
 
 MDNavigationLayout:
     MDScreenManager:
         id: screen_manager
 
         MainScreen:
-        DataViewScreen:
-        BarGraphScreen:
-        PieChartScreen:
-        HistogramScreen:
-        LineChartScreen:
-        BoxPlotScreen:
-        ScatterPlotScreen:
-        HeatmapScreen:
-        QQPlotScreen:
-        DescriptiveStatsScreen:
-        CorrelationScreen:
-        RegressionScreen:
-        HypothesisTestScreen:
 
     MDNavigationDrawer:
         id: nav_drawer
@@ -294,7 +372,30 @@ MDNavigationLayout:
                         height: self.texture_size[1]
 
                 Widget:
+'''
 
+# Screens other than Home are built the first time they are opened
+SCREEN_CLASSES = {
+    "dataview": "DataViewScreen",
+    "bar": "BarGraphScreen",
+    "pie": "PieChartScreen",
+    "histogram": "HistogramScreen",
+    "line": "LineChartScreen",
+    "boxplot": "BoxPlotScreen",
+    "scatter": "ScatterPlotScreen",
+    "heatmap": "HeatmapScreen",
+    "qqplot": "QQPlotScreen",
+    "violin": "ViolinPlotScreen",
+    "descriptive": "DescriptiveStatsScreen",
+    "correlation": "CorrelationScreen",
+    "regression": "RegressionScreen",
+    "hypothesis": "HypothesisTestScreen",
+    "diagnostics": "DiagnosticsScreen",
+}
+
+# KV rules of each lazily built screen, loaded together with it
+SCREEN_KV = {
+    "dataview": '''
 <DataViewScreen>:
     name: "dataview"
     MDBoxLayout:
@@ -320,9 +421,68 @@ MDNavigationLayout:
                     helper_text: "Enter full path to your data file"
                     helper_text_mode: "on_focus"
 
-                MDRaisedButton:
-                    text: "Load Data"
-                    on_release: app.load_data_file(file_path.text)
+                MDBoxLayout:
+                    orientation: "horizontal"
+                    spacing: dp(10)
+                    size_hint_y: None
+                    height: dp(40)
+
+                    MDRaisedButton:
+                        text: "Load Data"
+                        on_release: app.load_data_file(file_path.text)
+
+                    MDRaisedButton:
+                        id: dataset_button
+                        text: "Switch Dataset"
+                        on_release: app.show_dataset_menu(self)
+
+                MDBoxLayout:
+                    orientation: "horizontal"
+                    spacing: dp(10)
+                    size_hint_y: None
+                    height: dp(60)
+
+                    MDTextField:
+                        id: missing_method
+                        hint_text: "Missing values: drop, mean, median, mode, constant"
+                        mode: "rectangle"
+                        size_hint_x: 0.6
+
+                    MDTextField:
+                        id: missing_fill
+                        hint_text: "Fill value (constant)"
+                        mode: "rectangle"
+                        size_hint_x: 0.2
+
+                    MDRaisedButton:
+                        text: "Apply"
+                        size_hint_x: 0.2
+                        on_release: app.apply_missing_value_handling(missing_method.text, missing_fill.text)
+
+                MDBoxLayout:
+                    orientation: "horizontal"
+                    spacing: dp(10)
+                    size_hint_y: None
+                    height: dp(60)
+
+                    MDTextField:
+                        id: row_filter
+                        hint_text: 'Row filter, e.g. Age > 23 and Grade == "A"'
+                        helper_text: "Used by columns filled from now on, category totals and the heatmap; put column names with spaces in `backticks`"
+                        helper_text_mode: "on_focus"
+                        mode: "rectangle"
+                        size_hint_x: 0.6
+                        on_text_validate: app.apply_row_filter(self.text)
+
+                    MDRaisedButton:
+                        text: "Filter"
+                        size_hint_x: 0.2
+                        on_release: app.apply_row_filter(row_filter.text)
+
+                    MDRaisedButton:
+                        text: "Clear"
+                        size_hint_x: 0.2
+                        on_release: app.apply_row_filter("")
 
                 MDLabel:
                     id: data_preview
@@ -330,7 +490,8 @@ MDNavigationLayout:
                     font_name: "RobotoMono-Regular"
                     size_hint_y: None
                     height: self.texture_size[1]
-
+''',
+    "bar": '''
 <BarGraphScreen>:
     name: "bar"
     MDBoxLayout:
@@ -379,6 +540,74 @@ MDNavigationLayout:
                             size_hint_x: 0.5
                             on_release: app.show_column_selector("bar", "y_values")
 
+                MDCard:
+                    orientation: "vertical"
+                    padding: dp(15)
+                    spacing: dp(10)
+                    size_hint_y: None
+                    height: self.minimum_height
+                    elevation: 1
+
+                    MDLabel:
+                        text: "Aggregate a Categorical Column"
+                        font_style: "Subtitle1"
+                        size_hint_y: None
+                        height: self.texture_size[1]
+
+                    MDBoxLayout:
+                        orientation: "horizontal"
+                        spacing: dp(10)
+                        size_hint_y: None
+                        height: dp(60)
+
+                        MDTextField:
+                            id: category_column
+                            hint_text: "Category column"
+                            mode: "rectangle"
+                            size_hint_x: 0.7
+
+                        MDRaisedButton:
+                            text: "Select"
+                            size_hint_x: 0.3
+                            on_release: app.show_column_selector("bar", "category_column")
+
+                    MDBoxLayout:
+                        orientation: "horizontal"
+                        spacing: dp(10)
+                        size_hint_y: None
+                        height: dp(60)
+
+                        MDTextField:
+                            id: value_column
+                            hint_text: "Value column (for sum/mean)"
+                            mode: "rectangle"
+                            size_hint_x: 0.7
+
+                        MDRaisedButton:
+                            text: "Select"
+                            size_hint_x: 0.3
+                            on_release: app.show_column_selector("bar", "value_column")
+
+                    MDBoxLayout:
+                        orientation: "horizontal"
+                        spacing: dp(10)
+                        size_hint_y: None
+                        height: dp(60)
+
+                        MDTextField:
+                            id: aggregation
+                            hint_text: "count, sum or mean (default: count)"
+                            mode: "rectangle"
+
+                        MDTextField:
+                            id: top_k
+                            hint_text: "Top categories (default: 10)"
+                            mode: "rectangle"
+
+                    MDRaisedButton:
+                        text: "Aggregate and Plot"
+                        on_release: app.aggregate_categories("bar")
+
                 MDTextField:
                     id: x_values
                     hint_text: "X values (comma-separated)"
@@ -408,7 +637,12 @@ MDNavigationLayout:
                     text: "Generate Bar Graph"
                     on_release: app.create_bar_graph()
 
-
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "pie": '''
 <PieChartScreen>:
     name: "pie"
     MDBoxLayout:
@@ -457,6 +691,74 @@ MDNavigationLayout:
                             size_hint_x: 0.5
                             on_release: app.show_column_selector("pie", "pie_labels")
 
+                MDCard:
+                    orientation: "vertical"
+                    padding: dp(15)
+                    spacing: dp(10)
+                    size_hint_y: None
+                    height: self.minimum_height
+                    elevation: 1
+
+                    MDLabel:
+                        text: "Aggregate a Categorical Column"
+                        font_style: "Subtitle1"
+                        size_hint_y: None
+                        height: self.texture_size[1]
+
+                    MDBoxLayout:
+                        orientation: "horizontal"
+                        spacing: dp(10)
+                        size_hint_y: None
+                        height: dp(60)
+
+                        MDTextField:
+                            id: category_column
+                            hint_text: "Category column"
+                            mode: "rectangle"
+                            size_hint_x: 0.7
+
+                        MDRaisedButton:
+                            text: "Select"
+                            size_hint_x: 0.3
+                            on_release: app.show_column_selector("pie", "category_column")
+
+                    MDBoxLayout:
+                        orientation: "horizontal"
+                        spacing: dp(10)
+                        size_hint_y: None
+                        height: dp(60)
+
+                        MDTextField:
+                            id: value_column
+                            hint_text: "Value column (for sum/mean)"
+                            mode: "rectangle"
+                            size_hint_x: 0.7
+
+                        MDRaisedButton:
+                            text: "Select"
+                            size_hint_x: 0.3
+                            on_release: app.show_column_selector("pie", "value_column")
+
+                    MDBoxLayout:
+                        orientation: "horizontal"
+                        spacing: dp(10)
+                        size_hint_y: None
+                        height: dp(60)
+
+                        MDTextField:
+                            id: aggregation
+                            hint_text: "count, sum or mean (default: count)"
+                            mode: "rectangle"
+
+                        MDTextField:
+                            id: top_k
+                            hint_text: "Top categories (default: 10)"
+                            mode: "rectangle"
+
+                    MDRaisedButton:
+                        text: "Aggregate and Plot"
+                        on_release: app.aggregate_categories("pie")
+
                 MDTextField:
                     id: pie_values
                     hint_text: "Values (comma-separated)"
@@ -471,6 +773,12 @@ MDNavigationLayout:
                     text: "Generate Pie Chart"
                     on_release: app.create_pie_chart()
 
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "histogram": '''
 <HistogramScreen>:
     name: "histogram"
     MDBoxLayout:
@@ -512,15 +820,42 @@ MDNavigationLayout:
                     hint_text: "Raw Data (comma-separated)"
                     mode: "rectangle"
 
+                MDTextField:
+                    id: grouped_data
+                    hint_text: "OR Grouped Data (lower-upper:frequency, e.g. 0-5:3, 5-10:7)"
+                    mode: "rectangle"
+
                 MDTextField:
                     id: bins
-                    hint_text: "Number of Bins (optional, default: 10)"
+                    hint_text: "Bins: a number or auto, fd, sturges, doane (default: auto)"
                     mode: "rectangle"
 
+                MDSwitch:
+                    id: show_density
+                    active: False
+                    pos_hint: {"center_x": 0.5}
+
+                MDLabel:
+                    text: "Overlay Density Curve (KDE)"
+                    pos_hint: {"center_x": 0.5}
+
                 MDRaisedButton:
                     text: "Generate Histogram"
                     on_release: app.create_histogram()
 
+                MDLabel:
+                    id: results
+                    text: ""
+                    font_name: "RobotoMono-Regular"
+                    size_hint_y: None
+                    height: self.texture_size[1]
+
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "line": '''
 <LineChartScreen>:
     name: "line"
     MDBoxLayout:
@@ -597,6 +932,12 @@ MDNavigationLayout:
                     text: "Generate Line Chart"
                     on_release: app.create_line_chart()
 
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "boxplot": '''
 <BoxPlotScreen>:
     name: "boxplot"
     MDBoxLayout:
@@ -635,7 +976,7 @@ MDNavigationLayout:
 
                 MDTextField:
                     id: data
-                    hint_text: "Data (comma-separated)"
+                    hint_text: "Data (comma-separated, separate groups with ';')"
                     mode: "rectangle"
                     multiline: True
 
@@ -648,6 +989,12 @@ MDNavigationLayout:
                     text: "Generate Box Plot"
                     on_release: app.create_boxplot()
 
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "scatter": '''
 <ScatterPlotScreen>:
     name: "scatter"
     MDBoxLayout:
@@ -719,6 +1066,12 @@ MDNavigationLayout:
                     text: "Generate Scatter Plot"
                     on_release: app.create_scatterplot()
 
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "heatmap": '''
 <HeatmapScreen>:
     name: "heatmap"
     MDBoxLayout:
@@ -741,10 +1094,36 @@ MDNavigationLayout:
                     text: "Load data from Data View to generate heatmap"
                     halign: "center"
 
+                MDSwitch:
+                    id: cluster
+                    active: False
+                    pos_hint: {"center_x": 0.5}
+
+                MDLabel:
+                    text: "Reorder by Hierarchical Clustering"
+                    pos_hint: {"center_x": 0.5}
+
+                MDTextField:
+                    id: tile
+                    hint_text: "Tile number (optional, zooms into a 50x50 block of wide matrices)"
+                    mode: "rectangle"
+
+                MDLabel:
+                    id: tile_info
+                    text: ""
+                    halign: "center"
+                    theme_text_color: "Secondary"
+
                 MDRaisedButton:
                     text: "Generate Heatmap from Loaded Data"
                     on_release: app.create_heatmap()
 
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "qqplot": '''
 <QQPlotScreen>:
     name: "qqplot"
     MDBoxLayout:
@@ -787,10 +1166,88 @@ MDNavigationLayout:
                     mode: "rectangle"
                     multiline: True
 
+                MDTextField:
+                    id: distribution
+                    hint_text: "Distribution (default: norm; e.g. expon, logistic, t)"
+                    mode: "rectangle"
+
+                MDTextField:
+                    id: shape_params
+                    hint_text: "Shape Parameters (comma-separated, e.g. 5 for t)"
+                    mode: "rectangle"
+
                 MDRaisedButton:
                     text: "Generate Q-Q Plot"
                     on_release: app.create_qqplot()
 
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "violin": '''
+<ViolinPlotScreen>:
+    name: "violin"
+    MDBoxLayout:
+        orientation: 'vertical'
+        
+        MDTopAppBar:
+            title: "Violin Plot"
+            elevation: 4
+            left_action_items: [["menu", lambda x: app.root.ids.nav_drawer.set_state("open")]]
+
+        ScrollView:
+            MDBoxLayout:
+                orientation: 'vertical'
+                padding: dp(20)
+                spacing: dp(15)
+                size_hint_y: None
+                height: self.minimum_height
+
+                MDCard:
+                    orientation: "vertical"
+                    padding: dp(15)
+                    spacing: dp(10)
+                    size_hint_y: None
+                    height: self.minimum_height
+                    elevation: 1
+                    
+                    MDLabel:
+                        text: "Use Loaded Data"
+                        font_style: "Subtitle1"
+                        size_hint_y: None
+                        height: self.texture_size[1]
+                    
+                    MDRaisedButton:
+                        text: "Fill Data from Column"
+                        on_release: app.show_column_selector("violin", "data")
+
+                MDTextField:
+                    id: data
+                    hint_text: "Data (comma-separated, separate groups with ';')"
+                    mode: "rectangle"
+                    multiline: True
+
+                MDTextField:
+                    id: group_labels
+                    hint_text: "Group Labels (comma-separated, optional)"
+                    mode: "rectangle"
+
+                MDTextField:
+                    id: title
+                    hint_text: "Plot Title"
+                    mode: "rectangle"
+
+                MDRaisedButton:
+                    text: "Generate Violin Plot"
+                    on_release: app.create_violin_plot()
+
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "descriptive": '''
 <DescriptiveStatsScreen>:
     name: "descriptive"
     MDBoxLayout:
@@ -837,13 +1294,18 @@ MDNavigationLayout:
                     text: "Calculate Statistics"
                     on_release: app.calculate_descriptive_stats()
 
+                TaskStatus:
+                    id: task_status
+                    task_name: "descriptive"
+
                 MDLabel:
                     id: results
                     text: ""
                     font_name: "RobotoMono-Regular"
                     size_hint_y: None
                     height: self.texture_size[1]
-
+''',
+    "correlation": '''
 <CorrelationScreen>:
     name: "correlation"
     MDBoxLayout:
@@ -906,13 +1368,18 @@ MDNavigationLayout:
                     text: "Calculate Correlation"
                     on_release: app.calculate_correlation()
 
+                TaskStatus:
+                    id: task_status
+                    task_name: "correlation"
+
                 MDLabel:
                     id: results
                     text: ""
                     font_name: "RobotoMono-Regular"
                     size_hint_y: None
                     height: self.texture_size[1]
-
+''',
+    "regression": '''
 <RegressionScreen>:
     name: "regression"
     MDBoxLayout:
@@ -975,6 +1442,10 @@ MDNavigationLayout:
                     text: "Perform Regression"
                     on_release: app.perform_regression()
 
+                TaskStatus:
+                    id: task_status
+                    task_name: "regression"
+
                 MDLabel:
                     id: results
                     text: ""
@@ -982,6 +1453,12 @@ MDNavigationLayout:
                     size_hint_y: None
                     height: self.texture_size[1]
 
+                PlotWidget:
+                    id: plot
+                    size_hint_y: None
+                    height: dp(480)
+''',
+    "hypothesis": '''
 <HypothesisTestScreen>:
     name: "hypothesis"
     MDBoxLayout:
@@ -1036,13 +1513,93 @@ MDNavigationLayout:
                     text: "Run Two-Sample T-Test"
                     on_release: app.run_two_sample_ttest()
 
+                TaskStatus:
+                    id: task_status
+                    task_name: "hypothesis"
+
                 MDLabel:
                     id: results
                     text: ""
                     font_name: "RobotoMono-Regular"
                     size_hint_y: None
                     height: self.texture_size[1]
-'''
+''',
+    "diagnostics": '''
+<DiagnosticsScreen>:
+    name: "diagnostics"
+    on_enter: app.refresh_diagnostics()
+    MDBoxLayout:
+        orientation: 'vertical'
+        
+        MDTopAppBar:
+            title: "Diagnostics"
+            elevation: 4
+            left_action_items: [["menu", lambda x: app.root.ids.nav_drawer.set_state("open")]]
+
+        ScrollView:
+            MDBoxLayout:
+                orientation: 'vertical'
+                padding: dp(20)
+                spacing: dp(15)
+                size_hint_y: None
+                height: self.minimum_height
+
+                MDLabel:
+                    text: "Time spent per handler, split into parsing, loading, computation and rendering"
+                    theme_text_color: "Secondary"
+                    size_hint_y: None
+                    height: self.texture_size[1]
+
+                MDBoxLayout:
+                    orientation: "horizontal"
+                    spacing: dp(10)
+                    size_hint_y: None
+                    height: dp(40)
+
+                    MDRaisedButton:
+                        text: "Refresh"
+                        on_release: app.refresh_diagnostics()
+
+                    MDRaisedButton:
+                        text: "Clear"
+                        on_release: app.clear_diagnostics()
+
+                MDSwitch:
+                    id: track_memory
+                    active: False
+                    pos_hint: {"center_x": 0.5}
+                    on_active: app.set_memory_tracking(self.active)
+
+                MDLabel:
+                    text: "Track Peak Memory per Engine Call (slows computation)"
+                    pos_hint: {"center_x": 0.5}
+
+                MDCard:
+                    orientation: "vertical"
+                    padding: dp(15)
+                    spacing: dp(10)
+                    size_hint_y: None
+                    height: self.minimum_height
+                    elevation: 1
+
+                    MDTextField:
+                        id: trace_path
+                        hint_text: "Chrome trace file (e.g. trace.json)"
+                        text: "trace.json"
+                        mode: "rectangle"
+
+                    MDRaisedButton:
+                        text: "Export Chrome Trace"
+                        on_release: app.export_trace(trace_path.text)
+
+                MDLabel:
+                    id: results
+                    text: ""
+                    font_name: "RobotoMono-Regular"
+                    size_hint_y: None
+                    height: self.texture_size[1]
+''',
+}
 
 
 class ContentNavigationDrawer(MDBoxLayout):
@@ -1072,14 +1629,130 @@ class LineChartScreen(MDScreen):
 
 class StatisticalApp(MDApp):
     dialog = None
-    loaded_data = None  # Store loaded DataFrame
+    active_dataset = None  # Name of the workspace dataset the screens work on
+    missing_index = None  # Null bitmaps of loaded_data, built once at load
+    missing_view = None  # Lazily filled view applied when columns are used
+    filter_expression = ""  # Filter expression applied to column fills, category aggregation and the heatmap
+    _engine_cache = None
+    _render_cache = None
+    _task_executor = None
+    _column_index = None
+    _workspace = None
+    _filter_masks = None
+    column_menu = None
+    dataset_menu = None
+
+    @property
+    def engine_cache(self):
+        """Memoized statistics engine calls, created on first use (also from worker threads)"""
+        with _engine_cache_lock:
+            if StatisticalApp._engine_cache is None:
+                StatisticalApp._engine_cache = result_cache.ResultCache(max_bytes=RESULT_CACHE_BYTES,
+                                                                        disk_dir=RESULT_CACHE_DIR)
+        return StatisticalApp._engine_cache
+
+    @property
+    def render_cache(self):
+        """Rendered chart images, created on first use"""
+        if StatisticalApp._render_cache is None:
+            StatisticalApp._render_cache = result_cache.ResultCache(max_bytes=RENDER_CACHE_BYTES,
+                                                                    disk_dir=RENDER_CACHE_DIR)
+        return StatisticalApp._render_cache
+
+    @property
+    def workspace(self):
+        """Loaded datasets by name, spilled to disk beyond WORKSPACE_MEMORY_BYTES"""
+        if self._workspace is None:
+            self._workspace = workspace.Workspace(memory_limit=WORKSPACE_MEMORY_BYTES,
+                                                  spill_dir=WORKSPACE_SPILL_DIR)
+        return self._workspace
+
+    @property
+    def loaded_data(self):
+        """The active dataset, reloaded from disk if it was spilled"""
+        if self.active_dataset is None:
+            return None
+        return self.workspace.get(self.active_dataset)
+
+    @property
+    def filter_masks(self):
+        """Row masks of filter expressions, cached per dataset version"""
+        if self._filter_masks is None:
+            self._filter_masks = row_filter.MaskCache()
+        return self._filter_masks
+
+    def filtered(self, source):
+        """Apply the row filter to the active dataset or a view of it"""
+        if source is None or not self.filter_expression:
+            return source
+        mask = self.filter_masks.mask(self.active_dataset, self.workspace.version(self.active_dataset),
+                                      self.loaded_data, self.filter_expression)
+        return row_filter.FilteredView(source, mask, self.filter_expression)
+
+    @property
+    def data_view(self):
+        """The rows and values columns are taken from: missing value handling, then the row filter"""
+        return self.filtered(self.missing_view if self.missing_view is not None else self.loaded_data)
+
+    @property
+    def task_executor(self):
+        """Worker pool for analysis handlers, delivering results on the Kivy event loop"""
+        if self._task_executor is None:
+            self._task_executor = TaskExecutor(
+                max_workers=ANALYSIS_WORKERS,
+                dispatch=lambda callback: Clock.schedule_once(lambda dt: callback()))
+        return self._task_executor
 
     def build(self):
         self.theme_cls.theme_style = "Light"
         self.theme_cls.primary_palette = "Indigo"
-        return Builder.load_string(KV)
+        with profiler.phase("build KV tree"):
+            return Builder.load_string(KV)
+
+    def on_start(self):
+        profiler.mark("app started")
+        if os.environ.get('STATAPP_TRACK_MEMORY') == '1':
+            memory_budget.tracker.enabled = True
+        Clock.schedule_once(self._on_first_frame)
+
+    def _on_first_frame(self, dt):
+        profiler.mark("first frame")
+        warm_up(WARM_UP_MODULES, on_done=self._log_startup_report)
+        if PREBUILD_SCREENS:
+            Clock.schedule_once(self._prebuild_next_screen, 1.0)
+
+    def get_screen(self, name):
+        """Return a screen, building it and loading its KV rule the first time"""
+        screen_manager = self.root.ids.screen_manager
+        if not screen_manager.has_screen(name):
+            with profiler.phase(f"build screen {name}"):
+                Builder.load_string(SCREEN_KV[name])
+                screen_manager.add_widget(Factory.get(SCREEN_CLASSES[name])())
+        return screen_manager.get_screen(name)
+
+    def show_screen(self, name):
+        self.get_screen(name)
+        self.root.ids.screen_manager.current = name
+
+    def _prebuild_next_screen(self, dt):
+        # One screen per idle slot keeps each frame short
+        for name in SCREEN_CLASSES:
+            if not self.root.ids.screen_manager.has_screen(name):
+                self.get_screen(name)
+                Clock.schedule_once(self._prebuild_next_screen, 0.1)
+                return
+
+    def _log_startup_report(self):
+        report = profiler.report()
+        for line in report.splitlines():
+            Logger.info(f"Startup: {line}")
+        if os.environ.get('STATAPP_STARTUP_REPORT') == '1':
+            print(report)
 
     def show_dialog(self, title, message):
+        from kivymd.uix.button import MDRaisedButton
+        from kivymd.uix.dialog import MDDialog
+
         if self.dialog:
             self.dialog.dismiss()
         self.dialog = MDDialog(
@@ -1092,44 +1765,148 @@ class StatisticalApp(MDApp):
         self.dialog.open()
 
     # Data Management
+    @traced('handler')
     def load_data_file(self, file_path):
         try:
-            self.loaded_data = read_data_file(file_path)
-            preview = preview_data(self.loaded_data)
-            
-            screen = self.root.ids.screen_manager.get_screen("dataview")
-            screen.ids.data_preview.text = preview
-            
-            self.show_dialog("Success", f"Loaded {len(self.loaded_data)} rows successfully!")
+            df = utils.read_data_file(file_path)
+            name = self.workspace.name_for(file_path.strip())
+            self.workspace.add(name, df, source=file_path.strip())
+            self.activate_dataset(name)
+            self.show_dialog("Success", f"Loaded {len(df)} rows successfully!")
         except Exception as e:
             self.show_dialog("Error", str(e))
 
+    @traced('handler')
+    def activate_dataset(self, name):
+        """Make a workspace dataset the one analyses and column pickers use"""
+        if self.dataset_menu is not None:
+            self.dataset_menu.dismiss()
+        try:
+            self.workspace.get(name)
+            self.active_dataset = name
+            self.missing_index = self.workspace.missing_index(name)
+            self.missing_view = None
+            self.filter_expression = ""
+            self._column_index = None
+
+            screen = self.get_screen("dataview")
+            screen.ids.row_filter.text = ""
+            screen.ids.dataset_button.text = f"Dataset: {name[:20]}"
+            self.refresh_data_preview()
+        except Exception as e:
+            self.show_dialog("Error", str(e))
+
+    def refresh_data_preview(self):
+        df = self.loaded_data
+        preview = ""
+        if self.filter_expression:
+            preview += f"Row filter: {self.filter_expression} ({len(self.filtered(df))} of {len(df)} rows)\n\n"
+        preview += utils.preview_data(df)
+        preview += "\n\n" + self.missing_index.summary()
+        preview += "\n\n" + self.workspace.summary()
+        self.get_screen("dataview").ids.data_preview.text = preview
+
+    @traced('handler')
+    def apply_row_filter(self, expression):
+        """Restrict column fills, category aggregation and the heatmap to the rows matching a filter expression"""
+        try:
+            if self.loaded_data is None:
+                raise ValueError("No data loaded. Please load data first.")
+
+            expression = row_filter.normalize_expression(expression)
+            if expression:
+                # Evaluate now so a bad expression is reported here rather than on first use
+                mask = self.filter_masks.mask(self.active_dataset, self.workspace.version(self.active_dataset),
+                                              self.loaded_data, expression)
+                if not mask.any():
+                    raise ValueError(f"No rows match the filter: {expression}")
+            self.filter_expression = expression
+            self.get_screen("dataview").ids.row_filter.text = expression
+            self.refresh_data_preview()
+        except Exception as e:
+            self.show_dialog("Error", str(e))
+
+    def show_dataset_menu(self, caller):
+        """Show the loaded datasets, most recently used first"""
+        from kivymd.uix.menu import MDDropdownMenu
+
+        if not len(self.workspace):
+            self.show_dialog("Error", "No data loaded. Please load a data file first.")
+            return
+
+        items = [{"viewclass": "OneLineListItem",
+                  "text": f"{item['name']} ({item['rows']} x {item['columns']}"
+                          f"{'' if item['in_memory'] else ', on disk'})",
+                  "on_release": lambda name=item['name']: self.activate_dataset(name)}
+                 for item in self.workspace.info()]
+        self.dataset_menu = MDDropdownMenu(caller=caller, items=items, width_mult=6)
+        self.dataset_menu.open()
+
+    @traced('handler')
+    def apply_missing_value_handling(self, method, fill_text):
+        """Set up a lazily filled view used whenever a column is pulled into a field"""
+        try:
+            if self.loaded_data is None:
+                raise ValueError("No data loaded. Please load data first.")
+
+            method = method.strip().lower() or 'drop'
+            if method == 'none':
+                self.missing_view = None
+                self.show_dialog("Missing Values", "Columns will be used as loaded.")
+                return
+
+            fill_value = None
+            if fill_text.strip():
+                try:
+                    fill_value = float(fill_text)
+                except ValueError:
+                    fill_value = fill_text.strip()
+
+            self.missing_view = missing_values.FilledView(self.loaded_data, method, fill_value, index=self.missing_index)
+            affected = self.missing_index.columns_with_missing()
+            self.show_dialog("Missing Values",
+                             f"Method '{method}' will be applied to {len(affected)} column(s) when they are used.")
+        except Exception as e:
+            self.show_dialog("Error", str(e))
+
+    @property
+    def column_index(self):
+        """Searchable index of the loaded data's columns, built once per dataset"""
+        if self._column_index is None and self.loaded_data is not None:
+            self._column_index = column_index.ColumnIndex(self.loaded_data)
+        return self._column_index
+
     def show_column_selector(self, screen_name, field_id):
-        """Show a dialog to select a column from loaded data"""
+        """Show a searchable dialog to select a column from loaded data"""
+        from kivymd.uix.dialog import MDDialog
+        from column_selector import ColumnSelector
+
         if self.loaded_data is None:
             self.show_dialog("Error", "No data loaded. Please load data from Data View first.")
             return
-        
-        # Create menu items for each column
-        menu_items = []
-        for col in self.loaded_data.columns:
-            menu_items.append({
-                "text": col,
-                "viewclass": "OneLineListItem",
-                "on_release": lambda x=col: self.populate_field_from_column(screen_name, field_id, x)
-            })
-        
-        # Create and show dropdown menu
-        screen = self.root.ids.screen_manager.get_screen(screen_name)
-        field = screen.ids[field_id]
-        
-        self.column_menu = MDDropdownMenu(
-            caller=field,
-            items=menu_items,
-            width_mult=4,
-        )
+
+        field = (screen_name, field_id)
+        if field in COLUMN_NAME_FIELDS:
+            selector = ColumnSelector(
+                index=self.column_index,
+                kind=COLUMN_NAME_FIELDS[field],
+                select_callback=lambda col: self.set_column_name(screen_name, field_id, col),
+            )
+        else:
+            selector = ColumnSelector(
+                index=self.column_index,
+                kind_only=field not in LABEL_FIELDS,
+                select_callback=lambda col: self.populate_field_from_column(screen_name, field_id, col),
+            )
+        self.column_menu = MDDialog(title="Select Column", type="custom", content_cls=selector)
         self.column_menu.open()
 
+    def set_column_name(self, screen_name, field_id, column_name):
+        """Put a chosen column's name into a text field"""
+        self.get_screen(screen_name).ids[field_id].text = str(column_name)
+        if self.column_menu is not None:
+            self.column_menu.dismiss()
+
     def populate_field_from_column(self, screen_name, field_id, column_name):
         """Populate a text field with data from a specific column"""
         try:
@@ -1141,29 +1918,89 @@ class StatisticalApp(MDApp):
                 self.show_dialog("Error", f"Column '{column_name}' not found.")
                 return
             
-            # Get the data from the column
-            column_data = self.loaded_data[column_name].tolist()
+            # Get the data from the column, with missing values handled and rows filtered if requested
+            column_data = self.data_view[column_name].tolist()
             
             # Convert to comma-separated string
             data_string = ", ".join([str(val) for val in column_data])
             
             # Set the field text
-            screen = self.root.ids.screen_manager.get_screen(screen_name)
+            screen = self.get_screen(screen_name)
             field = screen.ids[field_id]
             field.text = data_string
             
-            # Close the menu
-            if hasattr(self, 'column_menu'):
+            # Close the selector
+            if self.column_menu is not None:
                 self.column_menu.dismiss()
             
         except Exception as e:
             self.show_dialog("Error", str(e))
 
 
+    @traced('handler')
+    def aggregate_categories(self, screen_name):
+        """Fill a bar or pie chart from counts or sums/means per category of the loaded data"""
+        try:
+            if self.loaded_data is None:
+                raise ValueError("No data loaded. Please load data from Data View first.")
+            
+            screen = self.get_screen(screen_name)
+            category_column = screen.ids.category_column.text.strip()
+            value_column = screen.ids.value_column.text.strip() or None
+            agg = screen.ids.aggregation.text.strip().lower() or 'count'
+            top_k = int(screen.ids.top_k.text) if screen.ids.top_k.text.strip() else 10
+            
+            labels, values = utils.aggregate_by_category(self.filtered(self.loaded_data), category_column,
+                                                   value_column, agg, top_k)
+            
+            # Labels go through the comma-separated fields, so commas inside them are dropped.
+            # Values are written with full precision and the chart is drawn from the arrays.
+            labels = [label.replace(",", " ") for label in labels]
+            label_text = ", ".join(labels)
+            value_text = ", ".join(f"{v:.17g}" for v in values)
+            if screen_name == "bar":
+                screen.ids.x_values.text = label_text
+                screen.ids.y_values.text = value_text
+                if not screen.ids.x_label.text:
+                    screen.ids.x_label.text = category_column
+                if not screen.ids.y_label.text:
+                    screen.ids.y_label.text = f"{agg} of {value_column}" if value_column and agg != 'count' else "count"
+                self.draw_bar_graph(screen, labels, list(values))
+            else:
+                screen.ids.pie_values.text = value_text
+                screen.ids.pie_labels.text = label_text
+                self.render_chart(screen, "pie", (list(values), labels),
+                                  lambda ax: charts.draw_pie(ax, list(values), labels))
+        except Exception as e:
+            self.show_dialog("Error", str(e))
+
     # Basic Charts
+    def render_chart(self, screen, chart_type, inputs, draw):
+        """
+        Show a chart on the screen's in-app plot through the render cache.
+        The key covers the chart type, plot size and every input that affects the
+        image (data and styling); draw(ax) only runs when no cached image exists.
+        """
+        plot = screen.ids.plot
+        with tracing.span("render cache lookup", 'render'):
+            key = result_cache.fingerprint(chart_type, tuple(plot.size), *inputs)
+            cached = self.render_cache.get(key)
+        if cached is not None:
+            with tracing.span("show cached image", 'render'):
+                pixels, size = cached
+                plot.show_image(pixels, size)
+            return
+
+        with tracing.span(f"draw {chart_type}", 'render'):
+            draw(plot.new_axes())
+        with tracing.span("rasterize", 'render'):
+            plot.refresh()
+            self.render_cache.put(key, plot.snapshot())
+
+    @traced('handler')
     def create_bar_graph(self):
         try:
-            screen = self.root.ids.screen_manager.get_screen("bar")
+            screen = self.get_screen("bar")
             x_text = screen.ids.x_values.text
             y_text = screen.ids.y_values.text
             
@@ -1171,26 +2008,27 @@ class StatisticalApp(MDApp):
                 raise ValueError("Please enter X and Y values.")
 
             x = [i.strip() for i in x_text.split(",")]
-            y = parse_numeric_data(y_text)
+            y = utils.parse_numeric_data(y_text)
 
             if len(x) != len(y):
                 raise ValueError("X and Y must be the same length.")
 
-            plt.figure(figsize=(8, 6))
-            plt.bar(x, y, color='#3F51B5', edgecolor='black', alpha=0.7)
-            plt.title(screen.ids.graph_title.text or "Bar Graph", fontsize=14, fontweight='bold')
-            plt.xlabel(screen.ids.x_label.text or "X Axis")
-            plt.ylabel(screen.ids.y_label.text or "Y Axis")
-            plt.grid(axis='y', alpha=0.3)
-            plt.tight_layout()
-            plt.show()
+            self.draw_bar_graph(screen, x, y)
         except Exception as e:
             self.show_dialog("Input Error", str(e))
 
+    def draw_bar_graph(self, screen, x, y):
+        title = screen.ids.graph_title.text or "Bar Graph"
+        x_label = screen.ids.x_label.text or "X Axis"
+        y_label = screen.ids.y_label.text or "Y Axis"
+        self.render_chart(screen, "bar", (x, y, title, x_label, y_label),
+                          lambda ax: charts.draw_bar(ax, x, y, title=title, xlabel=x_label, ylabel=y_label))
+
+    @traced('handler')
     def create_pie_chart(self):
         try:
-            screen = self.root.ids.screen_manager.get_screen("pie")
-            values = parse_numeric_data(screen.ids.pie_values.text)
+            screen = self.get_screen("pie")
+            values = utils.parse_numeric_data(screen.ids.pie_values.text)
             labels_text = screen.ids.pie_labels.text
             
             if not values:
@@ -1199,103 +2037,106 @@ class StatisticalApp(MDApp):
             labels = [l.strip() for l in labels_text.split(",")] if labels_text else [str(v) for v in values]
             labels = labels[:len(values)]
 
-            plt.figure(figsize=(7, 7))
-            plt.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, 
-                   colors=sns.color_palette("Set2"))
-            plt.axis('equal')
-            plt.title("Pie Chart", fontsize=14, fontweight='bold')
-            plt.tight_layout()
-            plt.show()
+            self.render_chart(screen, "pie", (values, labels),
+                              lambda ax: charts.draw_pie(ax, values, labels))
         except Exception as e:
             self.show_dialog("Input Error", str(e))
 
+    @traced('handler')
     def create_histogram(self):
         try:
-            screen = self.root.ids.screen_manager.get_screen("histogram")
-            data = parse_numeric_data(screen.ids.raw_data.text)
-            bins_text = screen.ids.bins.text
+            screen = self.get_screen("histogram")
+            grouped_text = screen.ids.grouped_data.text
+            bins_text = screen.ids.bins.text.strip().lower()
             
-            if not data:
-                raise ValueError("Please enter data.")
+            if grouped_text.strip():
+                intervals, frequencies = utils.parse_grouped_data(grouped_text)
+                data = None
+                hist = engine.HistogramEngine.from_grouped(intervals, frequencies)
+            else:
+                data = utils.parse_numeric_data(screen.ids.raw_data.text)
+                if not data:
+                    raise ValueError("Please enter data.")
+                bins = int(bins_text) if bins_text.isdigit() else (bins_text or 'auto')
+                hist = self.compute(engine.HistogramEngine.compute, data, bins)
             
-            bins = int(bins_text) if bins_text else 10
-
-            plt.figure(figsize=(8, 6))
-            plt.hist(data, bins=bins, color='#FF9800', edgecolor='black', alpha=0.7)
-            plt.title("Histogram", fontsize=14, fontweight='bold')
-            plt.xlabel("Value")
-            plt.ylabel("Frequency")
-            plt.grid(axis='y', alpha=0.3)
-            plt.tight_layout()
-            plt.show()
+            grouped_stats = engine.HistogramEngine.grouped_statistics(hist)
+            screen.ids.results.text = engine.DescriptiveStats.format_results(grouped_stats).replace(
+                "Descriptive Statistics:", f"Binned Statistics ({len(hist['counts'])} bins, rule: {hist['rule']}):")
+
+            show_density = data is not None and screen.ids.show_density.active
+
+            def draw(ax):
+                kde = self.compute(engine.KernelDensity.estimate, data) if show_density else None
+                charts.draw_histogram(ax, hist, kde)
+
+            self.render_chart(screen, "histogram", (hist['edges'], hist['counts'], show_density,
+                                                   data if show_density else None), draw)
         except Exception as e:
             self.show_dialog("Input Error", str(e))
 
+    @traced('handler')
     def create_line_chart(self):
         try:
-            screen = self.root.ids.screen_manager.get_screen("line")
+            screen = self.get_screen("line")
             slope_text = screen.ids.slope.text
             intercept_text = screen.ids.intercept.text
             x_points_text = screen.ids.x_points.text
             y_points_text = screen.ids.y_points.text
 
-            plt.figure(figsize=(8, 6))
-
             if slope_text and intercept_text:
                 m = float(slope_text)
                 c = float(intercept_text)
-                x = np.linspace(-10, 10, 100)
-                y = m * x + c
-                plt.plot(x, y, label=f"y = {m}x + {c}", color="#3F51B5", linewidth=2)
-                plt.title(f"Line: y = {m}x + {c}", fontsize=14, fontweight='bold')
+                self.render_chart(screen, "line_equation", (m, c),
+                                  lambda ax: charts.draw_line_equation(ax, m, c))
             
             elif x_points_text and y_points_text:
-                x = parse_numeric_data(x_points_text)
-                y = parse_numeric_data(y_points_text)
+                x = utils.parse_numeric_data(x_points_text)
+                y = utils.parse_numeric_data(y_points_text)
                 if len(x) != len(y):
                     raise ValueError("X and Y points must have same length")
-                plt.plot(x, y, marker='o', linestyle='-', color='#9C27B0', linewidth=2)
-                plt.title("Line Chart", fontsize=14, fontweight='bold')
+
+                def draw(ax):
+                    # Draw only as many vertices as the plot has pixels to show
+                    x_plot, y_plot = downsampling.downsample(x, y, max(int(screen.ids.plot.width), 100))
+                    charts.draw_line_points(ax, x_plot, y_plot, markers=len(x_plot) == len(x))
+
+                self.render_chart(screen, "line_points", (x, y), draw)
             
             else:
                 raise ValueError("Enter Slope/Intercept OR X/Y Points")
 
-            plt.xlabel("X Axis")
-            plt.ylabel("Y Axis")
-            plt.grid(True, alpha=0.3)
-            plt.legend()
-            plt.tight_layout()
-            plt.show()
-
         except Exception as e:
             self.show_dialog("Input Error", str(e))
 
     # Advanced Visualizations
+    @traced('handler')
     def create_boxplot(self):
         try:
-            screen = self.root.ids.screen_manager.get_screen("boxplot")
-            data = parse_numeric_data(screen.ids.data.text)
+            screen = self.get_screen("boxplot")
+            groups = [utils.parse_numeric_data(part) for part in screen.ids.data.text.split(";")]
+            groups = [g for g in groups if g]
             
-            if not data:
+            if not groups:
                 raise ValueError("Please enter data.")
 
-            plt.figure(figsize=(8, 6))
-            plt.boxplot(data, vert=True, patch_artist=True,
-                       boxprops=dict(facecolor='#4CAF50', alpha=0.7),
-                       medianprops=dict(color='red', linewidth=2))
-            plt.title(screen.ids.title.text or "Box Plot", fontsize=14, fontweight='bold')
-            plt.ylabel("Value")
-            plt.grid(axis='y', alpha=0.3)
-            plt.tight_layout()
-            plt.show()
+            title = screen.ids.title.text or "Box Plot"
+
+            def draw(ax):
+                summaries = [self.compute(engine.BoxPlotSummary.summarize, group, label=str(i + 1))
+                             for i, group in enumerate(groups)]
+                charts.draw_boxplot(ax, summaries, title=title)
+
+            self.render_chart(screen, "boxplot", (title, *groups), draw)
         except Exception as e:
             self.show_dialog("Input Error", str(e))
 
+    @traced('handler')
     def create_scatterplot(self):
         try:
-            screen = self.root.ids.screen_manager.get_screen("scatter")
-            x = parse_numeric_data(screen.ids.x_data.text)
-            y = parse_numeric_data(screen.ids.y_data.text)
+            screen = self.get_screen("scatter")
+            x = utils.parse_numeric_data(screen.ids.x_data.text)
+            y = utils.parse_numeric_data(screen.ids.y_data.text)
             
             if not x or not y:
                 raise ValueError("Please enter both X and Y data.")
@@ -1303,94 +2144,188 @@ class StatisticalApp(MDApp):
             if len(x) != len(y):
                 raise ValueError("X and Y must have same length.")
 
-            plt.figure(figsize=(8, 6))
-            plt.scatter(x, y, alpha=0.6, s=100, color='#2196F3', edgecolors='black')
-            
-            if screen.ids.show_regression.active:
-                result = RegressionAnalysis.linear_regression(x, y)
-                plt.plot(x, result['predictions'], color='red', linewidth=2, 
-                        label=f"{result['equation']} (R²={result['r_squared']:.3f})")
-                plt.legend()
-            
-            plt.title("Scatter Plot", fontsize=14, fontweight='bold')
-            plt.xlabel("X")
-            plt.ylabel("Y")
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.show()
+            show_regression = screen.ids.show_regression.active
+
+            def draw(ax):
+                result = None
+                if show_regression:
+                    result = self.compute(engine.RegressionAnalysis.linear_regression, x, y, full_output=False)
+                # Density cells of about 4 pixels keep the cost proportional to the plot area
+                plot = screen.ids.plot
+                grid_shape = (max(int(plot.width) // 4, 50), max(int(plot.height) // 4, 50))
+                charts.draw_scatter(ax, x, y, regression=result, grid_shape=grid_shape)
+
+            self.render_chart(screen, "scatter", (x, y, show_regression), draw)
         except Exception as e:
             self.show_dialog("Input Error", str(e))
 
+    @traced('handler')
     def create_heatmap(self):
         try:
             if self.loaded_data is None:
                 raise ValueError("Please load data first from Data View")
             
-            numeric_cols = get_numeric_columns(self.loaded_data)
+            numeric_cols = utils.get_numeric_columns(self.loaded_data)
             if len(numeric_cols) < 2:
                 raise ValueError("Need at least 2 numeric columns for correlation")
             
-            corr_matrix = self.loaded_data[numeric_cols].corr()
+            corr_matrix = self.compute(engine.CorrelationAnalysis.correlation_matrix,
+                                       self.data_view[numeric_cols])
+            
+            screen = self.get_screen("heatmap")
+            if screen.ids.cluster.active:
+                order = self.compute(engine.CorrelationAnalysis.cluster_order, corr_matrix)
+                corr_matrix = corr_matrix.iloc[order, order]
+            
+            tiles = charts.heatmap_tiles(len(numeric_cols))
+            tile = None
+            if screen.ids.tile.text.strip():
+                tile_number = int(screen.ids.tile.text)
+                if not 1 <= tile_number <= len(tiles):
+                    raise ValueError(f"Tile must be between 1 and {len(tiles)}")
+                tile = tiles[tile_number - 1]
+            screen.ids.tile_info.text = f"{len(numeric_cols)} columns, {len(tiles)} tile(s)"
             
-            plt.figure(figsize=(10, 8))
-            sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', center=0,
-                       square=True, linewidths=1, cbar_kws={"shrink": 0.8})
-            plt.title("Correlation Heatmap", fontsize=14, fontweight='bold')
-            plt.tight_layout()
-            plt.show()
+            self.render_chart(screen, "heatmap", (corr_matrix, tile),
+                              lambda ax: charts.draw_heatmap(ax, corr_matrix, tile=tile))
         except Exception as e:
             self.show_dialog("Error", str(e))
 
+    @traced('handler')
     def create_qqplot(self):
         try:
-            screen = self.root.ids.screen_manager.get_screen("qqplot")
-            data = parse_numeric_data(screen.ids.data.text)
+            screen = self.get_screen("qqplot")
+            data = utils.parse_numeric_data(screen.ids.data.text)
             
             if not data:
                 raise ValueError("Please enter data.")
 
-            from scipy import stats as sp_stats
-            plt.figure(figsize=(8, 6))
-            sp_stats.probplot(data, dist="norm", plot=plt)
-            plt.title("Q-Q Plot (Normality Test)", fontsize=14, fontweight='bold')
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.show()
+            dist = screen.ids.distribution.text.strip() or 'norm'
+            sparams = tuple(utils.parse_numeric_data(screen.ids.shape_params.text))
+            self.render_chart(screen, "qqplot", (data, dist, sparams),
+                              lambda ax: charts.draw_qqplot(ax, self.compute(engine.QQPlot.compute, data, dist, sparams)))
         except Exception as e:
             self.show_dialog("Input Error", str(e))
 
-    # Statistical Analyses
-    def calculate_descriptive_stats(self):
+    @traced('handler')
+    def create_violin_plot(self):
         try:
-            screen = self.root.ids.screen_manager.get_screen("descriptive")
-            data = parse_numeric_data(screen.ids.data.text)
+            screen = self.get_screen("violin")
+            groups = [utils.parse_numeric_data(part) for part in screen.ids.data.text.split(";")]
+            groups = [g for g in groups if g]
             
-            if not data:
+            if not groups:
                 raise ValueError("Please enter data.")
             
-            stats = DescriptiveStats.calculate_all(data)
-            results = DescriptiveStats.format_results(stats)
-            
-            screen.ids.results.text = results
+            labels_text = screen.ids.group_labels.text
+            labels = [l.strip() for l in labels_text.split(",")] if labels_text else []
+            labels += [f"Group {i + 1}" for i in range(len(labels), len(groups))]
+
+            title = screen.ids.title.text or "Violin Plot"
+
+            def draw(ax):
+                kdes = [self.compute(engine.KernelDensity.estimate, group, grid_size=256) for group in groups]
+                charts.draw_violin(ax, groups, kdes, labels, title=title)
+
+            self.render_chart(screen, "violin", (title, labels, *groups), draw)
         except Exception as e:
-            self.show_dialog("Error", str(e))
+            self.show_dialog("Input Error", str(e))
+
+    # Statistical Analyses
+    def compute(self, func, *args, **kwargs):
+        """
+        Statistics engine call through the result cache, timed as a compute span.
+        Calls over the memory budget warn or switch to their low-memory mode.
+        """
+        name = func.__qualname__
+        kwargs, warning = memory_budget.MemoryBudget(MEMORY_BUDGET_BYTES).adjust(name, kwargs, *args)
+        if warning:
+            self.warn(warning)
+        with tracing.span(name, 'compute'), memory_budget.tracker.track(name):
+            return self.engine_cache.call(func, *args, **kwargs)
+
+    def warn(self, message):
+        """Log a warning and show it briefly; safe to call from worker threads"""
+        Logger.warning(f"StatApp: {message}")
+
+        def show(dt):
+            from kivymd.uix.snackbar import Snackbar
+            Snackbar(text=message).open()
+        Clock.schedule_once(show)
+
+    def run_task(self, screen_name, work, on_done, *args, key=None):
+        """
+        Run work(task, *args) on the analysis pool while the screen shows its busy bar.
+        A new task replaces a running one with the same key (the screen name by default).
+        on_done(screen, result) runs on the UI thread; errors open the usual dialog.
+        """
+        screen = self.get_screen(screen_name)
+        status = screen.ids.task_status
+        status.busy, status.progress, status.message = True, 0, "Starting..."
+
+        def still_busy():
+            return any(self.task_executor.is_busy(name) for name in SCREEN_TASKS.get(screen_name, (screen_name,)))
+
+        def progressed(task):
+            status.progress, status.message = task.progress * 100, task.message
+
+        def finished(result):
+            status.busy = still_busy()
+            on_done(screen, result)
+
+        def failed(error):
+            status.busy = still_busy()
+            self.show_dialog("Error", str(error))
+
+        self.task_executor.submit(key or screen_name, traced('handler', work.__name__.strip('_'))(work), *args,
+                                  on_done=finished, on_error=failed, on_progress=progressed)
+
+    def cancel_task(self, screen_name):
+        """Cancel the analyses running for a screen and hide its busy bar"""
+        for name in SCREEN_TASKS.get(screen_name, (screen_name,)):
+            self.task_executor.cancel(name)
+        self.get_screen(screen_name).ids.task_status.busy = False
+
+    def show_results(self, screen, results):
+        screen.ids.results.text = results
+
+    def calculate_descriptive_stats(self):
+        screen = self.get_screen("descriptive")
+        self.run_task("descriptive", self._descriptive_stats_task, self.show_results, screen.ids.data.text)
+
+    def _descriptive_stats_task(self, task, data_text):
+        task.set_progress(0.1, "Parsing data")
+        data = utils.parse_numeric_data(data_text)
+        
+        if not data:
+            raise ValueError("Please enter data.")
+        
+        task.set_progress(0.4, "Calculating")
+        stats = self.compute(engine.DescriptiveStats.calculate_all, data)
+        return engine.DescriptiveStats.format_results(stats)
 
     def calculate_correlation(self):
-        try:
-            screen = self.root.ids.screen_manager.get_screen("correlation")
-            x = parse_numeric_data(screen.ids.x_data.text)
-            y = parse_numeric_data(screen.ids.y_data.text)
-            
-            if not x or not y:
-                raise ValueError("Please enter both X and Y data.")
-            
-            if len(x) != len(y):
-                raise ValueError("X and Y must have same length.")
-            
-            pearson_r, pearson_p = CorrelationAnalysis.pearson(x, y)
-            spearman_r, spearman_p = CorrelationAnalysis.spearman(x, y)
-            
-            results = f"""Correlation Analysis Results:
+        screen = self.get_screen("correlation")
+        self.run_task("correlation", self._correlation_task, self.show_results,
+                      screen.ids.x_data.text, screen.ids.y_data.text)
+
+    def _correlation_task(self, task, x_text, y_text):
+        task.set_progress(0.1, "Parsing data")
+        x = utils.parse_numeric_data(x_text)
+        y = utils.parse_numeric_data(y_text)
+        
+        if not x or not y:
+            raise ValueError("Please enter both X and Y data.")
+        
+        if len(x) != len(y):
+            raise ValueError("X and Y must have same length.")
+        
+        task.set_progress(0.3, "Pearson")
+        pearson_r, pearson_p = self.compute(engine.CorrelationAnalysis.pearson, x, y)
+        task.set_progress(0.6, "Spearman")
+        spearman_r, spearman_p = self.compute(engine.CorrelationAnalysis.spearman, x, y)
+        
+        return f"""Correlation Analysis Results:
 {'='*50}
 Pearson Correlation:
   Coefficient: {pearson_r:.4f}
@@ -1402,25 +2337,31 @@ Spearman Correlation:
   P-value: {spearman_p:.4f}
   Significant: {'Yes' if spearman_p < 0.05 else 'No'}
 """
-            screen.ids.results.text = results
-        except Exception as e:
-            self.show_dialog("Error", str(e))
 
     def perform_regression(self):
-        try:
-            screen = self.root.ids.screen_manager.get_screen("regression")
-            x = parse_numeric_data(screen.ids.x_data.text)
-            y = parse_numeric_data(screen.ids.y_data.text)
-            
-            if not x or not y:
-                raise ValueError("Please enter both X and Y data.")
-            
-            if len(x) != len(y):
-                raise ValueError("X and Y must have same length.")
-            
-            result = RegressionAnalysis.linear_regression(x, y)
-            
-            results = f"""Linear Regression Results:
+        screen = self.get_screen("regression")
+        self.run_task("regression", self._regression_task, self._show_regression,
+                      screen.ids.x_data.text, screen.ids.y_data.text)
+
+    def _regression_task(self, task, x_text, y_text):
+        task.set_progress(0.1, "Parsing data")
+        x = utils.parse_numeric_data(x_text)
+        y = utils.parse_numeric_data(y_text)
+        
+        if not x or not y:
+            raise ValueError("Please enter both X and Y data.")
+        
+        if len(x) != len(y):
+            raise ValueError("X and Y must have same length.")
+        
+        task.set_progress(0.4, "Fitting")
+        result = self.compute(engine.RegressionAnalysis.linear_regression, x, y)
+        return x, y, result
+
+    @traced('handler')
+    def _show_regression(self, screen, fitted):
+        x, y, result = fitted
+        screen.ids.results.text = f"""Linear Regression Results:
 {'='*50}
 Equation: {result['equation']}
 R-squared: {result['r_squared']:.4f}
@@ -1429,62 +2370,96 @@ Intercept: {result['intercept']:.4f}
 P-value: {result['p_value']:.4f}
 Standard Error: {result['std_err']:.4f}
 """
-            screen.ids.results.text = results
-            
+        try:
             # Also show plot
-            plt.figure(figsize=(8, 6))
-            plt.scatter(x, y, alpha=0.6, s=100, color='#2196F3', edgecolors='black', label='Data')
-            plt.plot(x, result['predictions'], color='red', linewidth=2, label='Regression Line')
-            plt.title(f"Linear Regression: {result['equation']}", fontsize=14, fontweight='bold')
-            plt.xlabel("X")
-            plt.ylabel("Y")
-            plt.legend()
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.show()
-            
+            self.render_chart(screen, "regression", (x, y),
+                              lambda ax: charts.draw_scatter(ax, x, y, regression=result,
+                                                             title=f"Linear Regression: {result['equation']}",
+                                                             data_label='Data', line_label='Regression Line'))
         except Exception as e:
             self.show_dialog("Error", str(e))
 
     def run_one_sample_ttest(self):
-        try:
-            screen = self.root.ids.screen_manager.get_screen("hypothesis")
-            data = parse_numeric_data(screen.ids.sample_data.text)
-            pop_mean = float(screen.ids.pop_mean.text)
-            
-            if not data:
-                raise ValueError("Please enter sample data.")
-            
-            result = HypothesisTesting.one_sample_ttest(data, pop_mean)
-            
-            results = f"""One-Sample T-Test Results:
+        screen = self.get_screen("hypothesis")
+        self.run_task("hypothesis", self._one_sample_ttest_task, self.show_results,
+                      screen.ids.sample_data.text, screen.ids.pop_mean.text, key="hypothesis.one_sample")
+
+    def _one_sample_ttest_task(self, task, data_text, pop_mean_text):
+        task.set_progress(0.1, "Parsing data")
+        data = utils.parse_numeric_data(data_text)
+        pop_mean = float(pop_mean_text)
+        
+        if not data:
+            raise ValueError("Please enter sample data.")
+        
+        task.set_progress(0.4, "Testing")
+        result = self.compute(engine.HypothesisTesting.one_sample_ttest, data, pop_mean)
+        
+        return f"""One-Sample T-Test Results:
 {'='*50}
 T-statistic: {result['t_statistic']:.4f}
 P-value: {result['p_value']:.4f}
 Significant (α=0.05): {'Yes' if result['significant'] else 'No'}
 """
-            screen.ids.results.text = results
-        except Exception as e:
-            self.show_dialog("Error", str(e))
 
     def run_two_sample_ttest(self):
-        try:
-            screen = self.root.ids.screen_manager.get_screen("hypothesis")
-            sample1 = parse_numeric_data(screen.ids.sample1.text)
-            sample2 = parse_numeric_data(screen.ids.sample2.text)
-            
-            if not sample1 or not sample2:
-                raise ValueError("Please enter both samples.")
-            
-            result = HypothesisTesting.two_sample_ttest(sample1, sample2)
-            
-            results = f"""Two-Sample T-Test Results:
+        screen = self.get_screen("hypothesis")
+        self.run_task("hypothesis", self._two_sample_ttest_task, self.show_results,
+                      screen.ids.sample1.text, screen.ids.sample2.text, key="hypothesis.two_sample")
+
+    def _two_sample_ttest_task(self, task, sample1_text, sample2_text):
+        task.set_progress(0.1, "Parsing data")
+        sample1 = utils.parse_numeric_data(sample1_text)
+        sample2 = utils.parse_numeric_data(sample2_text)
+        
+        if not sample1 or not sample2:
+            raise ValueError("Please enter both samples.")
+        
+        task.set_progress(0.4, "Testing")
+        result = self.compute(engine.HypothesisTesting.two_sample_ttest, sample1, sample2)
+        
+        return f"""Two-Sample T-Test Results:
 {'='*50}
 T-statistic: {result['t_statistic']:.4f}
 P-value: {result['p_value']:.4f}
 Significant (α=0.05): {'Yes' if result['significant'] else 'No'}
 """
-            screen.ids.results.text = results
+
+    def on_stop(self):
+        if self._task_executor is not None:
+            self._task_executor.shutdown()
+        if self._workspace is not None:
+            self._workspace.close()
+
+    def refresh_diagnostics(self):
+        text = tracing.recorder.summary()
+        if memory_budget.tracker.enabled or memory_budget.tracker.records():
+            text += "\n" + memory_budget.tracker.summary()
+        if self._workspace is not None and len(self._workspace):
+            text += "\n" + self._workspace.summary()
+        if self.loaded_data is not None:
+            text += "\n" + memory_budget.memory_report(self.loaded_data)
+        screen = self.get_screen("diagnostics")
+        screen.ids.track_memory.active = memory_budget.tracker.enabled
+        screen.ids.results.text = text
+
+    def clear_diagnostics(self):
+        tracing.recorder.clear()
+        memory_budget.tracker.clear()
+        self.refresh_diagnostics()
+
+    def set_memory_tracking(self, active):
+        if active:
+            memory_budget.tracker.enabled = True
+        else:
+            memory_budget.tracker.disable()
+
+    def export_trace(self, path):
+        try:
+            if not path:
+                raise ValueError("Please enter a file path.")
+            count = tracing.recorder.export_chrome_trace(path)
+            self.show_dialog("Success", f"Wrote {count} spans to {path}.\nOpen it in chrome://tracing or Perfetto.")
         except Exception as e:
             self.show_dialog("Error", str(e))
 
@@ -0,0 +1,186 @@
+"""
+Memory Accounting Module
+Deep per-column memory reports, opt-in peak tracking of engine calls
+and a memory budget checked before an operation runs
+"""
+
+import threading
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Estimated working set of an engine call as a multiple of its input size
+WORKING_SET_FACTORS = {
+    'DescriptiveStats.calculate_all': 4.0,
+    'CorrelationAnalysis.spearman': 4.0,
+    'CorrelationAnalysis.correlation_matrix': 2.0,
+    'RegressionAnalysis.linear_regression': 3.0,
+    'HypothesisTesting.one_sample_ttest': 2.0,
+    'HypothesisTesting.two_sample_ttest': 2.0,
+    'KernelDensity.estimate': 2.0,
+    'HistogramEngine.compute': 2.0,
+    'BoxPlotSummary.summarize': 3.0,
+    'QQPlot.compute': 3.0,
+}
+DEFAULT_WORKING_SET_FACTOR = 2.0
+
+# Bounded-memory variants used instead when an engine call would exceed the budget
+LOW_MEMORY_OPTIONS = {
+    'BoxPlotSummary.summarize': {'method': 'sketch'},
+    'QQPlot.compute': {'method': 'sketch'},
+    'HistogramEngine.compute': {'chunk_size': 100_000},
+}
+
+
+def format_bytes(n: float) -> str:
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if abs(n) < 1024 or unit == 'GiB':
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def column_memory(df: pd.DataFrame) -> pd.Series:
+    """Deep memory use of each column in bytes, including the Python objects in object columns"""
+    return df.memory_usage(deep=True, index=False)
+
+
+def memory_report(df: pd.DataFrame) -> str:
+    """Format per-column memory use as readable string"""
+    usage = column_memory(df)
+    index_bytes = df.index.memory_usage(deep=True)
+    total = int(usage.sum()) + index_bytes
+    output = f"Memory Usage ({format_bytes(total)} total):\n"
+    output += "="*60 + "\n"
+    for col, nbytes in usage.sort_values(ascending=False).items():
+        share = nbytes / total * 100 if total else 0.0
+        output += f"  {str(col)[:30]:<32}{str(df[col].dtype):<12}{format_bytes(nbytes):>12}{share:>7.1f}%\n"
+    output += f"  {'(index)':<32}{str(df.index.dtype):<12}{format_bytes(index_bytes):>12}\n"
+    return output
+
+
+def input_bytes(*values: Any) -> int:
+    """Approximate size of the arrays, frames and numeric lists passed to an engine call"""
+    total = 0
+    for value in values:
+        if isinstance(value, np.ndarray):
+            total += value.nbytes
+        elif isinstance(value, (pd.DataFrame, pd.Series)):
+            total += int(np.sum(value.memory_usage(index=False)))
+        elif isinstance(value, (list, tuple)):
+            # Each float is converted to an 8-byte array element by the engine
+            total += 8 * len(value)
+    return total
+
+
+class MemoryBudget:
+    """
+    Upper bound on the estimated working set of a single operation.
+    A limit of None disables the check.
+    """
+
+    def __init__(self, limit_bytes: Optional[int] = None):
+        self.limit_bytes = limit_bytes
+
+    @staticmethod
+    def estimate(name: str, *args, **kwargs) -> int:
+        factor = WORKING_SET_FACTORS.get(name, DEFAULT_WORKING_SET_FACTOR)
+        return int(factor * input_bytes(*args, *kwargs.values()))
+
+    def check(self, name: str, *args, **kwargs) -> Tuple[bool, int]:
+        """Whether the call fits the budget, and its estimated working set in bytes"""
+        estimate = self.estimate(name, *args, **kwargs)
+        return self.limit_bytes is None or estimate <= self.limit_bytes, estimate
+
+    def adjust(self, name: str, kwargs: Dict[str, Any], *args) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Return the keyword arguments to call with and a warning, if any.
+        Calls over budget switch to their low-memory variant when one exists
+        and the caller has not chosen a method explicitly.
+        """
+        fits, estimate = self.check(name, *args, **kwargs)
+        if fits:
+            return kwargs, None
+
+        message = (f"{name} needs about {format_bytes(estimate)}, "
+                   f"over the memory budget of {format_bytes(self.limit_bytes)}")
+        options = LOW_MEMORY_OPTIONS.get(name)
+        if options and not set(options) & set(kwargs):
+            return dict(kwargs, **options), message + "; using the low-memory mode."
+        return kwargs, message + "."
+
+
+class MemoryTracker:
+    """
+    Opt-in tracemalloc peaks per operation, kept in a ring buffer.
+    tracemalloc slows allocation-heavy code, so it only runs while enabled.
+    Peaks are process-wide: nested operations are attributed to the outermost one.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.enabled = False
+        self._records = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._active = 0
+
+    @contextmanager
+    def track(self, name: str):
+        """Record the peak traced allocation of a block of work"""
+        if not self.enabled:
+            yield
+            return
+
+        with self._lock:
+            outermost = self._active == 0
+            self._active += 1
+            if outermost:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+                if outermost:
+                    self._records.append((name, tracemalloc.get_traced_memory()[1]))
+                if self._active == 0 and not self.enabled:
+                    tracemalloc.stop()
+
+    def disable(self) -> None:
+        with self._lock:
+            self.enabled = False
+            if self._active == 0 and tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    def records(self) -> List[Tuple[str, int]]:
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def summary(self, recent: int = 20) -> str:
+        """Format the largest and the most recent peaks as readable string"""
+        records = self.records()
+        output = f"Peak Memory per Operation ({len(records)} tracked):\n" + "="*50 + "\n"
+        if not records:
+            return output + ("No operations tracked yet.\n" if self.enabled else "Tracking is off.\n")
+
+        largest: Dict[str, int] = {}
+        for name, peak in records:
+            largest[name] = max(largest.get(name, 0), peak)
+        for name, peak in sorted(largest.items(), key=lambda item: item[1], reverse=True):
+            output += f"{name[:40]:<42}{format_bytes(peak):>12} (max)\n"
+        output += "\nRecent:\n"
+        for name, peak in records[-recent:]:
+            output += f"{name[:40]:<42}{format_bytes(peak):>12}\n"
+        return output
+
+
+tracker = MemoryTracker()
@@ -0,0 +1,200 @@
+"""
+Missing Value Module
+Per-column null bitmaps, lazily filled views and copy-free imputation
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+FILL_METHODS = ('mean', 'median', 'mode', 'constant')
+
+
+class MissingValueIndex:
+    """
+    Null bitmaps for every column of a DataFrame, computed once at load.
+    Each bitmap is bit-packed, so it costs one bit per row and only
+    columns that actually contain missing values keep one.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.n_rows = len(df)
+        self.columns = list(df.columns)
+        self._counts: Dict[str, int] = {}
+        self._bitmaps: Dict[str, np.ndarray] = {}
+
+        for col in self.columns:
+            mask = df[col].isna().to_numpy()
+            count = int(np.count_nonzero(mask))
+            self._counts[col] = count
+            if count:
+                self._bitmaps[col] = np.packbits(mask)
+
+    def counts(self) -> Dict[str, int]:
+        """Missing value count for each column"""
+        return dict(self._counts)
+
+    def columns_with_missing(self) -> List[str]:
+        """Columns that contain at least one missing value"""
+        return [col for col in self.columns if self._counts[col]]
+
+    def has_missing(self, column: Optional[str] = None) -> bool:
+        """Whether a column (or any column) contains missing values"""
+        if column is None:
+            return bool(self._bitmaps)
+        return self._counts.get(column, 0) > 0
+
+    def mask(self, column: str) -> np.ndarray:
+        """Boolean mask of missing rows for a column"""
+        if column not in self._counts:
+            raise KeyError(f"Column '{column}' not found.")
+        bitmap = self._bitmaps.get(column)
+        if bitmap is None:
+            return np.zeros(self.n_rows, dtype=bool)
+        return np.unpackbits(bitmap, count=self.n_rows).view(bool)
+
+    def row_mask(self, columns: Optional[List[str]] = None) -> np.ndarray:
+        """Boolean mask of rows with a missing value in any of the given columns"""
+        packed = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        for col in (columns if columns is not None else self.columns):
+            bitmap = self._bitmaps.get(col)
+            if bitmap is not None:
+                np.bitwise_or(packed, bitmap, out=packed)
+        return np.unpackbits(packed, count=self.n_rows).view(bool)
+
+    def summary(self) -> str:
+        """Format missing value counts as readable string"""
+        missing = self.columns_with_missing()
+        if not missing:
+            return "Missing Values: none"
+        output = "Missing Values:\n"
+        for col in missing:
+            pct = 100.0 * self._counts[col] / self.n_rows
+            output += f"  {col}: {self._counts[col]} ({pct:.1f}%)\n"
+        return output
+
+
+def compute_fill_value(series: pd.Series, method: str, fill_value: Optional[Any] = None) -> Any:
+    """
+    Compute the value used to impute a single column.
+    Returns None when the method does not apply to the column's dtype.
+    """
+    if method == 'constant':
+        if fill_value is None:
+            raise ValueError("A fill value is required for the 'constant' method")
+        return fill_value
+    if method == 'mode':
+        modes = series.mode()
+        return modes.iloc[0] if len(modes) else None
+    if method in ('mean', 'median'):
+        if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            return None
+        return series.mean() if method == 'mean' else series.median()
+    raise ValueError(f"Invalid method: {method}")
+
+
+class FilledView:
+    """
+    Lazily imputed view of a DataFrame.
+    Nothing is copied up front; a column is filled only when it is accessed,
+    and columns without missing values are returned as-is.
+    """
+
+    def __init__(self, df: pd.DataFrame, method: str = 'mean', fill_value: Optional[Any] = None,
+                 index: Optional[MissingValueIndex] = None):
+        if method != 'drop' and method not in FILL_METHODS:
+            raise ValueError(f"Invalid method: {method}")
+        if method == 'constant' and fill_value is None:
+            raise ValueError("A fill value is required for the 'constant' method")
+        self.df = df
+        self.method = method
+        self.fill_value = fill_value
+        self.index = index if index is not None else MissingValueIndex(df)
+        self._fill_values: Dict[str, Any] = {}
+        self._keep_rows: Optional[np.ndarray] = None
+
+    @property
+    def columns(self):
+        return self.df.columns
+
+    def __len__(self) -> int:
+        if self.method == 'drop':
+            return int(np.count_nonzero(self._keep()))
+        return len(self.df)
+
+    def _keep(self) -> np.ndarray:
+        if self._keep_rows is None:
+            self._keep_rows = ~self.index.row_mask()
+        return self._keep_rows
+
+    def kept_rows(self) -> Optional[np.ndarray]:
+        """Boolean mask of the rows the view keeps, or None when it keeps them all"""
+        if self.method == 'drop' and self.index.has_missing():
+            return self._keep()
+        return None
+
+    def fill_value_for(self, column: str) -> Any:
+        """Imputation value for a column, computed on first use"""
+        if column not in self._fill_values:
+            self._fill_values[column] = compute_fill_value(self.df[column], self.method, self.fill_value)
+        return self._fill_values[column]
+
+    def column(self, column: str) -> pd.Series:
+        """Return a column with missing values handled"""
+        series = self.df[column]
+
+        if self.method == 'drop':
+            if not self.index.has_missing():
+                return series
+            return series[self._keep()]
+
+        if not self.index.has_missing(column):
+            return series
+        value = self.fill_value_for(column)
+        if value is None:
+            return series
+        return series.fillna(value)
+
+    def __getitem__(self, column):
+        if isinstance(column, list):
+            return pd.DataFrame({col: self.column(col) for col in column})
+        return self.column(column)
+
+    def materialize(self, inplace: bool = False) -> pd.DataFrame:
+        """Apply the imputation to the whole frame"""
+        return impute(self.df, self.method, self.fill_value, index=self.index, inplace=inplace)
+
+
+def impute(df: pd.DataFrame, method: str = 'drop', fill_value: Optional[Any] = None,
+           index: Optional[MissingValueIndex] = None, inplace: bool = False) -> pd.DataFrame:
+    """
+    Handle missing values column by column.
+
+    With inplace=False the result is a shallow copy: untouched columns share
+    memory with the input (copy-on-write) and only imputed columns are new.
+    With inplace=True the input frame itself is modified and returned.
+    """
+    if method == 'drop':
+        if inplace:
+            df.dropna(inplace=True)
+            return df
+        return df.dropna()
+
+    if method not in FILL_METHODS:
+        raise ValueError(f"Invalid method: {method}")
+    if method == 'constant' and fill_value is None:
+        raise ValueError("A fill value is required for the 'constant' method")
+
+    if index is not None:
+        columns = index.columns_with_missing()
+    else:
+        columns = [col for col in df.columns if df[col].hasnans]
+
+    target = df if inplace else df.copy(deep=False)
+    for col in columns:
+        value = compute_fill_value(df[col], method, fill_value)
+        if value is not None:
+            target[col] = target[col].fillna(value)
+    return target
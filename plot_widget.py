@@ -0,0 +1,99 @@
+"""
+Plot Widget Module
+Renders matplotlib figures off-screen with Agg and shows them as a Kivy texture
+"""
+
+from kivy.clock import Clock
+from kivy.graphics.texture import Texture
+from kivy.uix.image import Image
+
+
+class PlotWidget(Image):
+    """
+    Image widget backed by a single reusable matplotlib Figure.
+    Each render clears the figure, draws into a fresh Axes and blits the
+    Agg RGBA buffer straight into the widget's texture.
+    matplotlib is only imported when the first plot is drawn.
+    """
+
+    dpi = 100
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._figure = None
+        self.agg_canvas = None
+        self._plot_texture = None
+        self._has_plot = False
+        self._resize_event = None
+        self.bind(size=self._on_resize)
+
+    @property
+    def figure(self):
+        if self._figure is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self._figure = Figure(figsize=(8, 6), dpi=self.dpi)
+            self.agg_canvas = FigureCanvasAgg(self._figure)
+        return self._figure
+
+    def new_axes(self, **kwargs):
+        """Clear the figure and return a fresh Axes to draw on"""
+        self._fit_figure_to_widget()
+        self.figure.clear()
+        return self.figure.add_subplot(**kwargs)
+
+    def refresh(self) -> None:
+        """Render the figure with Agg and upload the pixels to the texture"""
+        self.agg_canvas.draw()
+        # Flat view of the Agg buffer; no pixel copy is made on the Python side
+        pixels = memoryview(self.agg_canvas.buffer_rgba()).cast('B')
+        self._upload(pixels, self.agg_canvas.get_width_height())
+        self._has_plot = True
+
+    def snapshot(self) -> tuple:
+        """Copy of the last rendered RGBA pixels and their (width, height)"""
+        return bytes(self.agg_canvas.buffer_rgba()), self.agg_canvas.get_width_height()
+
+    def show_image(self, pixels: bytes, size: tuple) -> None:
+        """
+        Display previously rendered pixels without touching the figure.
+        The figure no longer matches what is shown, so resizes only scale the image.
+        """
+        self._upload(pixels, tuple(size))
+        self._has_plot = False
+
+    def _upload(self, pixels, size: tuple) -> None:
+        if self._plot_texture is None or self._plot_texture.size != size:
+            self._plot_texture = Texture.create(size=size, colorfmt='rgba')
+            # Agg rows start at the top, OpenGL textures at the bottom
+            self._plot_texture.flip_vertical()
+
+        self._plot_texture.blit_buffer(pixels, colorfmt='rgba', bufferfmt='ubyte')
+        self.texture = self._plot_texture
+        self.canvas.ask_update()
+
+    def clear(self) -> None:
+        """Drop the current plot"""
+        if self._figure is not None:
+            self._figure.clear()
+        self.texture = None
+        self._has_plot = False
+
+    def _fit_figure_to_widget(self) -> None:
+        width, height = self.size
+        if width > 1 and height > 1:
+            self.figure.set_size_inches(width / self.dpi, height / self.dpi, forward=False)
+
+    def _on_resize(self, *args) -> None:
+        if not self._has_plot:
+            return
+        if self._resize_event is not None:
+            self._resize_event.cancel()
+        self._resize_event = Clock.schedule_once(self._redraw_at_new_size, 0.2)
+
+    def _redraw_at_new_size(self, *args) -> None:
+        self._resize_event = None
+        self._fit_figure_to_widget()
+        self.figure.tight_layout()
+        self.refresh()
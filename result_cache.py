@@ -0,0 +1,206 @@
+"""
+Result Cache Module
+Memoizes statistics engine calls keyed by a fingerprint of their inputs
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _update_hash(hasher, value: Any) -> None:
+    """Feed a single value into the hasher"""
+    if isinstance(value, pd.DataFrame):
+        hasher.update(b'frame')
+        hasher.update(repr(list(value.columns)).encode('utf-8'))
+        hasher.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, pd.Series):
+        hasher.update(b'series')
+        hasher.update(repr(value.name).encode('utf-8'))
+        hasher.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, (np.ndarray, list, tuple)):
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            # Ragged nested sequences cannot form an array
+            array = None
+        if array is None or (array.dtype == object and not isinstance(value, np.ndarray)):
+            hasher.update(b'sequence')
+            hasher.update(repr(len(value)).encode('utf-8'))
+            for item in value:
+                _update_hash(hasher, item)
+            return
+        if array.dtype == object:
+            hasher.update(b'objects')
+            hasher.update(repr(array.shape).encode('utf-8'))
+            try:
+                hasher.update(pd.util.hash_array(array.ravel()).tobytes())
+            except TypeError:
+                for item in array.ravel():
+                    _update_hash(hasher, item)
+            return
+        array = np.ascontiguousarray(array)
+        hasher.update(b'array')
+        hasher.update(array.dtype.str.encode('utf-8'))
+        hasher.update(repr(array.shape).encode('utf-8'))
+        hasher.update(memoryview(array).cast('B'))
+    else:
+        hasher.update(repr(value).encode('utf-8'))
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory size of a cached value in bytes, without serializing it"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes if value.dtype != object else sum(estimate_size(item) for item in value.ravel())
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def fingerprint(*args, **kwargs) -> str:
+    """
+    Compute a content hash of the given arguments.
+    Arrays and DataFrames are hashed from their raw buffers.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for value in args:
+        _update_hash(hasher, value)
+    for key in sorted(kwargs):
+        hasher.update(key.encode('utf-8'))
+        _update_hash(hasher, kwargs[key])
+    return hasher.hexdigest()
+
+
+class ResultCache:
+    """
+    LRU cache of analysis results with a size budget in bytes
+    and optional persistence to a directory on disk.
+    Values are copied on the way in and out, so callers may mutate what they get.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or os.path.exists(self._disk_path(key) or '')
+
+    @property
+    def total_bytes(self) -> int:
+        """Approximate size of all in-memory entries"""
+        return self._total_bytes
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        if not self.disk_dir:
+            return None
+        return os.path.join(self.disk_dir, f"{key}.pkl")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a cached value, checking memory first and then disk"""
+        with self._lock:
+            found = key in self._entries
+            if found:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = self._entries[key]
+        if found:
+            return copy.deepcopy(value)
+
+        path = self._disk_path(key)
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    payload = f.read()
+                value = pickle.loads(payload)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                return default
+            self._store(key, value, len(payload))
+            with self._lock:
+                self.hits += 1
+            return copy.deepcopy(value)
+
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a copy of a value, evicting least recently used entries over budget"""
+        self._store(key, copy.deepcopy(value), estimate_size(value))
+
+        path = self._disk_path(key)
+        if path:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+
+    def _store(self, key: str, value: Any, size: int) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._sizes.pop(key)
+                del self._entries[key]
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_bytes and self._entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(old_key)
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call func(*args, **kwargs) through the cache.
+        The key combines the function's qualified name with a fingerprint of its arguments.
+        """
+        name = f"{func.__module__}.{getattr(func, '__qualname__', func.__name__)}"
+        key = fingerprint(name, *args, **kwargs)
+
+        sentinel = object()
+        result = self.get(key, sentinel)
+        if result is not sentinel:
+            return result
+
+        result = func(*args, **kwargs)
+        self.put(key, result)
+        return result
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop all in-memory entries, and optionally the on-disk files"""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+        if disk and self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.disk_dir, name))
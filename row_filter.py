@@ -0,0 +1,111 @@
+"""
+Row Filter Module
+Filter expressions compiled to vectorized row masks, cached per dataset
+version, and filtered views that select rows only from the columns used
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from missing_values import FilledView
+from tracing import traced
+
+
+def normalize_expression(expression: str) -> str:
+    """Collapse whitespace so equivalent spellings share a cached mask"""
+    return " ".join(expression.split())
+
+
+@traced('compute', 'row filter')
+def evaluate_filter(df: pd.DataFrame, expression: str) -> np.ndarray:
+    """
+    Evaluate a filter expression such as `Age > 23 and Grade == "A"` to a boolean row mask.
+    Uses pandas eval, which runs on numexpr when it is installed.
+    Column names with spaces are written in backticks. Rows where the
+    expression is missing (e.g. comparisons with NaN) are excluded.
+    """
+    expression = normalize_expression(expression)
+    if not expression:
+        raise ValueError("Filter expression is empty")
+
+    try:
+        # Empty local/global scopes: only column names can be referenced
+        result = df.eval(expression, local_dict={}, global_dict={})
+    except Exception as e:
+        raise ValueError(f"Invalid filter expression: {e}") from e
+
+    if (not isinstance(result, pd.Series) or len(result) != len(df)
+            or not pd.api.types.is_bool_dtype(result.dtype)):
+        raise ValueError('Filter expression must give True/False per row, e.g. Age > 23 and Grade == "A"')
+    return result.to_numpy(dtype=bool, na_value=False)
+
+
+class MaskCache:
+    """
+    LRU cache of filter masks keyed by dataset, dataset version and expression.
+    Masks are bit-packed, so each costs one bit per row.
+    """
+
+    def __init__(self, max_entries: int = 32):
+        self.max_entries = max_entries
+        self._masks: 'OrderedDict[Tuple[Hashable, Any, str], Tuple[np.ndarray, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def mask(self, dataset: Hashable, version: Any, df: pd.DataFrame, expression: str) -> np.ndarray:
+        """Return the row mask of an expression, evaluating it on a miss"""
+        key = (dataset, version, normalize_expression(expression))
+        with self._lock:
+            entry = self._masks.get(key)
+            if entry is not None:
+                self._masks.move_to_end(key)
+                self.hits += 1
+                return np.unpackbits(entry[0], count=entry[1]).view(bool)
+
+        mask = evaluate_filter(df, expression)
+        with self._lock:
+            self.misses += 1
+            self._masks[key] = (np.packbits(mask), len(mask))
+            while len(self._masks) > self.max_entries:
+                self._masks.popitem(last=False)
+        return mask
+
+    def clear(self) -> None:
+        with self._lock:
+            self._masks.clear()
+
+
+class FilteredView:
+    """
+    Rows of a DataFrame or FilledView selected by a boolean mask.
+    Nothing is copied up front; a column is subset only when it is accessed.
+    """
+
+    def __init__(self, source, mask: np.ndarray, expression: Optional[str] = None):
+        self.source = source
+        self.mask = mask
+        self.expression = expression
+        kept = source.kept_rows() if isinstance(source, FilledView) else None
+        # Columns of the source already lack the rows it dropped, so select within the kept rows
+        self._selector = mask if kept is None else mask[kept]
+
+    @property
+    def columns(self):
+        return self.source.columns
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._selector))
+
+    def column(self, column: str) -> pd.Series:
+        """Return the filtered rows of a column"""
+        return self.source[column][self._selector]
+
+    def __getitem__(self, column):
+        if isinstance(column, list):
+            return pd.DataFrame({col: self.column(col) for col in column})
+        return self.column(column)
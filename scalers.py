@@ -0,0 +1,274 @@
+"""
+Data Scaling Module
+Reusable scalers fitted from streaming statistics
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from statistics_engine import QuantileSketch
+
+
+ArrayLike = Union[np.ndarray, pd.Series, List[float]]
+
+
+def _as_array(data: ArrayLike) -> np.ndarray:
+    """View data as a float array without copying when possible"""
+    if isinstance(data, pd.Series):
+        data = data.to_numpy()
+    array = np.asarray(data)
+    if array.dtype.kind not in 'fc':
+        array = array.astype(np.float64)
+    return array
+
+
+class Scaler:
+    """
+    Base class for scalers.
+    Subclasses accumulate statistics in partial_fit() and map values through
+    a single affine transform (x - offset) / scale.
+    """
+
+    kind = 'base'
+
+    def __init__(self):
+        self.n_samples = 0
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.n_samples > 0
+
+    def partial_fit(self, data: ArrayLike) -> 'Scaler':
+        """Update the fitted statistics with another chunk of data"""
+        raise NotImplementedError
+
+    def fit(self, data: Union[ArrayLike, Iterable[ArrayLike]]) -> 'Scaler':
+        """
+        Fit from an array, a Series or an iterable of chunks.
+        Missing values are ignored.
+        """
+        self.reset()
+        if isinstance(data, (np.ndarray, pd.Series)) or (isinstance(data, list) and np.ndim(data[:1]) == 1):
+            return self.partial_fit(data)
+        for chunk in data:
+            self.partial_fit(chunk)
+        return self
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def _params(self) -> Dict[str, float]:
+        raise NotImplementedError
+
+    def offset_and_scale(self) -> tuple:
+        """Return (offset, scale) so that transform(x) == (x - offset) / scale"""
+        raise NotImplementedError
+
+    def transform(self, data: ArrayLike, out: Optional[np.ndarray] = None,
+                  dtype: Optional[np.dtype] = None, inplace: bool = False) -> np.ndarray:
+        """
+        Scale data with the fitted parameters.
+
+        inplace=True writes the result back into a float array argument.
+        dtype=np.float32 halves the output size when no output array is given.
+        """
+        if not self.is_fitted:
+            raise ValueError("Scaler has not been fitted")
+
+        array = _as_array(data)
+        offset, scale = self.offset_and_scale()
+
+        if inplace:
+            if not isinstance(data, np.ndarray) or array is not data or not array.flags.writeable:
+                raise ValueError("In-place scaling requires a writable float NumPy array")
+            out = array
+        elif out is None:
+            out = np.empty(array.shape, dtype=dtype or np.result_type(array.dtype, np.float32))
+
+        np.subtract(array, offset, out=out, casting='unsafe')
+        if scale == 0:
+            out.fill(self._constant_value())
+        else:
+            np.divide(out, scale, out=out)
+        return out
+
+    def _constant_value(self) -> float:
+        return 0.0
+
+    def inverse_transform(self, data: ArrayLike) -> np.ndarray:
+        """Map scaled values back to the original units"""
+        offset, scale = self.offset_and_scale()
+        return _as_array(data) * scale + offset
+
+    def transform_columns(self, df: pd.DataFrame, columns: List[str],
+                          dtype: Optional[np.dtype] = None, inplace: bool = True) -> pd.DataFrame:
+        """
+        Scale the given DataFrame columns with the fitted parameters.
+        The parameters are those of the data this scaler was fitted on, so
+        columns are never chosen implicitly; fit one scaler per column to
+        scale columns independently.
+
+        Each column is replaced by a newly allocated scaled array, not
+        written in place; no Python lists are built.
+        inplace=True replaces the columns of df itself, otherwise a shallow
+        copy is returned.
+        """
+        if isinstance(columns, str):
+            columns = [columns]
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Columns not found: {missing}")
+        target = df if inplace else df.copy(deep=False)
+        for col in columns:
+            target[col] = self.transform(target[col], dtype=dtype)
+        return target
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable representation of the fitted scaler"""
+        params = self._params()
+        params['kind'] = self.kind
+        params['n_samples'] = self.n_samples
+        return params
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @staticmethod
+    def from_dict(params: Dict[str, Any]) -> 'Scaler':
+        """Rebuild a fitted scaler from to_dict() output"""
+        params = dict(params)
+        kind = params.pop('kind')
+        scaler = SCALERS[kind]()
+        scaler.n_samples = int(params.pop('n_samples'))
+        for key, value in params.items():
+            setattr(scaler, key, value)
+        return scaler
+
+    @staticmethod
+    def from_json(text: str) -> 'Scaler':
+        return Scaler.from_dict(json.loads(text))
+
+
+class MinMaxScaler(Scaler):
+    """Scale data to the 0-1 range"""
+
+    kind = 'minmax'
+
+    def __init__(self):
+        super().__init__()
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def partial_fit(self, data: ArrayLike) -> 'MinMaxScaler':
+        array = _as_array(data)
+        valid = array.size - int(np.count_nonzero(np.isnan(array)))
+        if valid:
+            self.min = min(self.min, float(np.nanmin(array)))
+            self.max = max(self.max, float(np.nanmax(array)))
+            self.n_samples += valid
+        return self
+
+    def _params(self) -> Dict[str, float]:
+        return {'min': self.min, 'max': self.max}
+
+    def offset_and_scale(self) -> tuple:
+        return self.min, self.max - self.min
+
+    def _constant_value(self) -> float:
+        return 0.5
+
+
+class StandardScaler(Scaler):
+    """
+    Scale data to mean=0 and std=1 (z-score).
+    Mean and variance are merged across chunks with Chan's parallel update.
+    """
+
+    kind = 'zscore'
+
+    def __init__(self, ddof: int = 0):
+        super().__init__()
+        self.ddof = ddof
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def reset(self) -> None:
+        self.__init__(self.ddof)
+
+    def partial_fit(self, data: ArrayLike) -> 'StandardScaler':
+        array = _as_array(data)
+        missing = np.isnan(array)
+        if missing.any():
+            array = array[~missing]
+        n_b = array.size
+        if not n_b:
+            return self
+
+        mean_b = float(np.mean(array))
+        m2_b = float(np.sum(np.square(array - mean_b)))
+
+        n_a = self.n_samples
+        total = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / total
+        self.m2 += m2_b + delta * delta * n_a * n_b / total
+        self.n_samples = total
+        return self
+
+    @property
+    def std(self) -> float:
+        if self.n_samples - self.ddof <= 0:
+            return 0.0
+        return float(np.sqrt(self.m2 / (self.n_samples - self.ddof)))
+
+    def _params(self) -> Dict[str, float]:
+        return {'mean': self.mean, 'm2': self.m2, 'ddof': self.ddof}
+
+    def offset_and_scale(self) -> tuple:
+        return self.mean, self.std
+
+
+class RobustScaler(Scaler):
+    """
+    Scale data by median and interquartile range.
+    Quantiles come from a QuantileSketch so the scaler can be
+    fitted from a stream of chunks in fixed memory.
+    """
+
+    kind = 'robust'
+
+    def __init__(self, sample_size: int = 100_000, seed: int = 0):
+        super().__init__()
+        self.sample_size = sample_size
+        self.seed = seed
+        self.median = 0.0
+        self.iqr = 0.0
+        self._sketch = QuantileSketch(sample_size, seed)
+
+    def reset(self) -> None:
+        self.__init__(self.sample_size, self.seed)
+
+    def partial_fit(self, data: ArrayLike) -> 'RobustScaler':
+        self._sketch.update(_as_array(data))
+        self.n_samples = self._sketch.count
+        if self.n_samples:
+            q1, median, q3 = self._sketch.quantiles([0.25, 0.5, 0.75])
+            self.median = float(median)
+            self.iqr = float(q3 - q1)
+        return self
+
+    def _params(self) -> Dict[str, float]:
+        return {'median': self.median, 'iqr': self.iqr, 'sample_size': self.sample_size}
+
+    def offset_and_scale(self) -> tuple:
+        return self.median, self.iqr
+
+
+SCALERS = {
+    MinMaxScaler.kind: MinMaxScaler,
+    StandardScaler.kind: StandardScaler,
+    RobustScaler.kind: RobustScaler,
+}
@@ -0,0 +1,94 @@
+"""
+Startup Profiling Module
+Times startup phases, defers heavy imports and warms them up in the background
+"""
+
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, List, Optional, Tuple
+
+
+class StartupProfiler:
+    """Records named startup phases and formats them as a timing report"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases: List[Tuple[str, float, float, str]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block of startup work"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter() - start)
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        with self._lock:
+            self.phases.append((name, start - self.origin, duration, threading.current_thread().name))
+
+    def mark(self, name: str) -> None:
+        """Record an instant, e.g. the first frame being drawn"""
+        self.record(name, time.perf_counter(), 0.0)
+
+    def report(self) -> str:
+        """Format recorded phases as readable string"""
+        output = "Startup Timing Report:\n" + "="*60 + "\n"
+        output += f"{'Phase':<36}{'At (ms)':>10}{'Took (ms)':>12}\n"
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p[1])
+        for name, offset, duration, thread in phases:
+            label = name if thread == 'MainThread' else f"{name} [{thread}]"
+            output += f"{label:<36}{offset * 1000:>10.1f}{duration * 1000:>12.1f}\n"
+        return output
+
+
+profiler = StartupProfiler()
+
+
+class LazyModule:
+    """
+    Module proxy that imports the real module on first attribute access.
+    The import is timed by the startup profiler.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            if self._name in sys.modules:
+                self._module = sys.modules[self._name]
+            else:
+                with profiler.phase(f"import {self._name} (on demand)"):
+                    self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+
+def warm_up(module_names: Iterable[str], on_done: Optional[Callable[[], None]] = None) -> threading.Thread:
+    """
+    Import modules in a background thread so they are ready before first use.
+    Python's import lock makes a concurrent on-demand import wait rather than import twice.
+    """
+    def run():
+        for name in module_names:
+            with profiler.phase(f"import {name} (warm-up)"):
+                try:
+                    importlib.import_module(name)
+                except ImportError:
+                    pass
+        if on_done is not None:
+            on_done()
+
+    thread = threading.Thread(target=run, name='warm-up', daemon=True)
+    thread.start()
+    return thread
@@ -62,37 +62,59 @@ class CorrelationAnalysis:
     def correlation_matrix(data: pd.DataFrame) -> pd.DataFrame:
         """Calculate correlation matrix for DataFrame"""
         return data.corr()
+    
+    @staticmethod
+    def cluster_order(corr_matrix: pd.DataFrame, method: str = 'average') -> List[int]:
+        """
+        Order variables by hierarchical clustering on 1 - |r|
+        so strongly correlated columns end up next to each other
+        """
+        from scipy.cluster.hierarchy import linkage, leaves_list
+        from scipy.spatial.distance import squareform
+        
+        n = corr_matrix.shape[0]
+        if n < 3:
+            return list(range(n))
+        
+        distance = 1.0 - np.abs(np.nan_to_num(np.asarray(corr_matrix, dtype=float)))
+        np.fill_diagonal(distance, 0.0)
+        distance = np.clip((distance + distance.T) / 2, 0.0, None)
+        return leaves_list(linkage(squareform(distance, checks=False), method=method)).tolist()
 
 
 class RegressionAnalysis:
     """Perform regression analysis"""
     
     @staticmethod
-    def linear_regression(x: List[float], y: List[float]) -> Dict[str, any]:
+    def linear_regression(x: List[float], y: List[float], full_output: bool = True) -> Dict[str, any]:
         """
         Perform simple linear regression
         Returns slope, intercept, r_value, p_value, std_err
+        Per-point predictions and residuals are only included when full_output is True
         """
-        x_array = np.array(x)
-        y_array = np.array(y)
+        x_array = np.asarray(x)
+        y_array = np.asarray(y)
         
         slope, intercept, r_value, p_value, std_err = stats.linregress(x_array, y_array)
         
-        # Calculate predictions and residuals
-        y_pred = slope * x_array + intercept
-        residuals = y_array - y_pred
-        
-        return {
+        result = {
             'slope': slope,
             'intercept': intercept,
             'r_value': r_value,
             'r_squared': r_value ** 2,
             'p_value': p_value,
             'std_err': std_err,
-            'equation': f"y = {slope:.4f}x + {intercept:.4f}",
-            'predictions': y_pred.tolist(),
-            'residuals': residuals.tolist()
+            'equation': f"y = {slope:.4f}x + {intercept:.4f}"
         }
+        
+        if full_output:
+            # Calculate predictions and residuals
+            y_pred = slope * x_array + intercept
+            residuals = y_array - y_pred
+            result['predictions'] = y_pred.tolist()
+            result['residuals'] = residuals.tolist()
+        
+        return result
 
 
 class HypothesisTesting:
@@ -215,3 +237,574 @@ class OutlierDetection:
             'outlier_count': len(outliers),
             'outlier_indices': np.where(z_scores > threshold)[0].tolist()
         }
+
+
+class KernelDensity:
+    """
+    Kernel density estimation on a regular grid.
+    Data is linearly binned onto the grid and convolved with a Gaussian
+    kernel via FFT, so the cost is O(n + g log g) rather than O(n * g).
+    """
+    
+    @staticmethod
+    def bandwidth(data: List[float], method: str = 'scott') -> float:
+        """Select a Gaussian kernel bandwidth (Scott's or Silverman's rule)"""
+        data_array = np.asarray(data, dtype=float)
+        n = data_array.size
+        std = np.std(data_array, ddof=1) if n > 1 else 0.0
+        q1, q3 = np.percentile(data_array, [25, 75]) if n else (0.0, 0.0)
+        iqr = (q3 - q1) / 1.349
+        
+        sigma = min(std, iqr) if iqr > 0 else std
+        if sigma <= 0:
+            sigma = abs(np.mean(data_array)) * 1e-3 if n and np.mean(data_array) != 0 else 1.0
+        
+        if method == 'scott':
+            return 1.059 * sigma * n ** (-1 / 5)
+        elif method == 'silverman':
+            return 0.9 * sigma * n ** (-1 / 5)
+        raise ValueError(f"Invalid bandwidth method: {method}")
+    
+    @staticmethod
+    def linear_binning(data: np.ndarray, lower: float, upper: float, grid_size: int) -> np.ndarray:
+        """Spread each point's unit weight over its two neighbouring grid points"""
+        delta = (upper - lower) / (grid_size - 1)
+        position = (data - lower) / delta
+        left = np.floor(position).astype(np.int64)
+        np.clip(left, 0, grid_size - 2, out=left)
+        frac = position - left
+        
+        counts = np.bincount(left, weights=1.0 - frac, minlength=grid_size)
+        counts += np.bincount(left + 1, weights=frac, minlength=grid_size)
+        return counts[:grid_size]
+    
+    @staticmethod
+    def estimate(data: List[float], grid_size: int = 512, bandwidth='scott',
+                 cut: float = 3.0) -> Dict[str, any]:
+        """
+        Estimate the density of data
+        Returns grid, density and the bandwidth used
+        """
+        data_array = np.asarray(data, dtype=float)
+        data_array = data_array[np.isfinite(data_array)]
+        if data_array.size == 0:
+            raise ValueError("KDE needs at least one finite value")
+        
+        h = float(bandwidth) if not isinstance(bandwidth, str) else KernelDensity.bandwidth(data_array, bandwidth)
+        lower = float(np.min(data_array)) - cut * h
+        upper = float(np.max(data_array)) + cut * h
+        grid = np.linspace(lower, upper, grid_size)
+        delta = grid[1] - grid[0]
+        
+        counts = KernelDensity.linear_binning(data_array, lower, upper, grid_size)
+        
+        # Kernel sampled at grid offsets, truncated at 4 bandwidths
+        half_width = int(min(grid_size - 1, np.ceil(4.0 * h / delta)))
+        offsets = np.arange(-half_width, half_width + 1) * delta
+        kernel = np.exp(-0.5 * (offsets / h) ** 2) / (h * np.sqrt(2 * np.pi))
+        
+        size = 1 << int(np.ceil(np.log2(grid_size + 2 * half_width + 1)))
+        convolved = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+        density = convolved[half_width:half_width + grid_size] / data_array.size
+        np.clip(density, 0, None, out=density)
+        
+        return {
+            'grid': grid,
+            'density': density,
+            'bandwidth': h
+        }
+
+
+class HistogramEngine:
+    """
+    Compute histogram counts once and reuse them for plotting and grouped statistics.
+    Accepts raw data or pre-binned (interval, frequency) data.
+    """
+    
+    RULES = ('auto', 'fd', 'sturges', 'doane')
+    
+    @staticmethod
+    def bin_count(data: List[float], rule: str = 'auto', max_bins: int = 10000) -> int:
+        """Number of bins chosen by Freedman-Diaconis, Sturges or Doane"""
+        data_array = np.asarray(data, dtype=float)
+        n = data_array.size
+        if n < 2:
+            return 1
+        
+        sturges = int(np.ceil(np.log2(n))) + 1
+        data_range = np.max(data_array) - np.min(data_array)
+        
+        if rule == 'sturges':
+            bins = sturges
+        elif rule == 'doane':
+            sigma_g1 = np.sqrt(6.0 * (n - 2) / ((n + 1.0) * (n + 3)))
+            # Constant data has no defined skewness
+            g1 = stats.skew(data_array) if data_range > 0 else np.nan
+            if sigma_g1 > 0 and np.isfinite(g1):
+                bins = int(np.ceil(1 + np.log2(n) + np.log2(1 + abs(g1) / sigma_g1)))
+            else:
+                bins = sturges
+        elif rule in ('fd', 'auto'):
+            q1, q3 = np.percentile(data_array, [25, 75])
+            width = 2.0 * (q3 - q1) * n ** (-1 / 3)
+            fd = int(np.ceil(data_range / width)) if width > 0 else sturges
+            bins = fd if rule == 'fd' else max(fd, sturges)
+        else:
+            raise ValueError(f"Invalid binning rule: {rule}")
+        
+        return int(min(max(bins, 1), max_bins))
+    
+    @staticmethod
+    def compute(data: List[float], bins=None, value_range: Optional[Tuple[float, float]] = None,
+                chunk_size: int = 1_000_000) -> Dict[str, any]:
+        """
+        Bin raw data into equal-width bins
+        bins may be a count or a rule name; counts are accumulated chunk by chunk with bincount
+        """
+        data_array = np.asarray(data, dtype=float)
+        data_array = data_array[np.isfinite(data_array)]
+        if data_array.size == 0:
+            raise ValueError("Histogram needs at least one finite value")
+        
+        if bins is None:
+            bins = 'auto'
+        rule = bins if isinstance(bins, str) else 'fixed'
+        n_bins = HistogramEngine.bin_count(data_array, rule) if rule != 'fixed' else int(bins)
+        if n_bins < 1:
+            raise ValueError("Number of bins must be at least 1")
+        
+        lower, upper = value_range if value_range else (np.min(data_array), np.max(data_array))
+        if lower == upper:
+            lower, upper = lower - 0.5, upper + 0.5
+        edges = np.linspace(lower, upper, n_bins + 1)
+        scale = n_bins / (upper - lower)
+        
+        counts = np.zeros(n_bins, dtype=np.int64)
+        for start in range(0, data_array.size, chunk_size):
+            chunk = data_array[start:start + chunk_size]
+            chunk = chunk[(chunk >= lower) & (chunk <= upper)]
+            index = ((chunk - lower) * scale).astype(np.int64)
+            np.clip(index, 0, n_bins - 1, out=index)
+            counts += np.bincount(index, minlength=n_bins)
+        
+        return {
+            'edges': edges,
+            'counts': counts,
+            'rule': rule,
+            'total': int(counts.sum()),
+            'grouped': False
+        }
+    
+    @staticmethod
+    def from_grouped(intervals: List[Tuple[float, float]], frequencies: List[float]) -> Dict[str, any]:
+        """
+        Build a histogram from class intervals and their frequencies
+        Gaps between consecutive intervals are absorbed into the lower class
+        """
+        if not intervals:
+            raise ValueError("Enter at least one class interval")
+        if len(intervals) != len(frequencies):
+            raise ValueError("Each class interval needs a frequency")
+        
+        order = np.argsort([lower for lower, _ in intervals])
+        intervals = [intervals[i] for i in order]
+        counts = np.asarray(frequencies, dtype=float)[order]
+        
+        for (lower, upper), (next_lower, _) in zip(intervals, intervals[1:]):
+            if upper > next_lower:
+                raise ValueError(f"Class intervals overlap: {lower}-{upper} and {next_lower}")
+        for lower, upper in intervals:
+            if upper <= lower:
+                raise ValueError(f"Invalid class interval: {lower}-{upper}")
+        
+        edges = np.array([lower for lower, _ in intervals] + [intervals[-1][1]], dtype=float)
+        return {
+            'edges': edges,
+            'counts': counts,
+            'rule': 'grouped',
+            'total': float(counts.sum()),
+            'grouped': True
+        }
+    
+    @staticmethod
+    def grouped_statistics(histogram: Dict[str, any]) -> Dict[str, float]:
+        """Mean, variance, median, quartiles and mode estimated from binned counts"""
+        edges = np.asarray(histogram['edges'], dtype=float)
+        counts = np.asarray(histogram['counts'], dtype=float)
+        total = counts.sum()
+        if total <= 0:
+            raise ValueError("Histogram is empty")
+        
+        widths = np.diff(edges)
+        midpoints = edges[:-1] + widths / 2
+        mean = np.sum(counts * midpoints) / total
+        variance = np.sum(counts * (midpoints - mean) ** 2) / (total - 1) if total > 1 else 0.0
+        cumulative = np.cumsum(counts)
+        
+        def quantile(q):
+            target = q * total
+            i = int(np.searchsorted(cumulative, target))
+            i = min(i, len(counts) - 1)
+            before = cumulative[i - 1] if i > 0 else 0.0
+            if counts[i] == 0:
+                return edges[i]
+            return edges[i] + (target - before) / counts[i] * widths[i]
+        
+        # Modal class formula: L + (f1 - f0) / (2 f1 - f0 - f2) * h
+        m = int(np.argmax(counts))
+        f0 = counts[m - 1] if m > 0 else 0.0
+        f2 = counts[m + 1] if m < len(counts) - 1 else 0.0
+        denom = 2 * counts[m] - f0 - f2
+        mode = edges[m] + (counts[m] - f0) / denom * widths[m] if denom > 0 else midpoints[m]
+        
+        q1, median, q3 = quantile(0.25), quantile(0.5), quantile(0.75)
+        return {
+            'count': total,
+            'mean': mean,
+            'median': median,
+            'mode': mode,
+            'std_dev': np.sqrt(variance),
+            'variance': variance,
+            'min': edges[0],
+            'max': edges[-1],
+            'q1': q1,
+            'q3': q3,
+            'iqr': q3 - q1
+        }
+
+
+def exact_quantiles(data: List[float], probs: List[float]) -> np.ndarray:
+    """
+    Linearly interpolated quantiles (same as np.percentile) from a single
+    np.partition pass over the data instead of a full sort
+    """
+    data_array = np.array(data, dtype=float)
+    data_array = data_array[~np.isnan(data_array)]
+    n = data_array.size
+    if n == 0:
+        raise ValueError("Quantiles need at least one value")
+    
+    positions = np.asarray(probs, dtype=float) * (n - 1)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, n - 1)
+    data_array.partition(np.unique(np.concatenate([lower, upper])))
+    
+    frac = positions - lower
+    return data_array[lower] + (data_array[upper] - data_array[lower]) * frac
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch built on a fixed-size uniform reservoir sample.
+    Count, minimum, maximum and sum are exact; quantiles have rank error of
+    roughly 1 / sqrt(capacity) regardless of how much data is streamed in.
+    With tail_size > 0 the tail_size smallest and largest values are also
+    kept, so quantiles whose order statistics fall among them are exact.
+    """
+    
+    CHUNK_SIZE = 65_536
+    
+    def __init__(self, capacity: int = 100_000, seed: int = 0, tail_size: int = 0):
+        self.capacity = capacity
+        self.tail_size = tail_size
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.sample = np.empty(0)
+        self.low = np.empty(0)
+        self.high = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+    
+    @staticmethod
+    def _extremes(kept: np.ndarray, values: np.ndarray, k: int, largest: bool) -> np.ndarray:
+        """The k smallest (or largest) of the kept values and the new values"""
+        if kept.size == k:
+            # Only values beyond the current k-th extreme can enter
+            values = values[values > kept.min()] if largest else values[values < kept.max()]
+            if not values.size:
+                return kept
+        pool = np.concatenate([kept, values])
+        if pool.size <= k:
+            return pool
+        if largest:
+            return np.partition(pool, pool.size - k)[pool.size - k:]
+        return np.partition(pool, k - 1)[:k]
+    
+    def update(self, data: List[float]) -> 'QuantileSketch':
+        """
+        Add values; missing values are ignored.
+        Input is processed in chunks of CHUNK_SIZE, so temporary arrays stay
+        small however much data is passed in one call.
+        """
+        data_array = np.asarray(data, dtype=float).ravel()
+        for start in range(0, data_array.size, self.CHUNK_SIZE):
+            self._update_chunk(data_array[start:start + self.CHUNK_SIZE])
+        return self
+    
+    def _update_chunk(self, data_array: np.ndarray) -> None:
+        data_array = data_array[~np.isnan(data_array)]
+        if not data_array.size:
+            return
+        
+        self.min = min(self.min, float(data_array.min()))
+        self.max = max(self.max, float(data_array.max()))
+        self.total += float(data_array.sum())
+        if self.tail_size:
+            self.low = self._extremes(self.low, data_array, self.tail_size, largest=False)
+            self.high = self._extremes(self.high, data_array, self.tail_size, largest=True)
+        seen = self.count
+        self.count += data_array.size
+        
+        room = self.capacity - self.sample.size
+        if room > 0:
+            taken = data_array[:room]
+            self.sample = np.concatenate([self.sample, taken])
+            data_array = data_array[room:]
+            seen += taken.size
+        
+        if data_array.size:
+            # Algorithm R, vectorized: item i replaces a random slot with probability k / (seen + i + 1)
+            positions = seen + np.arange(1, data_array.size + 1)
+            slots = (self._rng.random(data_array.size) * positions).astype(np.int64)
+            keep = slots < self.capacity
+            self.sample[slots[keep]] = data_array[keep]
+    
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Combine with another sketch. The merged reservoir takes slots from each
+        side in proportion to the data it represents, each drawn uniformly from
+        that side's reservoir, so it stays a uniform sample of the combined stream.
+        """
+        if other.count == 0:
+            return self
+        if self.tail_size:
+            self.low = self._extremes(self.low, other.low, self.tail_size, largest=False)
+            self.high = self._extremes(self.high, other.high, self.tail_size, largest=True)
+        if self.count == 0:
+            self.count, self.total, self.min, self.max = other.count, other.total, other.min, other.max
+            self.sample = other.sample.copy()
+            return self
+        
+        total = self.count + other.count
+        size = min(self.capacity, self.sample.size + other.sample.size)
+        own_share = min(int(round(size * self.count / total)), self.sample.size)
+        other_share = min(size - own_share, other.sample.size)
+        
+        self.sample = np.concatenate([
+            self.sample[self._rng.choice(self.sample.size, size=own_share, replace=False)],
+            other.sample[self._rng.choice(other.sample.size, size=other_share, replace=False)],
+        ])
+        self.count = total
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+    
+    @property
+    def mean(self) -> float:
+        if self.count == 0:
+            raise ValueError("Sketch is empty")
+        return self.total / self.count
+    
+    def quantiles(self, probs: List[float]) -> np.ndarray:
+        """Estimated quantiles; exact while all data still fits in the reservoir"""
+        if self.count == 0:
+            raise ValueError("Sketch is empty")
+        probs = np.asarray(probs, dtype=float)
+        values = np.percentile(self.sample, probs * 100)
+        if self.low.size:
+            # Interpolate between exact order statistics where they were kept
+            positions = probs * (self.count - 1)
+            low, high = np.sort(self.low), np.sort(self.high)
+            in_low = positions <= low.size - 1
+            values[in_low] = np.interp(positions[in_low], np.arange(low.size), low)
+            start = self.count - high.size
+            in_high = positions >= start
+            values[in_high] = np.interp(positions[in_high], np.arange(start, self.count), high)
+        return np.clip(values, self.min, self.max)
+    
+    def quantile(self, prob: float) -> float:
+        return float(self.quantiles([prob])[0])
+
+
+class BoxPlotSummary:
+    """Box plot statistics computed without handing raw data to the plotting library"""
+    
+    EXACT_LIMIT = 5_000_000
+    
+    @staticmethod
+    def summarize(data: List[float], method: str = 'auto', whis: float = 1.5,
+                  max_fliers: int = 500, label: Optional[str] = None, seed: int = 0) -> Dict[str, any]:
+        """
+        Five-number summary plus a capped, sampled set of outliers,
+        in the format accepted by matplotlib's Axes.bxp
+        method: 'exact' (partition-based), 'sketch' (reservoir quantiles) or 'auto'
+        In sketch mode the data is read in chunks, twice: once for the quartiles,
+        count, extremes and mean, then once for the whiskers and outliers, so no
+        copy of the whole input is made. Whiskers and outlier counts are exact
+        for the estimated quartiles.
+        """
+        data_array = np.asarray(data, dtype=float).ravel()
+        
+        if method == 'auto':
+            method = 'exact' if data_array.size <= BoxPlotSummary.EXACT_LIMIT else 'sketch'
+        if method not in ('exact', 'sketch'):
+            raise ValueError(f"Invalid method: {method}")
+        
+        if method == 'exact':
+            data_array = data_array[~np.isnan(data_array)]
+            if data_array.size == 0:
+                raise ValueError("Box plot needs at least one value")
+            q1, median, q3 = exact_quantiles(data_array, [0.25, 0.5, 0.75])
+            count, mean = data_array.size, float(np.mean(data_array))
+            chunks = [data_array]
+        else:
+            sketch = QuantileSketch(seed=seed).update(data_array)
+            if sketch.count == 0:
+                raise ValueError("Box plot needs at least one value")
+            q1, median, q3 = sketch.quantiles([0.25, 0.5, 0.75])
+            count, mean = sketch.count, sketch.mean
+            chunks = (data_array[start:start + QuantileSketch.CHUNK_SIZE]
+                      for start in range(0, data_array.size, QuantileSketch.CHUNK_SIZE))
+        
+        iqr = q3 - q1
+        lower_bound = q1 - whis * iqr
+        upper_bound = q3 + whis * iqr
+        
+        # Whiskers reach the most extreme data inside the fences; outliers beyond
+        # them go through a reservoir that keeps their exact count and extremes
+        inside_low, inside_high = np.inf, -np.inf
+        outliers = QuantileSketch(capacity=max_fliers, seed=seed)
+        for chunk in chunks:
+            inside = (chunk >= lower_bound) & (chunk <= upper_bound)
+            if inside.any():
+                inside_low = min(inside_low, chunk[inside].min())
+                inside_high = max(inside_high, chunk[inside].max())
+            outside = (chunk < lower_bound) | (chunk > upper_bound)
+            if outside.any():
+                outliers.update(chunk[outside])
+        
+        fliers = outliers.sample
+        if outliers.count > max_fliers:
+            rng = np.random.default_rng(seed)
+            sampled = rng.choice(fliers, size=max_fliers - 2, replace=False)
+            fliers = np.concatenate([[outliers.min, outliers.max], sampled])
+        
+        return {
+            'label': label,
+            'mean': float(mean),
+            'med': float(median),
+            'q1': float(q1),
+            'q3': float(q3),
+            'whislo': float(min(inside_low, q1)),
+            'whishi': float(max(inside_high, q3)),
+            'fliers': fliers,
+            'n_fliers': outliers.count,
+            'count': int(count),
+            'method': method
+        }
+
+
+class QQPlot:
+    """
+    Q-Q plot points evaluated at a fixed set of probability levels.
+    Large samples are reduced to n_levels quantiles (denser in the tails),
+    so the cost of plotting does not grow with the sample size.
+    """
+    
+    # Reservoir samples needed below a level before the sketch estimates it;
+    # more extreme levels come from exactly kept tail values
+    SKETCH_CAPACITY = 100_000
+    SKETCH_RESOLUTION = 1000
+    
+    @staticmethod
+    def order_statistic_medians(n: int) -> np.ndarray:
+        """Filliben's estimate of uniform order statistic medians (as used by scipy's probplot)"""
+        v = np.empty(n)
+        v[-1] = 0.5 ** (1.0 / n)
+        v[0] = 1 - v[-1]
+        i = np.arange(2, n)
+        v[1:-1] = (i - 0.3175) / (n + 0.365)
+        return v
+    
+    @staticmethod
+    def probability_levels(n: int, n_levels: int = 1000) -> np.ndarray:
+        """Probability levels evenly spaced on the logit scale, spanning the sample's plotting positions"""
+        p_min = 1 - 0.5 ** (1.0 / n)
+        logits = np.linspace(np.log(p_min / (1 - p_min)), np.log((1 - p_min) / p_min), n_levels)
+        return 1.0 / (1.0 + np.exp(-logits))
+    
+    @staticmethod
+    def compute(data: List[float], dist: str = 'norm', sparams: Tuple = (), n_levels: int = 1000,
+                method: str = 'auto', line: str = 'auto') -> Dict[str, any]:
+        """
+        Theoretical vs sample quantiles with a fitted reference line
+        dist is any scipy.stats continuous distribution name; sparams are its shape parameters
+        method: 'exact' (one partition pass), 'sketch' (QuantileSketch) or 'auto'
+        line: 'ls' (least squares, as probplot), 'quartiles' (through the quartiles) or 'auto',
+        which uses quartiles once the levels are tail-weighted
+        """
+        distribution = getattr(stats, dist, None)
+        if not isinstance(distribution, stats.rv_continuous):
+            raise ValueError(f"Unknown continuous distribution: {dist}")
+        
+        data_array = np.asarray(data, dtype=float)
+        data_array = data_array[np.isfinite(data_array)]
+        n = data_array.size
+        if n < 2:
+            raise ValueError("Q-Q plot needs at least two values")
+        
+        quartile_probs = np.array([0.25, 0.75])
+        if n <= n_levels:
+            probabilities = QQPlot.order_statistic_medians(n)
+            sample = np.sort(data_array)
+            sample_quartiles = np.percentile(sample, quartile_probs * 100)
+            subsampled = False
+        else:
+            probabilities = QQPlot.probability_levels(n, n_levels)
+            if method == 'auto':
+                method = 'exact' if n <= BoxPlotSummary.EXACT_LIMIT else 'sketch'
+            if method == 'exact':
+                quantiles = exact_quantiles(data_array, np.concatenate([probabilities, quartile_probs]))
+            elif method == 'sketch':
+                # The reservoir cannot resolve levels below ~1/capacity; keep enough exact
+                # tail values that every other level has SKETCH_RESOLUTION samples below it
+                tail_size = int(np.ceil(QQPlot.SKETCH_RESOLUTION * n / QQPlot.SKETCH_CAPACITY))
+                sketch = QuantileSketch(QQPlot.SKETCH_CAPACITY, tail_size=tail_size)
+                quantiles = sketch.update(data_array).quantiles(
+                    np.concatenate([probabilities, quartile_probs]))
+            else:
+                raise ValueError(f"Invalid method: {method}")
+            sample, sample_quartiles = quantiles[:-2], quantiles[-2:]
+            subsampled = True
+        
+        theoretical = distribution.ppf(probabilities, *sparams)
+        slope, intercept, r_value, _, _ = stats.linregress(theoretical, sample)
+        
+        if line == 'auto':
+            line = 'quartiles' if subsampled else 'ls'
+        if line == 'quartiles':
+            theoretical_quartiles = distribution.ppf(quartile_probs, *sparams)
+            slope = (sample_quartiles[1] - sample_quartiles[0]) / (theoretical_quartiles[1] - theoretical_quartiles[0])
+            intercept = sample_quartiles[0] - slope * theoretical_quartiles[0]
+        elif line != 'ls':
+            raise ValueError(f"Invalid reference line: {line}")
+        
+        # R² of the line actually drawn; equals r² of the least-squares fit for line='ls'
+        residual = np.sum((sample - (slope * theoretical + intercept)) ** 2)
+        total = np.sum((sample - np.mean(sample)) ** 2)
+        r_squared = 1.0 - residual / total if total > 0 else 1.0
+        
+        return {
+            'dist': dist,
+            'probabilities': probabilities,
+            'theoretical': theoretical,
+            'sample': sample,
+            'slope': slope,
+            'intercept': intercept,
+            'r_squared': r_squared,
+            'ppcc': r_value,
+            'line': line,
+            'count': n
+        }
@@ -0,0 +1,125 @@
+"""
+Task Executor Module
+Runs analysis work off the UI thread and hands results back through a dispatcher
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task once it has been cancelled"""
+
+
+class Task:
+    """
+    Handle for one submitted piece of work.
+    The worker reports progress through set_progress, which is also where
+    cancellation takes effect.
+    """
+
+    def __init__(self, name: str, dispatch: Callable[[Callable[[], None]], None],
+                 on_progress: Optional[Callable[['Task'], None]] = None):
+        self.name = name
+        self.progress = 0.0
+        self.message = ""
+        self.future = None
+        self._dispatch = dispatch
+        self._on_progress = on_progress
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Stop the task if queued; a running task stops at its next progress report"""
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def check_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise TaskCancelled(self.name)
+
+    def set_progress(self, fraction: float, message: str = "") -> None:
+        """Report progress (0 to 1) from the worker; raises TaskCancelled if cancelled"""
+        self.check_cancelled()
+        self.progress = min(max(float(fraction), 0.0), 1.0)
+        self.message = message
+        if self._on_progress is not None:
+            self._dispatch(lambda: self._on_progress(self))
+
+
+class TaskExecutor:
+    """
+    Thread pool for analysis tasks.
+    Tasks are keyed by name (e.g. the calling screen); submitting under a name that is
+    still running cancels the earlier task. Callbacks are passed to dispatch, which in
+    the app schedules them on the Kivy event loop.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 dispatch: Optional[Callable[[Callable[[], None]], None]] = None):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='analysis')
+        self._dispatch = dispatch or (lambda callback: callback())
+        self._active: Dict[str, Task] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, func: Callable, *args,
+               on_done: Optional[Callable[[any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               on_progress: Optional[Callable[[Task], None]] = None, **kwargs) -> Task:
+        """
+        Run func(task, *args, **kwargs) in the pool.
+        on_done receives the result and on_error the exception; neither is called
+        for a cancelled task.
+        """
+        task = Task(name, self._dispatch, on_progress)
+        with self._lock:
+            previous = self._active.get(name)
+            if previous is not None:
+                previous.cancel()
+            self._active[name] = task
+
+        task.future = self._pool.submit(func, task, *args, **kwargs)
+        task.future.add_done_callback(lambda future: self._dispatch(
+            lambda: self._finish(task, future, on_done, on_error)))
+        return task
+
+    def _finish(self, task: Task, future, on_done, on_error) -> None:
+        with self._lock:
+            if self._active.get(task.name) is task:
+                del self._active[task.name]
+        if task.cancelled or future.cancelled():
+            return
+
+        error = future.exception()
+        if error is None:
+            if on_done is not None:
+                on_done(future.result())
+        elif not isinstance(error, TaskCancelled) and on_error is not None:
+            on_error(error)
+
+    def cancel(self, name: str) -> bool:
+        """Cancel the running task with this name; returns whether there was one"""
+        with self._lock:
+            task = self._active.pop(name, None)
+        if task is None:
+            return False
+        task.cancel()
+        return True
+
+    def is_busy(self, name: str) -> bool:
+        with self._lock:
+            return name in self._active
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Cancel all tasks and stop the worker threads"""
+        with self._lock:
+            tasks = list(self._active.values())
+            self._active.clear()
+        for task in tasks:
+            task.cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
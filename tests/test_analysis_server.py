@@ -0,0 +1,100 @@
+"""
+Analysis Server Tests
+Round trips against a server on localhost
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+from analysis_server import AnalysisService, make_server
+
+SAMPLE_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sample_data.csv')
+
+
+class AnalysisServerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.data_dir = tempfile.mkdtemp(prefix='analysis-data-')
+        with open(SAMPLE_DATA, encoding='utf-8') as src, \
+                open(os.path.join(cls.data_dir, 'sample.csv'), 'w', encoding='utf-8') as dst:
+            dst.write(src.read())
+        cls.service = AnalysisService(workers=1, data_dir=cls.data_dir)
+        cls.server = make_server(cls.service, port=0)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.service.close()
+
+    def request(self, method, path, body=None, content_type='application/json'):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(self.url + path, data=data, method=method,
+                                         headers={'Content-Type': content_type})
+        try:
+            with urllib.request.urlopen(request) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def upload_sample(self):
+        with open(SAMPLE_DATA, 'rb') as f:
+            status, dataset = self.request('POST', '/datasets', f.read(), 'text/csv')
+        self.assertEqual(status, 201)
+        return dataset['id']
+
+    def test_analysis_with_columns(self):
+        dataset_id = self.upload_sample()
+        for columns in (['Age'], ['Age', 'Score']):
+            status, result = self.request('POST', '/analyses', {'dataset': dataset_id, 'analysis': 'describe',
+                                                                'columns': columns})
+            self.assertEqual(status, 200, result)
+            self.assertEqual(sorted(result), sorted(columns))
+
+        status, result = self.request('POST', '/analyses', {'dataset': dataset_id, 'analysis': 'correlation',
+                                                            'columns': ['Age', 'Score']})
+        self.assertEqual(status, 200, result)
+
+    def test_columns_option_types(self):
+        dataset_id = self.upload_sample()
+        status, result = self.request('POST', '/analyses', {'dataset': dataset_id, 'analysis': 'describe',
+                                                            'columns': 'Age'})
+        self.assertEqual(status, 200, result)
+        self.assertEqual(list(result), ['Age'])
+
+        for columns in (3, {'Age': 1}, ['Age', 2]):
+            status, _ = self.request('POST', '/analyses', {'dataset': dataset_id, 'analysis': 'describe',
+                                                           'columns': columns})
+            self.assertEqual(status, 400)
+
+    def test_cache_distinguishes_column_options(self):
+        dataset_id = self.upload_sample()
+        _, age = self.request('POST', '/analyses', {'dataset': dataset_id, 'analysis': 'describe',
+                                                    'columns': ['Age']})
+        _, score = self.request('POST', '/analyses', {'dataset': dataset_id, 'analysis': 'describe',
+                                                      'columns': ['Score']})
+        self.assertEqual(list(age), ['Age'])
+        self.assertEqual(list(score), ['Score'])
+
+    def test_unknown_dataset(self):
+        status, _ = self.request('POST', '/analyses', {'dataset': 'missing', 'analysis': 'describe'})
+        self.assertEqual(status, 404)
+
+    def test_path_upload_limited_to_data_dir(self):
+        status, dataset = self.request('POST', '/datasets', {'path': 'sample.csv'})
+        self.assertEqual(status, 201, dataset)
+        for path in (SAMPLE_DATA, '../' + os.path.basename(self.data_dir) + '/../etc/passwd', '/etc/passwd'):
+            status, _ = self.request('POST', '/datasets', {'path': path})
+            self.assertEqual(status, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
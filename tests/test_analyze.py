@@ -0,0 +1,43 @@
+"""
+Command-Line Analysis Tests
+"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyze import analyze_files, main, run_analysis, to_rows
+
+SAMPLE_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sample_data.csv')
+
+
+def test_describe_matches_pandas():
+    df = pd.read_csv(SAMPLE_DATA)
+    result = run_analysis(df, 'describe', columns=['Age'])
+    assert result['Age']['mean'] == pytest.approx(df['Age'].mean())
+
+
+def test_missing_column_rejected():
+    with pytest.raises(ValueError, match='not found'):
+        run_analysis(pd.DataFrame({'a': [1.0, 2.0]}), 'describe', columns=['b'])
+
+
+def test_repeated_paths_analyzed_once(tmp_path):
+    other = tmp_path / 'other.csv'
+    pd.DataFrame({'Age': np.arange(10.0)}).to_csv(other, index=False)
+    paths = [SAMPLE_DATA, str(other), SAMPLE_DATA]
+
+    results = analyze_files(paths, ['describe'], workers=1, columns=['Age'])
+    assert list(results) == [SAMPLE_DATA, str(other)]
+    assert len({row['file'] for row in to_rows(results)}) == 2
+
+
+def test_main_reports_repeated_paths(tmp_path, capsys):
+    out = tmp_path / 'results.json'
+    assert main([SAMPLE_DATA, SAMPLE_DATA, '--columns', 'Age', '--workers', '1', '--out', str(out)]) == 0
+    assert 'repeated' in capsys.readouterr().err
+    with open(out, encoding='utf-8') as f:
+        assert list(json.load(f)) == [SAMPLE_DATA]
@@ -0,0 +1,44 @@
+"""
+Batch Render Tests
+Spec expansion and output file naming
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from batch_render import all_chart_specs, expand_specs, output_names, render_batch
+
+
+def test_repeated_specs_and_formats_dropped():
+    df = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [3.0, 1.0, 2.0]})
+    specs = expand_specs(all_chart_specs(df, ['png', 'png', 'svg']), ['png'])
+    keys = [tuple(sorted(spec.items())) for spec in specs]
+    assert len(keys) == len(set(keys))
+    assert len(specs) == 2 * (2 * 4 + 1)
+
+
+def test_names_unique_after_sanitizing():
+    specs = [{'chart': 'histogram', 'column': 'a b', 'format': 'png'},
+             {'chart': 'histogram', 'column': 'a_b', 'format': 'png'},
+             {'chart': 'histogram', 'column': 'a/b', 'format': 'png'},
+             {'chart': 'scatter', 'x': 'a_b', 'y': 'c', 'format': 'png'},
+             {'chart': 'scatter', 'x': 'a', 'y': 'b_c', 'format': 'png'}]
+    names = output_names(specs)
+    assert len(set(names)) == len(specs)
+    assert names[0] == 'histogram_a_b.png'
+    assert all(name.endswith('.png') for name in names)
+
+
+def test_render_batch_keeps_colliding_files(tmp_path):
+    rng = np.random.default_rng(0)
+    path = tmp_path / 'data.csv'
+    pd.DataFrame({'a b': rng.normal(size=50), 'a_b': rng.normal(size=50)}).to_csv(path, index=False)
+    specs = [{'chart': 'histogram', 'column': 'a b'}, {'chart': 'histogram', 'column': 'a_b'},
+             {'chart': 'histogram', 'column': 'a_b'}]
+
+    result = render_batch(str(path), str(tmp_path / 'out'), specs, ['png'], workers=1)
+    assert result['failed'] == []
+    assert len(result['written']) == 2
+    assert all(os.path.getsize(p) > 0 for p in result['written'])
@@ -0,0 +1,30 @@
+"""
+Benchmark Suite Tests
+"""
+
+from benchmark import CASES, find_regressions, run_benchmarks, uncovered_functions
+
+
+def test_every_public_function_has_a_case():
+    assert uncovered_functions() == []
+
+
+def test_every_case_runs_at_smallest_size():
+    lines = []
+    results = run_benchmarks(sizes=[1000], repeat=1, log=lines.append)
+    # Cases needing a missing optional dependency (e.g. openpyxl) are logged as skipped
+    skipped = {line.split('@')[0] for line in lines if 'skipped' in line}
+    assert {f"{case[0]}@1000" for case in CASES} == set(results) | {f"{name}@1000" for name in skipped}
+    assert all(result['seconds'] >= 0 and result['peak_bytes'] >= 0 for result in results.values())
+
+
+def test_find_regressions():
+    baseline = {'a@1000': {'seconds': 0.1, 'peak_bytes': 10 * 2 ** 20},
+                'b@1000': {'seconds': 0.001, 'peak_bytes': 1000}}
+    results = {'a@1000': {'seconds': 0.2, 'peak_bytes': 20 * 2 ** 20},
+               'b@1000': {'seconds': 0.002, 'peak_bytes': 5000},
+               'c@1000': {'seconds': 9.0, 'peak_bytes': 2 ** 30}}
+    regressions = find_regressions(results, baseline)
+    assert len(regressions) == 2
+    assert all(line.startswith('a@1000') for line in regressions)
+    assert find_regressions(results, baseline, tolerance=2.0) == []
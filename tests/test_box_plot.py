@@ -0,0 +1,101 @@
+"""
+Box Plot Summary and Quantile Sketch Tests
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from statistics_engine import BoxPlotSummary, QuantileSketch, exact_quantiles
+
+
+PROBS = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).lognormal(0, 1, 400_000)
+
+
+def test_exact_quantiles_match_percentile(data):
+    np.testing.assert_allclose(exact_quantiles(data, PROBS), np.percentile(data, np.array(PROBS) * 100))
+
+
+def test_sketch_quantiles_close_to_exact(data):
+    sketch = QuantileSketch(capacity=50_000).update(data)
+    ranks = np.searchsorted(np.sort(data), sketch.quantiles(PROBS)) / data.size
+    np.testing.assert_allclose(ranks, PROBS, atol=0.01)
+    assert sketch.count == data.size and sketch.min == data.min() and sketch.max == data.max()
+
+
+def test_sketch_is_exact_while_data_fits():
+    data = np.random.default_rng(1).normal(size=1000)
+    np.testing.assert_allclose(QuantileSketch().update(data).quantiles(PROBS),
+                               np.percentile(data, np.array(PROBS) * 100))
+
+
+def test_merge_is_unbiased():
+    zeros = QuantileSketch(seed=1).update(np.zeros(90_000))
+    ones = QuantileSketch(seed=2).update(np.ones(10_000))
+    merged = zeros.merge(ones)
+    assert merged.count == 100_000
+    assert merged.sample.mean() == pytest.approx(0.1, abs=0.005)
+
+
+def test_merged_quantiles_match_combined_data():
+    rng = np.random.default_rng(3)
+    parts = [rng.normal(0, 1, 300_000), rng.normal(4, 2, 100_000), rng.exponential(1, 50_000)]
+    merged = QuantileSketch(capacity=20_000, seed=0)
+    for i, part in enumerate(parts):
+        merged.merge(QuantileSketch(capacity=20_000, seed=i + 1).update(part))
+    combined = np.sort(np.concatenate(parts))
+    ranks = np.searchsorted(combined, merged.quantiles(PROBS)) / combined.size
+    np.testing.assert_allclose(ranks, PROBS, atol=0.02)
+    assert merged.count == combined.size
+
+
+def test_box_summary_matches_numpy():
+    data = np.random.default_rng(4).normal(size=10_001)
+    summary = BoxPlotSummary.summarize(data, method='exact', max_fliers=10)
+    q1, med, q3 = np.percentile(data, [25, 50, 75])
+    assert (summary['q1'], summary['med'], summary['q3']) == pytest.approx((q1, med, q3))
+    low, high = q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1)
+    assert summary['whislo'] == data[data >= low].min()
+    assert summary['whishi'] == data[data <= high].max()
+    assert summary['n_fliers'] == np.count_nonzero((data < low) | (data > high))
+    assert len(summary['fliers']) <= 10
+    assert summary['mean'] == pytest.approx(data.mean())
+
+
+def test_box_summary_sketch_close_to_exact(data):
+    exact = BoxPlotSummary.summarize(data, method='exact')
+    sketch = BoxPlotSummary.summarize(data, method='sketch')
+    for key in ('q1', 'med', 'q3'):
+        assert sketch[key] == pytest.approx(exact[key], rel=0.02)
+    assert sketch['mean'] == pytest.approx(exact['mean'])
+    assert sketch['count'] == exact['count']
+
+
+def test_box_summary_sketch_streams_in_chunks():
+    data = np.random.default_rng(5).standard_t(3, 3_000_000)
+    data[::97] = np.nan
+    values = data[~np.isnan(data)]
+
+    tracemalloc.start()
+    summary = BoxPlotSummary.summarize(data, method='sketch', max_fliers=50)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 0.25 * data.nbytes
+
+    low = summary['q1'] - 1.5 * (summary['q3'] - summary['q1'])
+    high = summary['q3'] + 1.5 * (summary['q3'] - summary['q1'])
+    outside = (values < low) | (values > high)
+    assert summary['count'] == values.size
+    assert summary['mean'] == pytest.approx(values.mean())
+    assert summary['whislo'] == values[values >= low].min()
+    assert summary['whishi'] == values[values <= high].max()
+    assert summary['n_fliers'] == np.count_nonzero(outside)
+    assert len(summary['fliers']) == 50
+    assert values[outside].min() in summary['fliers'] and values[outside].max() in summary['fliers']
+    assert np.isin(summary['fliers'], values[outside]).all()
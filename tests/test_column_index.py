@@ -0,0 +1,42 @@
+"""
+Column Index Tests
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from column_index import ColumnIndex, column_kind
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'Score': [1.0], 'high_score': [2], 'Name': ['a'], 'Passed': [True],
+                         'Date': pd.to_datetime(['2024-01-01']), 7: [3.0]})
+
+
+def test_column_kinds(df):
+    assert [column_kind(dtype) for dtype in df.dtypes] == ['numeric', 'numeric', 'categorical', 'boolean',
+                                                           'datetime', 'numeric']
+
+
+def test_prefix_matches_first(df):
+    index = ColumnIndex(df)
+    assert index.search('score') == ['Score', 'high_score']
+    assert index.search('SCORE', 'numeric') == ['Score', 'high_score']
+    assert index.search('', 'boolean') == ['Passed']
+    assert index.search('7') == [7]
+    assert index.search() == list(df.columns)
+
+
+def test_incremental_search_matches_fresh_search():
+    rng = np.random.default_rng(0)
+    names = [''.join(rng.choice(list('abcde'), size=6)) for _ in range(2000)]
+    index = ColumnIndex(pd.DataFrame(columns=list(dict.fromkeys(names))))
+    for query in ('a', 'ab', 'abc', 'ab', 'b', 'bd', ''):
+        assert index.search(query) == ColumnIndex(pd.DataFrame(columns=index.columns)).search(query)
+
+
+def test_invalid_kind(df):
+    with pytest.raises(ValueError):
+        ColumnIndex(df).search('', 'text')
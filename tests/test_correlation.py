@@ -0,0 +1,35 @@
+"""
+Correlation Heatmap Tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from statistics_engine import CorrelationAnalysis
+
+
+def test_cluster_order_groups_correlated_columns():
+    rng = np.random.default_rng(0)
+    a, b = rng.normal(size=500), rng.normal(size=500)
+    df = pd.DataFrame({'a1': a, 'b1': b, 'a2': a + rng.normal(0, 0.1, 500),
+                       'b2': b + rng.normal(0, 0.1, 500), 'a3': -a + rng.normal(0, 0.1, 500)})
+    order = CorrelationAnalysis.cluster_order(CorrelationAnalysis.correlation_matrix(df))
+    names = [df.columns[i] for i in order]
+    assert sorted(order) == list(range(5))
+    groups = ''.join(name[0] for name in names)
+    assert groups in ('aaabb', 'bbaaa')
+
+
+def test_cluster_order_small_and_constant_columns():
+    assert CorrelationAnalysis.cluster_order(pd.DataFrame(np.eye(2))) == [0, 1]
+    df = pd.DataFrame({'x': [1.0, 2, 3, 4], 'y': [2.0, 1, 4, 3], 'z': [1.0, 1, 1, 1]})
+    assert sorted(CorrelationAnalysis.cluster_order(df.corr())) == [0, 1, 2]
+
+
+def test_heatmap_tiles_cover_matrix():
+    from charts import heatmap_tiles
+    tiles = heatmap_tiles(250, tile_size=100)
+    covered = np.zeros((250, 250), dtype=int)
+    for r0, r1, c0, c1 in tiles:
+        covered[r0:r1, c0:c1] += 1
+    assert len(tiles) == 9 and np.all(covered == 1)
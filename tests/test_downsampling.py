@@ -0,0 +1,58 @@
+"""
+Downsampling Tests
+"""
+
+import numpy as np
+import pytest
+
+from downsampling import density_grid, downsample, lttb, minmax_decimate
+
+
+@pytest.fixture
+def series():
+    x = np.arange(100_000, dtype=float)
+    y = np.sin(x / 500) + np.random.default_rng(0).normal(0, 0.01, x.size)
+    y[12_345] = 50.0
+    return x, y
+
+
+def test_lttb_keeps_endpoints_and_order(series):
+    x, y = series
+    x_out, y_out = lttb(x, y, 1000)
+    assert x_out.size == 1000
+    assert x_out[0] == x[0] and x_out[-1] == x[-1]
+    assert np.all(np.diff(x_out) > 0)
+    assert 50.0 in y_out
+
+
+def test_minmax_keeps_every_extreme(series):
+    x, y = series
+    x_out, y_out = minmax_decimate(x, y, 500)
+    assert x_out.size <= 1002
+    assert y_out.max() == y.max() and y_out.min() == y.min()
+    assert np.all(np.diff(x_out) > 0)
+
+
+def test_downsample_target_size(series):
+    x, y = series
+    assert downsample(x, y, 800)[0].size == 1600
+    small_x, small_y = downsample(x[:100], y[:100], 800)
+    assert small_x.size == 100
+    with pytest.raises(ValueError):
+        downsample(x, y[:10], 800)
+    with pytest.raises(ValueError):
+        downsample(x, y, 800, method='unknown')
+
+
+def test_density_grid_matches_histogram2d():
+    rng = np.random.default_rng(1)
+    x, y = rng.normal(size=10_000), rng.normal(size=10_000)
+    counts, extent = density_grid(x, y, (40, 30))
+    expected, _, _ = np.histogram2d(y, x, bins=(30, 40), range=[extent[2:], extent[:2]])
+    np.testing.assert_array_equal(counts, expected)
+    assert counts.sum() == x.size
+
+
+def test_density_grid_skips_non_finite():
+    counts, _ = density_grid([0.0, 1.0, np.nan], [0.0, 1.0, 2.0], (2, 2))
+    assert counts.sum() == 2
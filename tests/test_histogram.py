@@ -0,0 +1,44 @@
+"""
+Histogram Engine Tests
+"""
+
+import numpy as np
+import pytest
+
+from statistics_engine import HistogramEngine
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).gamma(2.0, 3.0, 5000)
+
+
+@pytest.mark.parametrize('rule', ['fd', 'sturges', 'doane', 'auto'])
+def test_bin_rules_match_numpy(data, rule):
+    expected = len(np.histogram_bin_edges(data, bins=rule)) - 1
+    assert HistogramEngine.bin_count(data, rule) == expected
+
+
+def test_counts_match_numpy(data):
+    hist = HistogramEngine.compute(data, 25, chunk_size=700)
+    counts, edges = np.histogram(data, bins=25)
+    np.testing.assert_array_equal(hist['counts'], counts)
+    np.testing.assert_allclose(hist['edges'], edges)
+    assert hist['total'] == data.size and hist['rule'] == 'fixed'
+
+
+def test_default_rule_is_reported(data):
+    hist = HistogramEngine.compute(data)
+    assert hist['rule'] == 'auto'
+    assert len(hist['counts']) == HistogramEngine.bin_count(data, 'auto')
+
+
+def test_constant_data():
+    assert HistogramEngine.bin_count([5.0] * 100, 'doane') == HistogramEngine.bin_count([5.0] * 100, 'sturges')
+    hist = HistogramEngine.compute([5.0] * 100, 'doane')
+    assert hist['total'] == 100
+
+
+def test_invalid_rule(data):
+    with pytest.raises(ValueError):
+        HistogramEngine.bin_count(data, 'unknown')
@@ -0,0 +1,44 @@
+"""
+Kernel Density Tests
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from statistics_engine import KernelDensity
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return np.concatenate([rng.normal(0, 1, 3000), rng.normal(5, 0.5, 1000)])
+
+
+def test_estimate_matches_scipy_gaussian_kde(data):
+    kde = KernelDensity.estimate(data, grid_size=1024)
+    bandwidth = kde['bandwidth'] / np.std(data, ddof=1)
+    expected = stats.gaussian_kde(data, bw_method=bandwidth)(kde['grid'])
+    np.testing.assert_allclose(kde['density'], expected, atol=2e-3 * expected.max())
+
+
+def test_density_integrates_to_one(data):
+    kde = KernelDensity.estimate(data)
+    assert kde['density'].sum() * (kde['grid'][1] - kde['grid'][0]) == pytest.approx(1, abs=1e-3)
+
+
+def test_bandwidth_rules(data):
+    std = np.std(data, ddof=1)
+    q1, q3 = np.percentile(data, [25, 75])
+    sigma = min(std, (q3 - q1) / 1.349)
+    assert KernelDensity.bandwidth(data, 'scott') == pytest.approx(1.059 * sigma * data.size ** -0.2)
+    assert KernelDensity.bandwidth(data, 'silverman') == pytest.approx(0.9 * sigma * data.size ** -0.2)
+    with pytest.raises(ValueError):
+        KernelDensity.bandwidth(data, 'unknown')
+
+
+def test_constant_and_non_finite_data():
+    kde = KernelDensity.estimate([2.0, 2.0, np.nan, np.inf])
+    assert np.all(np.isfinite(kde['density'])) and kde['bandwidth'] > 0
+    with pytest.raises(ValueError):
+        KernelDensity.estimate([np.nan])
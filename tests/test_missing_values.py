@@ -0,0 +1,50 @@
+"""
+Missing Value Tests
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from missing_values import FilledView, MissingValueIndex, impute
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({'a': [1.0, np.nan, 3.0, 4.0], 'b': ['x', 'y', None, 'y'], 'c': [1, 2, 3, 4]})
+
+
+def test_index_matches_isna(frame):
+    index = MissingValueIndex(frame)
+    assert index.counts() == frame.isna().sum().to_dict()
+    assert index.columns_with_missing() == ['a', 'b']
+    np.testing.assert_array_equal(index.mask('a'), frame['a'].isna().to_numpy())
+    np.testing.assert_array_equal(index.row_mask(), frame.isna().any(axis=1).to_numpy())
+
+
+@pytest.mark.parametrize('method', ['mean', 'median', 'mode'])
+def test_filled_view_matches_impute(frame, method):
+    view = FilledView(frame, method)
+    expected = impute(frame, method)
+    for col in frame.columns:
+        pd.testing.assert_series_equal(view[col], expected[col])
+
+
+def test_drop_view(frame):
+    view = FilledView(frame, 'drop')
+    assert len(view) == 2
+    assert view['c'].tolist() == [1, 4]
+    np.testing.assert_array_equal(view.kept_rows(), [True, False, False, True])
+
+
+def test_untouched_columns_are_not_copied(frame):
+    view = FilledView(frame, 'mean')
+    assert np.shares_memory(view['c'].to_numpy(), frame['c'].to_numpy())
+
+
+def test_constant_requires_fill_value(frame):
+    with pytest.raises(ValueError, match="fill value is required"):
+        impute(frame, 'constant')
+    with pytest.raises(ValueError, match="fill value is required"):
+        FilledView(frame, 'constant')
+    assert impute(frame, 'constant', 0)['a'].tolist() == [1.0, 0.0, 3.0, 4.0]
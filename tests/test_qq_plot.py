@@ -0,0 +1,53 @@
+"""
+Q-Q Plot Tests
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from statistics_engine import QQPlot
+
+
+def test_small_sample_matches_probplot():
+    data = np.random.default_rng(0).exponential(size=300)
+    qq = QQPlot.compute(data)
+    (theoretical, sample), (slope, intercept, r) = stats.probplot(data)
+    np.testing.assert_allclose(qq['theoretical'], theoretical)
+    np.testing.assert_allclose(qq['sample'], sample)
+    assert (qq['slope'], qq['intercept']) == pytest.approx((slope, intercept))
+    assert qq['r_squared'] == pytest.approx(r ** 2)
+
+
+@pytest.mark.parametrize('dist', ['norm', 't'])
+def test_sketch_tails_match_exact(dist):
+    rng = np.random.default_rng(1)
+    data = rng.standard_normal(2_000_000) if dist == 'norm' else rng.standard_t(3, 2_000_000)
+    exact = QQPlot.compute(data, method='exact')
+    sketch = QQPlot.compute(data, method='sketch')
+    np.testing.assert_allclose(sketch['theoretical'], exact['theoretical'])
+    # The most extreme levels come from exactly kept tail values
+    np.testing.assert_allclose(sketch['sample'][:100], exact['sample'][:100])
+    np.testing.assert_allclose(sketch['sample'][-100:], exact['sample'][-100:])
+    # Elsewhere the reservoir's rank error stays small relative to each tail probability
+    ranks = np.searchsorted(np.sort(data), sketch['sample']) / data.size
+    levels = sketch['probabilities']
+    tail = np.minimum(levels, 1 - levels)
+    assert np.all(np.abs(ranks - levels) <= 0.1 * tail + 1e-5)
+
+
+def test_r_squared_describes_drawn_line():
+    data = np.random.default_rng(2).exponential(size=50_000)
+    qq = QQPlot.compute(data, line='quartiles')
+    fitted = qq['slope'] * qq['theoretical'] + qq['intercept']
+    residual = np.sum((qq['sample'] - fitted) ** 2)
+    total = np.sum((qq['sample'] - qq['sample'].mean()) ** 2)
+    assert qq['r_squared'] == pytest.approx(1 - residual / total)
+    assert qq['r_squared'] < qq['ppcc'] ** 2
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        QQPlot.compute([1.0])
+    with pytest.raises(ValueError):
+        QQPlot.compute([1.0, 2.0, 3.0], dist='not_a_distribution')
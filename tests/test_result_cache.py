@@ -0,0 +1,63 @@
+"""
+Result Cache Tests
+"""
+
+import numpy as np
+import pandas as pd
+
+from result_cache import ResultCache, fingerprint
+
+
+def test_fingerprint_distinguishes_large_object_arrays():
+    a = np.array(['x'] * 2000, dtype=object)
+    b = a.copy()
+    b[1000] = 'y'
+    assert fingerprint(a) != fingerprint(b)
+
+
+def test_fingerprint_handles_nested_sequences():
+    assert fingerprint([('columns', ['Age']), ('x', 1)]) != fingerprint([('columns', ['Score']), ('x', 1)])
+    assert fingerprint([1, 2, 3]) == fingerprint(np.array([1, 2, 3]))
+
+
+def test_fingerprint_of_frames_depends_on_content():
+    df = pd.DataFrame({'a': [1.0, 2.0]})
+    assert fingerprint(df) == fingerprint(df.copy())
+    assert fingerprint(df) != fingerprint(df + 1)
+
+
+def test_results_are_copied_in_and_out():
+    cache = ResultCache()
+    result = {'mean': 1.0, 'values': [1, 2, 3]}
+    cache.put('key', result)
+    result['values'].append(4)
+    cached = cache.get('key')
+    assert cached == {'mean': 1.0, 'values': [1, 2, 3]}
+    cached['mean'] = 99
+    assert cache.get('key')['mean'] == 1.0
+
+
+def test_eviction_by_size():
+    cache = ResultCache(max_bytes=20_000)
+    cache.put('a', np.zeros(1000))
+    cache.put('b', np.zeros(1000))
+    cache.put('c', np.zeros(1000))
+    assert 'a' not in cache and 'c' in cache
+    assert cache.total_bytes <= 20_000
+
+
+def test_call_memoizes_and_persists(tmp_path):
+    calls = []
+
+    def square(values):
+        calls.append(1)
+        return np.asarray(values) ** 2
+
+    cache = ResultCache(disk_dir=str(tmp_path))
+    np.testing.assert_array_equal(cache.call(square, [1, 2, 3]), [1, 4, 9])
+    np.testing.assert_array_equal(cache.call(square, [1, 2, 3]), [1, 4, 9])
+    assert len(calls) == 1
+
+    reloaded = ResultCache(disk_dir=str(tmp_path))
+    np.testing.assert_array_equal(reloaded.call(square, [1, 2, 3]), [1, 4, 9])
+    assert len(calls) == 1
@@ -0,0 +1,67 @@
+"""
+Row Filter Tests
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from missing_values import FilledView
+from row_filter import FilteredView, MaskCache, evaluate_filter
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({'Age': [20.0, 25.0, np.nan, 30.0, 35.0],
+                         'Score': [1.0, np.nan, 3.0, 4.0, 5.0],
+                         'Grade': ['A', 'B', 'A', 'A', 'C'],
+                         'Full Name': ['a', 'b', 'c', 'd', 'e']})
+
+
+def test_evaluate_filter(df):
+    np.testing.assert_array_equal(evaluate_filter(df, 'Age > 23 and Grade == "A"'),
+                                  [False, False, False, True, False])
+    np.testing.assert_array_equal(evaluate_filter(df, '`Full Name` in ["a", "e"]'),
+                                  [True, False, False, False, True])
+
+
+@pytest.mark.parametrize('expression', ['', 'Age +', 'Age + 1', 'Missing > 1', '__import__("os")'])
+def test_evaluate_filter_rejects(df, expression):
+    with pytest.raises(ValueError):
+        evaluate_filter(df, expression)
+
+
+def test_mask_cache_keyed_by_version_and_expression(df):
+    cache = MaskCache(max_entries=2)
+    first = cache.mask('data', 1, df, 'Age > 23')
+    np.testing.assert_array_equal(cache.mask('data', 1, df, ' Age  >  23 '), first)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    changed = df.assign(Age=df['Age'] - 10)
+    np.testing.assert_array_equal(cache.mask('data', 2, changed, 'Age > 23'), [False, False, False, False, True])
+    assert cache.misses == 2
+
+    cache.mask('data', 2, changed, 'Score > 2')
+    cache.mask('data', 1, df, 'Age > 23')
+    assert cache.misses == 4
+
+
+def test_filtered_view_of_frame(df):
+    view = FilteredView(df, evaluate_filter(df, 'Grade == "A"'))
+    assert len(view) == 3
+    assert view['Score'].tolist() == [1.0, 3.0, 4.0]
+    pd.testing.assert_frame_equal(view[['Age', 'Score']], df.loc[[0, 2, 3], ['Age', 'Score']])
+
+
+def test_filtered_view_of_dropped_rows(df):
+    filled = FilledView(df, 'drop')
+    view = FilteredView(filled, evaluate_filter(df, 'Grade == "A"'))
+    assert len(view) == 2
+    assert view['Age'].tolist() == [20.0, 30.0]
+    assert list(view[['Age', 'Score']].index) == [0, 3]
+
+
+def test_filtered_view_of_filled_values(df):
+    view = FilteredView(FilledView(df, 'mean'), evaluate_filter(df, 'Grade != "C"'))
+    assert view['Age'].tolist() == [20.0, 25.0, 27.5, 30.0]
+    assert view[['Age', 'Score']].notna().all().all()
@@ -0,0 +1,65 @@
+"""
+Scaler Tests
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from scalers import MinMaxScaler, RobustScaler, Scaler, StandardScaler
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(0).normal(10, 3, 10_000)
+
+
+def test_standard_scaler_chunks_match_numpy(data):
+    scaler = StandardScaler().fit(np.array_split(data, 7))
+    assert scaler.mean == pytest.approx(data.mean())
+    assert scaler.std == pytest.approx(data.std())
+    scaled = scaler.transform(data)
+    assert scaled.mean() == pytest.approx(0, abs=1e-9)
+    assert scaled.std() == pytest.approx(1)
+
+
+def test_minmax_scaler(data):
+    scaled = MinMaxScaler().fit(data).transform(data)
+    assert scaled.min() == pytest.approx(0) and scaled.max() == pytest.approx(1)
+
+
+def test_robust_scaler_matches_percentiles(data):
+    scaler = RobustScaler().fit(data)
+    q1, median, q3 = np.percentile(data, [25, 50, 75])
+    assert scaler.median == pytest.approx(median)
+    assert scaler.iqr == pytest.approx(q3 - q1)
+
+
+def test_missing_values_are_ignored():
+    scaler = StandardScaler().fit(np.array([1.0, np.nan, 3.0]))
+    assert scaler.n_samples == 2 and scaler.mean == 2.0
+
+
+def test_inverse_and_round_trip(data):
+    scaler = StandardScaler().fit(data)
+    np.testing.assert_allclose(scaler.inverse_transform(scaler.transform(data)), data)
+    restored = Scaler.from_json(scaler.to_json())
+    np.testing.assert_allclose(restored.transform(data), scaler.transform(data))
+
+
+def test_inplace_requires_float_array():
+    scaler = StandardScaler().fit([1.0, 2.0, 3.0])
+    array = np.array([1.0, 2.0, 3.0])
+    assert scaler.transform(array, inplace=True) is array
+    with pytest.raises(ValueError):
+        scaler.transform([1.0, 2.0], inplace=True)
+
+
+def test_transform_columns_only_touches_named_columns():
+    df = pd.DataFrame({'x': [1.0, 2.0, 3.0], 'y': [10.0, 20.0, 30.0]})
+    scaled = StandardScaler().fit(df['y']).transform_columns(df, ['y'], inplace=False)
+    assert scaled['x'].tolist() == [1.0, 2.0, 3.0]
+    assert df['y'].tolist() == [10.0, 20.0, 30.0]
+    assert scaled['y'].mean() == pytest.approx(0)
+    with pytest.raises(ValueError):
+        StandardScaler().fit(df['y']).transform_columns(df, ['z'])
@@ -0,0 +1,34 @@
+"""
+Startup Profiling Tests
+"""
+
+import sys
+import threading
+
+from startup_profile import LazyModule, StartupProfiler, profiler, warm_up
+
+
+def test_lazy_module_imports_on_first_attribute():
+    sys.modules.pop('colorsys', None)
+    module = LazyModule('colorsys')
+    assert 'colorsys' not in sys.modules
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert 'colorsys' in sys.modules
+    assert any(name == 'import colorsys (on demand)' for name, *_ in profiler.phases)
+
+
+def test_warm_up_imports_in_background():
+    sys.modules.pop('wave', None)
+    done = threading.Event()
+    warm_up(['wave', 'no_such_module_here'], on_done=done.set).join(timeout=10)
+    assert done.is_set()
+    assert 'wave' in sys.modules
+
+
+def test_report_orders_phases():
+    startup = StartupProfiler()
+    with startup.phase('load kv'):
+        pass
+    startup.mark('first frame')
+    lines = startup.report().splitlines()
+    assert lines[3].startswith('load kv') and lines[4].startswith('first frame')
@@ -0,0 +1,74 @@
+"""
+Tracing Tests
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from tracing import SpanRecorder
+
+
+def test_nested_spans_split_exclusive_time():
+    recorder = SpanRecorder()
+    with recorder.span('handler', 'other'):
+        with recorder.span('read', 'load'):
+            time.sleep(0.02)
+        with recorder.span('stats', 'compute'):
+            time.sleep(0.01)
+
+    spans = {s.name: s for s in recorder.spans()}
+    assert {s.root for s in spans.values()} == {'handler'}
+    assert spans['read'].depth == 1 and spans['handler'].depth == 0
+    handler = spans['handler']
+    assert handler.exclusive == pytest.approx(handler.duration - spans['read'].duration - spans['stats'].duration)
+
+    row = recorder.breakdown()['handler']
+    assert row['calls'] == 1
+    assert row['load'] + row['compute'] + row['other'] == pytest.approx(row['total'])
+    assert row['load'] >= 0.02 and row['compute'] >= 0.01
+
+
+def test_threads_nest_separately():
+    recorder = SpanRecorder()
+
+    def work(name):
+        with recorder.span(name):
+            with recorder.span('inner', 'compute'):
+                pass
+
+    threads = [threading.Thread(target=work, args=(f"handler{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(recorder.breakdown()) == [f"handler{i}" for i in range(4)]
+    assert all(s.depth == 1 for s in recorder.spans() if s.name == 'inner')
+
+
+def test_ring_buffer_and_disabled():
+    recorder = SpanRecorder(capacity=3)
+    for i in range(5):
+        with recorder.span(str(i)):
+            pass
+    assert [s.name for s in recorder.spans()] == ['2', '3', '4']
+
+    recorder.enabled = False
+    with recorder.span('skipped'):
+        pass
+    assert len(recorder.spans()) == 3
+
+
+def test_chrome_trace_export(tmp_path):
+    recorder = SpanRecorder()
+    with recorder.span('handler'):
+        with recorder.span('read', 'load'):
+            pass
+    path = tmp_path / 'trace.json'
+    assert recorder.export_chrome_trace(str(path)) == 2
+    with open(path, encoding='utf-8') as f:
+        events = json.load(f)['traceEvents']
+    assert sorted(e['name'] for e in events if e['ph'] == 'X') == ['handler', 'read']
+    assert any(e['ph'] == 'M' for e in events)
@@ -0,0 +1,58 @@
+"""
+Data Utility Tests
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from row_filter import FilteredView
+from utils import aggregate_by_category
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    categories = rng.choice(list('ABCDEFGHIJKL'), size=5_000, p=np.arange(12, 0, -1) / 78)
+    df = pd.DataFrame({'cat': categories, 'value': rng.normal(10, 3, 5_000)})
+    df.loc[::50, 'cat'] = None
+    df.loc[::37, 'value'] = np.nan
+    return df
+
+
+@pytest.mark.parametrize('agg', ['count', 'sum', 'mean'])
+def test_aggregate_matches_groupby(df, agg):
+    labels, values = aggregate_by_category(df, 'cat', 'value', agg=agg, top_k=20)
+    if agg == 'count':
+        expected = df.groupby('cat').size()
+    else:
+        expected = df.dropna().groupby('cat')['value'].agg(agg)
+    expected = expected.sort_values(ascending=False, kind='stable')
+    assert labels == list(expected.index)
+    np.testing.assert_allclose(values, expected.to_numpy())
+
+
+def test_rest_folded_into_other(df):
+    labels, values = aggregate_by_category(df, 'cat', 'value', agg='mean', top_k=3)
+    assert len(labels) == 4 and labels[-1] == 'Other'
+    rest = df.dropna()[~df.dropna()['cat'].isin(labels[:3])]
+    assert values[-1] == pytest.approx(rest['value'].mean())
+
+    labels, values = aggregate_by_category(df, 'cat', top_k=3)
+    assert sum(values) == df['cat'].notna().sum()
+
+
+def test_aggregate_filtered_view(df):
+    mask = (df['value'] > 10).to_numpy()
+    labels, values = aggregate_by_category(FilteredView(df, mask), 'cat', top_k=20)
+    expected = df[mask].groupby('cat').size()
+    assert dict(zip(labels, values)) == expected.astype(float).to_dict()
+
+
+def test_aggregate_invalid_input(df):
+    with pytest.raises(ValueError):
+        aggregate_by_category(df, 'missing')
+    with pytest.raises(ValueError):
+        aggregate_by_category(df, 'cat', agg='sum')
+    with pytest.raises(ValueError):
+        aggregate_by_category(df, 'cat', 'value', agg='median')
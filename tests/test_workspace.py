@@ -0,0 +1,86 @@
+"""
+Workspace Tests
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from workspace import Workspace
+
+
+def frame(seed, rows=10_000):
+    return pd.DataFrame({'a': np.random.default_rng(seed).normal(size=rows), 'b': np.arange(rows)})
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    # Room for two frames of 10,000 rows (160 KB each)
+    ws = Workspace(memory_limit=400_000, spill_dir=str(tmp_path / 'spill'))
+    yield ws
+    ws.close()
+
+
+def test_least_recent_spilled_and_reloaded(workspace):
+    frames = {name: frame(seed) for seed, name in enumerate(('one', 'two', 'three'))}
+    for name, df in frames.items():
+        workspace.add(name, df)
+
+    residency = {item['name']: item['in_memory'] for item in workspace.info()}
+    assert residency == {'one': False, 'two': True, 'three': True}
+    assert workspace.memory_in_use <= workspace.memory_limit
+    spilled = workspace.info()[-1]['path']
+    assert os.path.exists(spilled)
+
+    pd.testing.assert_frame_equal(workspace.get('one'), frames['one'])
+    assert [item['name'] for item in workspace.info() if item['in_memory']] == ['one', 'three']
+    assert workspace.info()[-1]['name'] == 'two'
+
+
+def test_spill_file_written_once_and_removed(workspace):
+    workspace.add('one', frame(0))
+    workspace.add('two', frame(1))
+    workspace.add('three', frame(2))
+    path = workspace.info()[-1]['path']
+    mtime = os.path.getmtime(path)
+
+    workspace.get('one')
+    workspace.get('two')
+    workspace.get('three')
+    assert os.path.getmtime(path) == mtime
+
+    workspace.remove('one')
+    assert not os.path.exists(path)
+    assert 'one' not in workspace
+
+
+def test_most_recent_kept_over_budget(tmp_path):
+    ws = Workspace(memory_limit=1, spill_dir=str(tmp_path))
+    ws.add('big', frame(0))
+    assert ws.info()[0]['in_memory']
+    ws.close()
+
+
+def test_readd_changes_version_and_missing_index(workspace):
+    workspace.add('data', pd.DataFrame({'a': [1.0, np.nan, 3.0]}))
+    version = workspace.version('data')
+    assert workspace.missing_index('data').counts() == {'a': 1}
+
+    workspace.add('data', pd.DataFrame({'a': [1.0, 2.0, 3.0]}))
+    assert workspace.version('data') != version
+    assert workspace.missing_index('data').counts() == {'a': 0}
+
+
+def test_name_for(workspace, tmp_path):
+    first, second = str(tmp_path / 'a' / 'data.csv'), str(tmp_path / 'b' / 'data.csv')
+    assert workspace.name_for(first) == 'data.csv'
+    workspace.add('data.csv', frame(0), source=first)
+    assert workspace.name_for(first) == 'data.csv'
+    assert workspace.name_for(second) == 'data (2).csv'
+
+
+def test_unknown_dataset(workspace):
+    with pytest.raises(KeyError):
+        workspace.get('missing')
@@ -0,0 +1,145 @@
+"""
+Tracing Module
+Lightweight timing spans collected in an in-memory ring buffer,
+with per-phase breakdowns and Chrome trace export
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple, Optional
+
+
+# Phases shown as columns of the breakdown; spans of other categories count as 'other'
+PHASES = ('parse', 'load', 'compute', 'render')
+
+
+class Span(NamedTuple):
+    name: str
+    category: str
+    start: float  # seconds since the recorder was created
+    duration: float
+    exclusive: float  # duration minus time spent in nested spans
+    root: str  # outermost span on the same thread, e.g. the handler
+    depth: int
+    thread_id: int
+    thread_name: str
+
+
+class SpanRecorder:
+    """
+    Records finished spans into a ring buffer of fixed capacity.
+    Nesting is tracked per thread so each span knows its handler (root)
+    and its exclusive time, which keeps phase totals from double counting.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        self.origin = time.perf_counter()
+        self.enabled = True
+        self._spans = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name: str, category: str = 'other'):
+        """Time a block of work"""
+        if not self.enabled:
+            yield
+            return
+
+        stack = self._local.__dict__.setdefault('stack', [])
+        frame = [name, 0.0]  # name, time spent in child spans
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][1] += duration
+            thread = threading.current_thread()
+            record = Span(name, category, start - self.origin, duration, max(duration - frame[1], 0.0),
+                          stack[0][0] if stack else name, len(stack), thread.ident, thread.name)
+            with self._lock:
+                self._spans.append(record)
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per root span: number of calls, total time and exclusive time per phase (seconds).
+        Time a root spends outside any nested span counts as 'other'.
+        """
+        rows: Dict[str, Dict[str, float]] = {}
+        for span in self.spans():
+            row = rows.setdefault(span.root, {'calls': 0, 'total': 0.0,
+                                              **{phase: 0.0 for phase in PHASES + ('other',)}})
+            if span.depth == 0:
+                row['calls'] += 1
+                row['total'] += span.duration
+            row[span.category if span.category in PHASES else 'other'] += span.exclusive
+        return rows
+
+    def summary(self, recent: int = 20) -> str:
+        """Format the breakdown and the most recent spans as readable string"""
+        spans = self.spans()
+        output = f"Timing Breakdown ({len(spans)} spans):\n" + "="*50 + "\n"
+        output += f"{'Handler':<30}{'Calls':>6}{'Total':>10}" + "".join(f"{p:>10}" for p in PHASES + ('other',))
+        output += "\n"
+        rows = sorted(self.breakdown().items(), key=lambda item: item[1]['total'], reverse=True)
+        for root, row in rows:
+            output += f"{root[:29]:<30}{row['calls']:>6}{row['total'] * 1000:>10.1f}"
+            output += "".join(f"{row[p] * 1000:>10.1f}" for p in PHASES + ('other',)) + "\n"
+        output += "(times in ms)\n\nRecent Spans:\n" + "="*50 + "\n"
+        for span in spans[-recent:]:
+            label = '  ' * span.depth + span.name
+            output += f"{label[:40]:<42}{span.category:<10}{span.duration * 1000:>10.2f} ms\n"
+        return output
+
+    def export_chrome_trace(self, path: str) -> int:
+        """
+        Write the spans as a Chrome trace (chrome://tracing, Perfetto).
+        Returns the number of spans written.
+        """
+        spans = self.spans()
+        pid = os.getpid()
+        events = [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread_name}}
+                  for tid, thread_name in {(s.thread_id, s.thread_name) for s in spans}]
+        events += [{'name': s.name, 'cat': s.category, 'ph': 'X', 'pid': pid, 'tid': s.thread_id,
+                    'ts': s.start * 1e6, 'dur': s.duration * 1e6,
+                    'args': {'root': s.root, 'exclusive_ms': s.exclusive * 1000}} for s in spans]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return len(spans)
+
+
+recorder = SpanRecorder()
+
+
+def span(name: str, category: str = 'other'):
+    """Time a block of work with the shared recorder"""
+    return recorder.span(name, category)
+
+
+def traced(category: str = 'other', name: Optional[str] = None):
+    """Decorator recording each call of the function as a span"""
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with recorder.span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
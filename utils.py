@@ -5,11 +5,18 @@ Handles file I/O, data validation, and preprocessing
 
 import csv
 import os
+import re
 import pandas as pd
 import numpy as np
 from typing import List, Tuple, Dict, Optional
 
+from memory_budget import memory_report
+from missing_values import impute
+from tracing import traced
+from scalers import MinMaxScaler, StandardScaler
 
+
+@traced('load')
 def read_csv_data(file_path: str) -> Tuple[List[str], List[List[str]]]:
     """
     Reads a CSV file and returns headers and data.
@@ -30,6 +37,7 @@ def read_csv_data(file_path: str) -> Tuple[List[str], List[List[str]]]:
     return headers, rows
 
 
+@traced('load')
 def read_excel_data(file_path: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
     """
     Reads an Excel file and returns a pandas DataFrame
@@ -44,6 +52,7 @@ def read_excel_data(file_path: str, sheet_name: Optional[str] = None) -> pd.Data
         raise ValueError(f"Error reading Excel file: {str(e)}")
 
 
+@traced('load')
 def read_data_file(file_path: str) -> pd.DataFrame:
     """
     Automatically detect file type and read data
@@ -71,6 +80,7 @@ def preview_data(df: pd.DataFrame, rows: int = 5) -> str:
     preview += df.head(rows).to_string()
     preview += "\n\nData Types:\n"
     preview += df.dtypes.to_string()
+    preview += "\n\n" + memory_report(df)
     return preview
 
 
@@ -81,14 +91,62 @@ def get_numeric_columns(df: pd.DataFrame) -> List[str]:
     return df.select_dtypes(include=[np.number]).columns.tolist()
 
 
+def aggregate_by_category(df: pd.DataFrame, category_column: str, value_column: Optional[str] = None,
+                          agg: str = 'count', top_k: int = 10,
+                          other_label: str = 'Other') -> Tuple[List[str], List[float]]:
+    """
+    Aggregate a categorical column in a single pass (factorize + bincount)
+
+    agg: 'count' (rows per category), or 'sum' / 'mean' of value_column.
+    The top_k largest categories are kept and the rest are folded into other_label.
+    Missing categories and missing values are ignored.
+    """
+    if category_column not in df.columns:
+        raise ValueError(f"Column '{category_column}' not found.")
+    if agg not in ('count', 'sum', 'mean'):
+        raise ValueError(f"Invalid aggregation: {agg}")
+    if agg != 'count' and (not value_column or value_column not in df.columns):
+        raise ValueError(f"A value column is required for '{agg}'")
+
+    codes, categories = pd.factorize(df[category_column])
+    n_categories = len(categories)
+    valid = codes >= 0
+
+    if agg == 'count':
+        counts = np.bincount(codes[valid], minlength=n_categories).astype(float)
+        sums = counts
+    else:
+        values = pd.to_numeric(df[value_column], errors='coerce').to_numpy(dtype=float)
+        valid &= ~np.isnan(values)
+        counts = np.bincount(codes[valid], minlength=n_categories).astype(float)
+        sums = np.bincount(codes[valid], weights=values[valid], minlength=n_categories)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        totals = sums / counts if agg == 'mean' else sums
+    present = np.flatnonzero(counts > 0)
+    order = present[np.argsort(-totals[present], kind='stable')]
+    top, rest = order[:top_k], order[top_k:]
+
+    labels = [str(categories[i]) for i in top]
+    results = [float(totals[i]) for i in top]
+    if rest.size:
+        labels.append(other_label)
+        if agg == 'mean':
+            results.append(float(sums[rest].sum() / counts[rest].sum()))
+        else:
+            results.append(float(sums[rest].sum()))
+    return labels, results
+
+
 def detect_missing_values(df: pd.DataFrame) -> Dict[str, int]:
     """
     Detect missing values in each column
     """
-    return df.isnull().sum().to_dict()
+    return {col: int(df[col].isna().sum()) for col in df.columns}
 
 
-def handle_missing_values(df: pd.DataFrame, method: str = 'drop', fill_value: Optional[float] = None) -> pd.DataFrame:
+def handle_missing_values(df: pd.DataFrame, method: str = 'drop', fill_value: Optional[float] = None,
+                          inplace: bool = False) -> pd.DataFrame:
     """
     Handle missing values in DataFrame
     
@@ -98,53 +156,28 @@ def handle_missing_values(df: pd.DataFrame, method: str = 'drop', fill_value: Op
     - 'median': Fill with column median
     - 'mode': Fill with column mode
     - 'constant': Fill with specified value
+
+    Only columns containing missing values are rewritten; with inplace=True
+    the input frame is modified instead of returning a copy-on-write view.
     """
-    df_copy = df.copy()
-    
-    if method == 'drop':
-        return df_copy.dropna()
-    elif method == 'mean':
-        return df_copy.fillna(df_copy.mean(numeric_only=True))
-    elif method == 'median':
-        return df_copy.fillna(df_copy.median(numeric_only=True))
-    elif method == 'mode':
-        return df_copy.fillna(df_copy.mode().iloc[0])
-    elif method == 'constant' and fill_value is not None:
-        return df_copy.fillna(fill_value)
-    else:
-        raise ValueError(f"Invalid method: {method}")
+    return impute(df, method, fill_value, inplace=inplace)
 
 
 def normalize_data(data: List[float]) -> List[float]:
     """
     Normalize data to 0-1 range using min-max scaling
     """
-    data_array = np.array(data)
-    min_val = np.min(data_array)
-    max_val = np.max(data_array)
-    
-    if max_val == min_val:
-        return [0.5] * len(data)
-    
-    normalized = (data_array - min_val) / (max_val - min_val)
-    return normalized.tolist()
+    return MinMaxScaler().fit(data).transform(data).tolist()
 
 
 def standardize_data(data: List[float]) -> List[float]:
     """
     Standardize data to have mean=0 and std=1 (z-score normalization)
     """
-    data_array = np.array(data)
-    mean = np.mean(data_array)
-    std = np.std(data_array)
-    
-    if std == 0:
-        return [0.0] * len(data)
-    
-    standardized = (data_array - mean) / std
-    return standardized.tolist()
+    return StandardScaler().fit(data).transform(data).tolist()
 
 
+@traced('parse')
 def parse_numeric_data(data_string: str) -> List[float]:
     """
     Parses a comma-separated string into a list of floats.
@@ -154,6 +187,27 @@ def parse_numeric_data(data_string: str) -> List[float]:
     return [float(x.strip()) for x in data_string.split(',') if x.strip()]
 
 
+@traced('parse')
+def parse_grouped_data(data_string: str) -> Tuple[List[Tuple[float, float]], List[float]]:
+    """
+    Parses grouped data written as 'lower-upper:frequency' entries,
+    e.g. '0-5:3, 5-10:7, 10-15:2'.
+    """
+    intervals = []
+    frequencies = []
+    for entry in data_string.split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        match = re.match(r'^(-?[\d.eE+]+)\s*-\s*(-?[\d.eE+]+)\s*:\s*([\d.eE+]+)$', entry)
+        if not match:
+            raise ValueError(f"Invalid grouped entry '{entry}'. Use 'lower-upper:frequency', e.g. 0-5:3")
+        lower, upper, freq = (float(g) for g in match.groups())
+        intervals.append((lower, upper))
+        frequencies.append(freq)
+    return intervals, frequencies
+
+
 def export_to_csv(data: pd.DataFrame, file_path: str) -> None:
     """
     Export DataFrame to CSV file
@@ -0,0 +1,163 @@
+"""
+Workspace Module
+Keeps several named datasets in memory under a budget, spilling the
+least recently used ones to disk and reloading them when referenced
+"""
+
+import itertools
+import os
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from memory_budget import column_memory, format_bytes
+from missing_values import MissingValueIndex
+from tracing import span
+
+
+class Workspace:
+    """
+    Named datasets with LRU eviction to pickle files in a spill directory.
+    Datasets are treated as immutable: a spilled file is written once and
+    reused on later evictions. The most recently used dataset always stays
+    in memory, even when it alone exceeds the budget.
+    Each dataset's MissingValueIndex is built once when it is added and
+    stays in memory (one bit per row per column with missing values).
+    """
+
+    def __init__(self, memory_limit: Optional[int] = 1024 * 1024 * 1024, spill_dir: Optional[str] = None):
+        self.memory_limit = memory_limit
+        self._owns_spill_dir = spill_dir is None
+        self.spill_dir = spill_dir
+        self._frames: 'OrderedDict[str, pd.DataFrame]' = OrderedDict()  # in memory, least recent first
+        self._meta: Dict[str, Dict[str, any]] = {}
+        self._lock = threading.RLock()
+        self._spill_ids = itertools.count()
+        self._versions = itertools.count(1)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._meta
+
+    def __len__(self) -> int:
+        return len(self._meta)
+
+    def names(self) -> List[str]:
+        return list(self._meta)
+
+    def name_for(self, path: str) -> str:
+        """
+        Dataset name for a file: its base name, with a number added when another
+        file already uses it. Loading the same file again gives its existing name.
+        """
+        path = os.path.abspath(path)
+        base = os.path.basename(path)
+        with self._lock:
+            for name, meta in self._meta.items():
+                if meta['source'] == path:
+                    return name
+            name, number = base, 2
+            stem, ext = os.path.splitext(base)
+            while name in self._meta:
+                name = f"{stem} ({number}){ext}"
+                number += 1
+            return name
+
+    def missing_index(self, name: str) -> MissingValueIndex:
+        """Null bitmaps of a dataset, built when it was added"""
+        return self._meta[name]['missing_index']
+
+    def version(self, name: str) -> int:
+        """Number identifying this copy of a dataset; it changes whenever the name is re-added"""
+        return self._meta[name]['version']
+
+    @property
+    def memory_in_use(self) -> int:
+        with self._lock:
+            return sum(self._meta[name]['bytes'] for name in self._frames)
+
+    def add(self, name: str, df: pd.DataFrame, source: Optional[str] = None) -> None:
+        """Add or replace a dataset and make it the most recently used"""
+        missing_index = MissingValueIndex(df)
+        with self._lock:
+            if name in self._meta:
+                self.remove(name)
+            self._meta[name] = {'rows': len(df), 'columns': df.shape[1],
+                                'bytes': int(column_memory(df).sum()) + df.index.memory_usage(deep=True),
+                                'version': next(self._versions), 'path': None,
+                                'source': os.path.abspath(source) if source else None,
+                                'missing_index': missing_index}
+            self._frames[name] = df
+            self._enforce_budget()
+
+    def get(self, name: str) -> pd.DataFrame:
+        """Return a dataset, reloading it from disk if it was spilled"""
+        with self._lock:
+            if name not in self._meta:
+                raise KeyError(f"No dataset named '{name}'")
+            if name in self._frames:
+                self._frames.move_to_end(name)
+                return self._frames[name]
+
+            with span('reload dataset', 'load'):
+                df = pd.read_pickle(self._meta[name]['path'])
+            self._frames[name] = df
+            self._enforce_budget()
+            return df
+
+    def remove(self, name: str) -> None:
+        with self._lock:
+            meta = self._meta.pop(name)
+            self._frames.pop(name, None)
+            if meta['path'] and os.path.exists(meta['path']):
+                os.remove(meta['path'])
+
+    def _spill_path(self, name: str) -> str:
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix='workspace-')
+        os.makedirs(self.spill_dir, exist_ok=True)
+        stem = re.sub(r'[^A-Za-z0-9_.-]+', '_', name)
+        return os.path.join(self.spill_dir, f"{stem}-{next(self._spill_ids)}.pkl")
+
+    def _enforce_budget(self) -> None:
+        if self.memory_limit is None:
+            return
+        while len(self._frames) > 1 and self.memory_in_use > self.memory_limit:
+            name, df = self._frames.popitem(last=False)
+            meta = self._meta[name]
+            if meta['path'] is None:
+                meta['path'] = self._spill_path(name)
+                with span('spill dataset', 'other'):
+                    df.to_pickle(meta['path'], protocol=5)
+
+    def info(self) -> List[Dict[str, any]]:
+        """Name, shape, memory size and residency of each dataset, most recently used first"""
+        with self._lock:
+            order = list(reversed(self._frames)) + [name for name in self._meta if name not in self._frames]
+            return [dict({key: value for key, value in self._meta[name].items() if key != 'missing_index'},
+                         name=name, in_memory=name in self._frames) for name in order]
+
+    def summary(self) -> str:
+        """Format the workspace contents as readable string"""
+        limit = format_bytes(self.memory_limit) if self.memory_limit is not None else "no limit"
+        output = f"Workspace ({len(self)} datasets, {format_bytes(self.memory_in_use)} of {limit} in memory):\n"
+        output += "="*60 + "\n"
+        for item in self.info():
+            where = "memory" if item['in_memory'] else "disk"
+            output += (f"  {item['name'][:28]:<30}{item['rows']:>10} x {item['columns']:<6}"
+                       f"{format_bytes(item['bytes']):>12}  {where}\n")
+        return output
+
+    def close(self) -> None:
+        """Delete the spill files"""
+        with self._lock:
+            if self._owns_spill_dir and self.spill_dir is not None:
+                shutil.rmtree(self.spill_dir, ignore_errors=True)
+            else:
+                for meta in self._meta.values():
+                    if meta['path'] and os.path.exists(meta['path']):
+                        os.remove(meta['path'])